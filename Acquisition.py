@@ -0,0 +1,515 @@
+# -*- coding: utf-8 -*-
+"""
+Acquisition.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+It holds the timing machinery of the acquisition loop, independent
+of the Qt front end.
+
+Acquisition.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Acquisition.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import time
+from collections import namedtuple
+from threading import Event, Lock, Thread
+from MicroTask import GHSPanel, GHSPanelError, KeyState, changedBits
+from PfeifferVacuum import MaxiGauge, MaxiGaugeNAK
+from Simulator import MaxiGaugeSimulator
+from Calibration import Calibration
+
+try:
+    monotonic = time.monotonic
+except AttributeError:
+    # Python 2 has no monotonic clock in the standard library
+    monotonic = time.time
+
+### Port name that opens a simulated instrument instead of a serial port
+SIMULATED_PORT = 'SIM'
+
+### Default poll period of every stream in seconds
+STREAM_PERIODS = {
+  'ADC': 1.,
+  'KEYS': 1.,
+  'PRESSURES': 1.,
+}
+
+class Sample(object):
+    __slots__ = ('stream', 'timestamp', 'values', 'error')
+
+    def __init__(self, stream, timestamp, values, error=None):
+        self.stream = stream
+        self.timestamp = timestamp
+        self.values = values
+        self.error = error
+
+    def __repr__(self):
+        return "Sample %s @ %.3f: %r" % (self.stream, self.timestamp, self.error or self.values)
+
+class SampleBus(object):
+    """Latest timestamped sample of every stream, shared between workers.
+
+    Subscribers are called from the publishing worker's thread.
+    """
+    def __init__(self):
+        self.lock = Lock()
+        self.samples = {}
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        with self.lock:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            if callback in self.subscribers: self.subscribers.remove(callback)
+
+    def publish(self, stream, values, timestamp=None, error=None):
+        sample = Sample(stream, timestamp if timestamp is not None else time.time(), values, error)
+        with self.lock:
+            self.samples[stream] = sample
+            subscribers = list(self.subscribers)
+        for callback in subscribers:
+            callback(sample)
+        return sample
+
+    def poll(self, stream, query):
+        # the timestamp is taken when the request goes out, query gets it
+        # for the samples it publishes itself
+        timestamp = time.time()
+        try:
+            values = query(timestamp)
+        except (DeviceOffline, NothingDue):
+            # an outage is published as a gap once the device is back
+            return None
+        except Exception as e:
+            return self.publish(stream, None, timestamp, e)
+        return self.publish(stream, values, timestamp)
+
+    def pollGroup(self, streams, query):
+        # query answers several streams in one request, it returns a dict
+        # of their values, an exception as the value of a failed one
+        timestamp = time.time()
+        try:
+            values = query(timestamp)
+        except (DeviceOffline, NothingDue):
+            return
+        except Exception as e:
+            values = dict((stream, e) for stream in streams)
+        for stream in streams:
+            if isinstance(values[stream], Exception):
+                self.publish(stream, None, timestamp, values[stream])
+            else:
+                self.publish(stream, values[stream], timestamp)
+
+    def latest(self, stream):
+        with self.lock:
+            return self.samples.get(stream)
+
+    def snapshot(self):
+        with self.lock:
+            return sorted(self.samples.values(), key=lambda sample: sample.timestamp)
+
+def pollStreams(bus, streams, polls, combined=None):
+    """Polls the due streams, a group of combined streams in one request."""
+    streams = list(streams)
+    for group, query in (combined or {}).items():
+        if all([stream in streams for stream in group]):
+            bus.pollGroup(group, query)
+            streams = [stream for stream in streams if stream not in group]
+    for stream in streams:
+        bus.poll(stream, polls[stream])
+
+### One transition of the KEYS? map, old is None for the first map
+KeyEvent = namedtuple('KeyEvent', 'index old new timestamp')
+
+class KeyTracker(object):
+    """Turns the KEYS samples of a bus into KEYEVENTS samples.
+
+    Only the entries that differ from the previous map are published,
+    nothing at all when the panel is steady. The state of the keys is
+    kept packed in a KeyState, so a steady panel costs one comparison.
+    """
+    def __init__(self, bus):
+        self.bus = bus
+        self.enabled = True
+        self.keymap = None
+        self.state = None
+        bus.subscribe(self.record)
+
+    def reset(self):
+        self.keymap = None
+        self.state = None
+
+    def diff(self, keymap, timestamp):
+        state = KeyState.fromKeys(keymap)
+        if self.state is None:
+            events = [KeyEvent(i, None, new, timestamp) for i, new in enumerate(keymap)]
+        elif state == self.state:
+            return []
+        else:
+            events = [KeyEvent(i, self.keymap[i], keymap[i], timestamp) for i in changedBits(state.changed(self.state))]
+        self.keymap = list(keymap)
+        self.state = state
+        return events
+
+    def record(self, sample):
+        if not self.enabled or sample.stream != 'KEYS' or sample.error is not None:
+            return
+        events = self.diff(sample.values, sample.timestamp)
+        if events:
+            self.bus.publish('KEYEVENTS', events, sample.timestamp)
+
+class FrameSource(object):
+    """The samples of a bus since the previous frame, for a viewer
+    refreshing at its own rate.
+
+    Samples are never changed once published, so a viewer can read them
+    from any thread. changed() returns the newest good sample of every
+    stream that is new since the previous call. For a merged stream the
+    NaN channels of that sample are filled from the samples in between,
+    so a sensor read between two frames isn't lost. For a collected
+    stream it returns the list of all of its good samples in between.
+    """
+    def __init__(self, bus, streams, merged=(), collected=()):
+        self.bus = bus
+        self.streams = list(streams) + list(collected)
+        self.merged = merged
+        self.collected = collected
+        self.lock = Lock()
+        self.pending = {}
+        bus.subscribe(self.record)
+
+    def reset(self):
+        with self.lock:
+            self.pending = {}
+
+    def record(self, sample):
+        # SampleBus subscriber
+        if sample.error is not None or sample.stream not in self.streams:
+            return
+        with self.lock:
+            previous = self.pending.get(sample.stream)
+            if sample.stream in self.collected:
+                self.pending.setdefault(sample.stream, []).append(sample)
+            elif sample.stream in self.merged and previous is not None:
+                values = [new if new == new else old for old, new in zip(previous.values, sample.values)]
+                self.pending[sample.stream] = Sample(sample.stream, sample.timestamp, values)
+            else:
+                self.pending[sample.stream] = sample
+
+    def changed(self):
+        with self.lock:
+            samples, self.pending = self.pending, {}
+        return samples
+
+class DeviceWorker(Thread):
+    """Polls the streams of one instrument on its own thread and schedule.
+
+    polls maps every stream name to the callable querying it, periods
+    maps it to its poll period in seconds. combined maps a tuple of
+    streams to a query reading all of them at once, see pollStreams.
+    """
+    def __init__(self, name, bus, polls, periods, stats=None, combined=None):
+        Thread.__init__(self, name=name)
+        self.daemon = True
+        self.bus = bus
+        self.polls = polls
+        self.combined = combined
+        self.scheduler = MultiRateScheduler(dict((stream, periods[stream]) for stream in polls), stats=stats)
+
+    def run(self):
+        while True:
+            streams = self.scheduler.due()
+            if streams is None:
+                break
+            pollStreams(self.bus, streams, self.polls, self.combined)
+
+    def setPeriod(self, stream, period):
+        if stream in self.polls:
+            self.scheduler.setPeriod(stream, period)
+
+    def stop(self):
+        self.scheduler.stop()
+
+def positivePeriod(period):
+    """Returns period as a float, ValueError unless it is above zero."""
+    period = float(period)
+    if not period > 0:
+        raise ValueError("poll period must be above zero, not %r" % period)
+    return period
+
+class MultiRateScheduler(object):
+    """Deadline scheduling of several streams, each with its own period.
+
+    due() blocks until the earliest deadline and returns the streams that
+    are due, fastest first, so the link time goes to what changes fastest.
+    """
+    def __init__(self, periods, clock=monotonic, stats=None):
+        self.clock = clock
+        self.stats = stats
+        self.stopping = Event()
+        self.periods = dict((stream, positivePeriod(period)) for stream, period in periods.items())
+        self.reset()
+
+    def reset(self):
+        self.stopping.clear()
+        self.cycles = 0
+        self.overruns = 0
+        now = self.clock()
+        # every stream is polled once right away
+        self.deadlines = dict((stream, now) for stream in self.periods)
+
+    def setPeriod(self, stream, period):
+        self.periods[stream] = positivePeriod(period)
+        self.deadlines[stream] = self.clock()
+
+    def due(self):
+        # returns None if the scheduler was stopped while waiting
+        self.stopping.wait(max(0., min(self.deadlines.values()) - self.clock()))
+        if self.stopping.isSet():
+            return None
+        self.cycles += 1
+        now = self.clock()
+        streams = [stream for stream, deadline in self.deadlines.items() if deadline <= now]
+        streams.sort(key=lambda stream: self.periods[stream])
+        for stream in streams:
+            period = self.periods[stream]
+            missed = int((now - self.deadlines[stream]) / period)
+            self.overruns += missed
+            if self.stats is not None:
+                self.stats.cycle(stream, now - self.deadlines[stream], missed)
+            self.deadlines[stream] += (missed + 1) * period
+        return streams
+
+    def stop(self):
+        self.stopping.set()
+
+class DeviceOffline(Exception):
+    pass
+
+class NothingDue(Exception):
+    pass
+
+class DeviceLink(object):
+    """Supervised connection to one instrument.
+
+    Any failure other than an error reply of the device closes the port;
+    it is reopened on the next call once the backoff delay, doubled after
+    every failed attempt up to maxDelay, has passed. Meanwhile calls fail
+    at once with DeviceOffline. When the link recovers, the outage is
+    published on the bus as a GAPS sample [name, down since, up again].
+    """
+    def __init__(self, name, factory, bus, stats=None, minDelay=0.5, maxDelay=60.):
+        self.name = name
+        self.factory = factory
+        self.bus = bus
+        self.stats = stats
+        self.minDelay = minDelay
+        self.maxDelay = maxDelay
+        self.device = None
+        self.port = None
+        self.failures = 0
+        self.retryAt = 0.
+        self.downSince = None
+
+    def open(self, port):
+        self.port = port
+        self.failures = 0
+        self.downSince = None
+        self.connect()
+
+    def call(self, query):
+        if self.device is None:
+            if self.port is None or monotonic() < self.retryAt:
+                raise DeviceOffline('%s is offline' % self.name)
+            if self.stats is not None:
+                self.stats.retry(self.name)
+            self.connect()
+        try:
+            result = query(self.device)
+        except (GHSPanelError, MaxiGaugeNAK):
+            # the link is fine, the device answered with an error
+            raise
+        except Exception:
+            self.failed()
+            raise
+        if self.downSince is not None:
+            self.bus.publish('GAPS', [self.name, self.downSince, time.time()])
+            self.downSince = None
+        self.failures = 0
+        return result
+
+    def connect(self):
+        try:
+            self.device = self.factory(str(self.port))
+        except Exception:
+            self.failed()
+            raise
+        self.device.stats = self.stats
+
+    def failed(self):
+        self.close()
+        if self.downSince is None:
+            self.downSince = time.time()
+        self.failures += 1
+        self.retryAt = monotonic() + min(self.maxDelay, self.minDelay * 2 ** (self.failures - 1))
+
+    def close(self):
+        if self.device is not None and self.device.connection:
+            if getattr(self.device, 'parser', None) is not None:
+                # a MaxiGauge in continuous mode is sent ETX first, as far as
+                # the port still works, so that it isn't left streaming
+                try:
+                    self.device.stop_continuous_output()
+                except Exception:
+                    pass
+            self.device.connection.close()
+        self.device = None
+
+class GaugeSelection(object):
+    """The MaxiGauge sensors that are read, each with its own period.
+
+    periods maps a sensor number to seconds between reads, 0 meaning
+    every pressure poll. Sensors answering 'No sensor' are skipped and
+    only probed again every probe seconds. A sensor that isn't read in a
+    poll is NaN in its sample, so that it isn't counted twice; the latest
+    pressure and status of every sensor are kept in pressures, statuses.
+    """
+    def __init__(self, periods=None, probe=600., clock=monotonic):
+        self.clock = clock
+        self.probe = probe
+        self.setPeriods(periods if periods is not None else dict((sensor, 0.) for sensor in range(1, 7)))
+
+    def setPeriods(self, periods):
+        self.periods = dict((int(sensor), float(period)) for sensor, period in periods.items())
+        self.next = {}
+        self.absent = {}
+        self.pressures = [float('nan')] * 6
+        self.statuses = [-1] * 6
+
+    def due(self):
+        now = self.clock()
+        return [sensor for sensor in sorted(self.periods)
+                if self.next.get(sensor, 0.) <= now and self.absent.get(sensor, 0.) <= now]
+
+    def update(self, batch):
+        # batch is a PressureBatch, returns the pressures read in it
+        now = self.clock()
+        pressures = [float('nan')] * 6
+        for sensor in batch.ids:
+            if sensor not in self.periods:
+                continue
+            self.next[sensor] = now + self.periods[sensor]
+            status = self.statuses[sensor - 1] = batch.statuses[sensor - 1]
+            if status == 5: # No sensor
+                self.absent[sensor] = now + self.probe
+                self.pressures[sensor - 1] = float('nan')
+            else:
+                self.pressures[sensor - 1] = pressures[sensor - 1] = batch.pressures[sensor - 1]
+        return pressures
+
+def parseGauges(text):
+    # '5,6:10' reads sensor 5 on every pressure poll and sensor 6 every 10 s
+    periods = {}
+    for item in text.split(','):
+        sensor, _, period = item.partition(':')
+        periods[int(sensor)] = float(period) if period else 0.
+    return periods
+
+class Station(object):
+    """The GHS panel and the MaxiGauge of one cryostat, without Qt.
+
+    ADC samples are calibrated with calibration; the raw counts they were
+    computed from are published as ADCRAW, with the timestamp the bus
+    gives the request. Likewise every PRESSURES sample comes after a
+    PRESSURESTATUS sample with the status of each sensor.
+    """
+    def __init__(self, bus, stats=None, calibration=None):
+        self.bus = bus
+        self.stats = stats
+        self.calibration = calibration if calibration is not None else Calibration()
+        self.panel = DeviceLink('GHSPanel', GHSPanel, bus, stats)
+        self.mg = DeviceLink('MaxiGauge', self.openGauge, bus, stats)
+        self.gauges = GaugeSelection()
+        self.gaugeStream = None
+        self.queries = {'ADC': self.pollADC, 'KEYS': self.pollKeys, 'PRESSURES': self.pollPressures}
+        # streams read together when they are due together
+        self.combined = {('ADC', 'KEYS'): self.pollPanel}
+
+    def openPanel(self, port):
+        self.panel.open(port)
+
+    def openMaxiGauge(self, port):
+        self.mg.open(port)
+
+    def setGaugeStream(self, interval):
+        # read the MaxiGauge in its continuous output mode, None to poll it
+        self.gaugeStream = interval
+
+    def openGauge(self, port):
+        if port == SIMULATED_PORT:
+            mg = MaxiGauge(port, connection=MaxiGaugeSimulator())
+        else:
+            mg = MaxiGauge(port)
+        if self.gaugeStream is not None:
+            mg.start_continuous_output(self.gaugeStream)
+        return mg
+
+    def pollADC(self, timestamp):
+        err, raw = self.panel.call(lambda panel: panel.getRawADC())
+        if err != 0: raise GHSPanelError('[ADC] Error code returned: %d' % err)
+        return self.calibrate(raw, timestamp)
+
+    def calibrate(self, raw, timestamp):
+        self.bus.publish('ADCRAW', raw, timestamp)
+        return self.calibration.apply(raw).tolist()
+
+    def pollKeys(self, timestamp):
+        err, values = self.panel.call(lambda panel: panel.getKeys())
+        if err != 0: raise GHSPanelError('[KEYS] Error code returned: %d' % err)
+        return values
+
+    def pollPanel(self, timestamp):
+        (errADC, raw), (errKeys, keys) = self.panel.call(lambda panel: panel.getState())
+        return {'ADC': self.calibrate(raw, timestamp) if errADC == 0 else GHSPanelError('[ADC] Error code returned: %d' % errADC),
+                'KEYS': keys if errKeys == 0 else GHSPanelError('[KEYS] Error code returned: %d' % errKeys)}
+
+    def pollPressures(self, timestamp):
+        if self.gaugeStream is not None:
+            # every record of the stream is published with its own time
+            for batch in self.mg.call(lambda mg: mg.read_continuous()):
+                pressures = self.gauges.update(batch)
+                self.bus.publish('PRESSURESTATUS', list(self.gauges.statuses), batch.timestamp)
+                self.bus.publish('PRESSURES', pressures, batch.timestamp)
+            raise NothingDue()
+        sensors = self.gauges.due()
+        if not sensors:
+            raise NothingDue()
+        pressures = self.gauges.update(self.mg.call(lambda mg: mg.pressures_batch(sensors)))
+        self.bus.publish('PRESSURESTATUS', list(self.gauges.statuses), timestamp)
+        return pressures
+
+    def streamQueries(self, *streams):
+        return dict((stream, self.queries[stream]) for stream in streams)
+
+    def workers(self, periods):
+        # one worker per serial port, the cycle time is set by the slowest device
+        return [DeviceWorker('GHSPanel', self.bus, self.streamQueries('ADC', 'KEYS'), periods, self.stats, self.combined),
+                DeviceWorker('MaxiGauge', self.bus, self.streamQueries('PRESSURES'), periods, self.stats)]
+
+    def close(self):
+        self.panel.close()
+        self.mg.close()
+        self.panel.port = None
+        self.mg.port = None
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+AsyncEngine.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+It drives any number of GHS panels and MaxiGauges from a single thread.
+Every serial port is opened non-blocking and each device is served by a
+generator based task; a task yields ReadLine or Sleep requests to the
+EventLoop and is resumed when the line arrived, the timeout expired or
+the task was cancelled. Qt is not needed.
+
+The tree runs on Python 2, which has no asyncio, hence the small
+generator trampoline below instead of async/await.
+
+AsyncEngine.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+AsyncEngine.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+
+- This module depends on PySerial, a cross platform Python module
+- to leverage the communication with the serial port.
+- http://pyserial.sourceforge.net/pyserial.html#installation
+
+- This module depends on NumPy, through Calibration
+"""
+
+import serial
+import time
+import types
+from threading import Event
+from Acquisition import monotonic, SampleBus, GaugeSelection, NothingDue
+from Calibration import Calibration
+from MicroTask import parseResponse, ResponseParser, GHSPanelError, LINE_TERMINATION_GHS, ADC_FIELDS, KEYS_FIELDS
+from PfeifferVacuum import parse_status, batch_request, nak_error, PressureBatch, C, LINE_TERMINATION
+
+class RequestTimeout(Exception):
+    pass
+
+class TaskCancelled(Exception):
+    pass
+
+class SerialTransport(object):
+    """Non-blocking serial port with an input buffer."""
+    def __init__(self, serialPort, baud=9600, connection=None):
+        if connection is None:
+            connection = serial.Serial(port=serialPort, baudrate=baud, bytesize=8, parity='N', stopbits=1, timeout=0)
+        else:
+            connection.timeout = 0
+        self.connection = connection
+        self.buffer = ''
+
+    def poll(self):
+        waiting = self.connection.inWaiting()
+        if waiting:
+            self.buffer += self.connection.read(waiting)
+
+    def popLine(self, terminator):
+        end = self.buffer.find(terminator)
+        if end < 0:
+            return None
+        line = self.buffer[:end]
+        self.buffer = self.buffer[end + len(terminator):]
+        return line
+
+    def write(self, data):
+        self.connection.write(data)
+
+    def discard(self):
+        self.connection.flushInput()
+        self.buffer = ''
+
+    def close(self):
+        self.connection.close()
+
+class ReadLine(object):
+    """Yielded by a task to wait for a line, at most timeout seconds."""
+    def __init__(self, transport, terminator, timeout):
+        self.transport = transport
+        self.terminator = terminator
+        self.timeout = timeout
+
+class Sleep(object):
+    """Yielded by a task to wait until the monotonic time deadline."""
+    def __init__(self, deadline):
+        self.deadline = deadline
+
+class Task(object):
+    def __init__(self, generator):
+        self.stack = [generator]
+        self.waiting = None
+        self.deadline = 0.
+        self.cancelled = False
+        self.done = False
+        self.result = None
+        self.error = None
+
+    def cancel(self):
+        self.cancelled = True
+
+    def resume(self, value=None, error=None):
+        while self.stack:
+            generator = self.stack[-1]
+            try:
+                if error is not None:
+                    request = generator.throw(error)
+                else:
+                    request = generator.send(value)
+            except StopIteration as e:
+                # a sub-task returns its result with raise StopIteration(result)
+                self.stack.pop()
+                value, error = e.args[0] if e.args else None, None
+                continue
+            except Exception as e:
+                self.stack.pop()
+                value, error = None, e
+                continue
+            value, error = None, None
+            if isinstance(request, types.GeneratorType):
+                self.stack.append(request)
+                continue
+            self.waiting = request
+            if isinstance(request, ReadLine):
+                self.deadline = monotonic() + request.timeout
+            else:
+                self.deadline = request.deadline
+            return
+        self.done = True
+        self.waiting = None
+        self.result, self.error = value, error
+
+    def step(self, now):
+        if self.cancelled:
+            self.resume(error=TaskCancelled())
+        elif self.waiting is None:
+            self.resume()
+        elif isinstance(self.waiting, ReadLine):
+            line = self.waiting.transport.popLine(self.waiting.terminator)
+            if line is not None:
+                self.resume(line)
+            elif now >= self.deadline:
+                self.resume(error=RequestTimeout('No reply within %.2f s' % self.waiting.timeout))
+        elif now >= self.deadline:
+            self.resume()
+
+class EventLoop(object):
+    """Runs tasks until they are all done or stop() is called.
+
+    The loop sleeps until the earliest deadline of its tasks; only while
+    a task waits for a line are the transports polled every tick seconds.
+    stop(), cancelAll() and wake() end the sleep at once.
+    """
+    def __init__(self, tick=0.005):
+        self.tick = tick
+        self.tasks = []
+        self.running = False
+        self.wakeup = Event()
+
+    def spawn(self, generator):
+        task = Task(generator)
+        self.tasks.append(task)
+        return task
+
+    def run(self):
+        self.running = True
+        while self.running and self.tasks:
+            self.runOnce()
+        self.running = False
+
+    def runOnce(self):
+        transports = set(task.waiting.transport for task in self.tasks if isinstance(task.waiting, ReadLine))
+        for transport in transports:
+            transport.poll()
+        now = monotonic()
+        for task in self.tasks:
+            task.step(now)
+        self.tasks = [task for task in self.tasks if not task.done]
+        if self.tasks:
+            delay = max(0., min(task.deadline for task in self.tasks) - monotonic())
+            if any(isinstance(task.waiting, ReadLine) for task in self.tasks):
+                delay = min(self.tick, delay)
+            self.wakeup.wait(delay)
+            self.wakeup.clear()
+
+    def wake(self):
+        # from another thread, e.g. after cancelling a task
+        self.wakeup.set()
+
+    def stop(self):
+        self.running = False
+        self.wake()
+
+    def cancelAll(self):
+        for task in self.tasks:
+            task.cancel()
+        self.wake()
+
+### ------ device protocols as tasks ------
+
+### all tasks run in the loop thread, so they can share the parsers
+PANEL_PARSERS = {'ADC?': ResponseParser(ADC_FIELDS), 'KEYS?': ResponseParser(KEYS_FIELDS)}
+
+def panelQuery(transport, command, timeout=1.):
+    transport.discard()
+    transport.write(command + LINE_TERMINATION_GHS)
+    line = yield ReadLine(transport, LINE_TERMINATION_GHS, timeout)
+    parser = PANEL_PARSERS.get(command)
+    if parser is None:
+        raise StopIteration(parseResponse(line))
+    raise StopIteration(parser.decode(line))
+
+def panelRawADC(transport, timeout=1.):
+    err, raw = yield panelQuery(transport, 'ADC?', timeout)
+    if err != 0: raise GHSPanelError('[ADC] Error code returned: %d' % err)
+    raise StopIteration(raw)
+
+def panelKeys(transport, timeout=1.):
+    err, values = yield panelQuery(transport, 'KEYS?', timeout)
+    if err != 0: raise GHSPanelError('[KEYS] Error code returned: %d' % err)
+    raise StopIteration(values)
+
+def gaugeBatch(transport, sensors=(1,2,3,4,5,6), depth=6, timeout=1.):
+    # pipelined like MaxiGauge.pressures_batch, up to depth PRx in flight
+    sensors = list(sensors)
+    depth = max(1, depth)
+    transport.discard()
+    batch = PressureBatch()
+    sent = 0
+    for i, sensor in enumerate(sensors):
+        if sent < len(sensors) and sent < i + depth:
+            transport.write(batch_request(sensors[sent:i + depth]))
+            sent = min(len(sensors), i + depth)
+        line = yield ReadLine(transport, LINE_TERMINATION, timeout)
+        if len(line) > 0 and line[-1] == C['NAK']:
+            raise nak_error((yield ReadLine(transport, LINE_TERMINATION, timeout)))
+        if len(line) == 0 or line[-1] == C['ACQ']:
+            line = yield ReadLine(transport, LINE_TERMINATION, timeout)
+        # else the controller forgot the acknowledge and this is the data already
+        batch.set(sensor, *parse_status(line))
+    raise StopIteration(batch)
+
+def devicePoller(bus, queries, periods):
+    """Serves the streams of one device, each on its own absolute deadline.
+
+    queries maps a stream name to a function returning a fresh request
+    task for it, called with the timestamp of the request. A failed or
+    timed out request is published as an error sample and the poller
+    carries on; a request raising NothingDue publishes nothing.
+    """
+    deadlines = dict((stream, monotonic()) for stream in queries)
+    while True:
+        now = monotonic()
+        due = [stream for stream in queries if deadlines[stream] <= now]
+        due.sort(key=lambda stream: periods[stream])
+        for stream in due:
+            timestamp = time.time()
+            try:
+                values = yield queries[stream](timestamp)
+            except TaskCancelled:
+                raise
+            except NothingDue:
+                pass
+            except Exception as e:
+                bus.publish(stream, None, timestamp, e)
+            else:
+                bus.publish(stream, values, timestamp)
+            period = periods[stream]
+            deadlines[stream] += (int((monotonic() - deadlines[stream]) / period) + 1) * period
+        yield Sleep(min(deadlines.values()))
+
+class AsyncAcquisition(object):
+    """Polls GHS panels and MaxiGauges from one EventLoop into a SampleBus.
+
+    Stream names get the optional prefix, so that several cryostats can
+    publish to the same bus. ADC samples are calibrated as in Station,
+    with their raw counts published as ADCRAW, and pressures follow their
+    PRESSURESTATUS sample. The sensors of every MaxiGauge are read as
+    its GaugeSelection says, all of them every poll by default.
+    """
+    def __init__(self, bus=None, loop=None, timeout=1., calibration=None):
+        self.bus = bus if bus is not None else SampleBus()
+        self.loop = loop if loop is not None else EventLoop()
+        self.timeout = timeout
+        self.calibration = calibration if calibration is not None else Calibration()
+        self.transports = []
+        self.tasks = []
+
+    def addPanel(self, transport, periods, prefix=''):
+        queries = {
+          prefix + 'ADC': lambda timestamp: self.panelADC(transport, prefix, timestamp),
+          prefix + 'KEYS': lambda timestamp: panelKeys(transport, self.timeout),
+        }
+        return self.addDevice(transport, queries, self.prefixed(periods, prefix))
+
+    def addMaxiGauge(self, transport, periods, prefix='', gauges=None):
+        gauges = gauges if gauges is not None else GaugeSelection()
+        queries = {
+          prefix + 'PRESSURES': lambda timestamp: self.gaugePressures(transport, gauges, prefix, timestamp),
+        }
+        return self.addDevice(transport, queries, self.prefixed(periods, prefix))
+
+    def panelADC(self, transport, prefix, timestamp):
+        raw = yield panelRawADC(transport, self.timeout)
+        self.bus.publish(prefix + 'ADCRAW', raw, timestamp)
+        raise StopIteration(self.calibration.apply(raw).tolist())
+
+    def gaugePressures(self, transport, gauges, prefix, timestamp):
+        sensors = gauges.due()
+        if not sensors:
+            raise NothingDue()
+        batch = yield gaugeBatch(transport, sensors, timeout=self.timeout)
+        pressures = gauges.update(batch)
+        self.bus.publish(prefix + 'PRESSURESTATUS', list(gauges.statuses), timestamp)
+        raise StopIteration(pressures)
+
+    def addDevice(self, transport, queries, periods):
+        self.transports.append(transport)
+        task = self.loop.spawn(devicePoller(self.bus, queries, periods))
+        self.tasks.append(task)
+        return task
+
+    def prefixed(self, periods, prefix):
+        return dict((prefix + stream, period) for stream, period in periods.items())
+
+    def run(self):
+        self.loop.run()
+
+    def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        self.loop.wake()
+
+    def close(self):
+        for transport in self.transports:
+            transport.close()
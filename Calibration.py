@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Calibration.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Calibration curves of the 8 panel ADC channels, applied with NumPy to a
+single sample or to a whole archive of raw counts at once. A channel is
+calibrated with one of
+
+  {"gain": g, "offset": o}           value = gain * raw + offset
+  {"poly": [c0, c1, c2, ...]}        value = c0 + c1 * raw + c2 * raw**2 ...
+  {"lut": [[raw, ...], [value, ...]]} linear interpolation in a table
+
+A calibration file is a JSON object mapping the channel names P1 ... P8
+to their curves; a channel left out keeps its factor from ADC_OFFSET.
+
+Calibration.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Calibration.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+
+- This module depends on NumPy
+"""
+
+import json
+import numpy
+from MicroTask import ADC_OFFSET, ADC_FIELDS
+
+### Names of the ADC channels, as on the panel display
+ADC_CHANNELS = ['P%d' % (i + 1) for i in range(ADC_FIELDS)]
+
+class CalibrationError(Exception):
+    pass
+
+class Calibration(object):
+    """Turns raw ADC counts into calibrated values.
+
+    Linear and polynomial curves of all channels are evaluated together
+    as one polynomial with a row of coefficients per channel; table
+    channels are interpolated column by column afterwards.
+    """
+    def __init__(self, curves=None):
+        if curves is None:
+            curves = {}
+        unknown = set(curves) - set(ADC_CHANNELS)
+        if unknown:
+            raise CalibrationError('Unknown ADC channels: %s' % ', '.join(sorted(unknown)))
+        self.curves = [curves.get(name, {'gain': ADC_OFFSET[i]}) for i, name in enumerate(ADC_CHANNELS)]
+        polys = [self.polynomial(name, curve) for name, curve in zip(ADC_CHANNELS, self.curves)]
+        self.coefficients = numpy.zeros((ADC_FIELDS, max(map(len, polys))))
+        self.tables = []
+        for i, (poly, curve) in enumerate(zip(polys, self.curves)):
+            self.coefficients[i, :len(poly)] = poly
+            if 'lut' in curve:
+                raw, value = numpy.asarray(curve['lut'][0], 'f8'), numpy.asarray(curve['lut'][1], 'f8')
+                if len(raw) != len(value) or len(raw) < 2 or numpy.any(numpy.diff(raw) <= 0):
+                    raise CalibrationError('%s: the table needs at least two points with increasing raw counts' % ADC_CHANNELS[i])
+                self.tables.append((i, raw, value))
+
+    def polynomial(self, name, curve):
+        if 'lut' in curve:
+            return [0.]
+        if 'poly' in curve:
+            if not curve['poly']:
+                raise CalibrationError('%s: empty polynomial' % name)
+            return [float(c) for c in curve['poly']]
+        if 'gain' in curve or 'offset' in curve:
+            return [float(curve.get('offset', 0.)), float(curve.get('gain', 1.))]
+        raise CalibrationError('%s: a curve needs gain/offset, poly or lut' % name)
+
+    def apply(self, raw):
+        # raw has the channels on its last axis: one sample or rows of them
+        raw = numpy.asarray(raw, 'f8')
+        value = numpy.zeros(raw.shape)
+        for k in range(self.coefficients.shape[1] - 1, -1, -1):
+            value *= raw
+            value += self.coefficients[:, k]
+        for i, xp, fp in self.tables:
+            value[..., i] = numpy.interp(raw[..., i], xp, fp)
+        return value
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename) as f:
+            try:
+                curves = json.load(f)
+            except ValueError as e:
+                raise CalibrationError('%s: %s' % (filename, e))
+        return cls(dict((str(name), curve) for name, curve in curves.items()))
+
+    def save(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(dict(zip(ADC_CHANNELS, self.curves)), f, indent=2, sort_keys=True)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Decimation.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Min/max pyramid of a multi-channel stream for the trend plots. Level k
+splits the time axis into buckets of base * factor**k seconds and keeps
+the minimum and the maximum of every channel in each of the latest
+capacity buckets. Every sample updates its bucket on all levels, so the
+pyramid is always current; a plot asks for the coarsest level that still
+gives about one bucket per pixel and never touches the raw samples.
+
+With the defaults (1 s, x4, 10 levels, 4096 buckets) the finest level
+covers the last hour at 1 s and the coarsest about 50 years; a two week
+cooldown is shown from the 1024 s level with about 1200 buckets.
+
+Decimation.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Decimation.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+
+- This module depends on NumPy
+"""
+
+import math
+import numpy
+from threading import Lock
+
+class PyramidLevel(object):
+    __slots__ = ('width', 'capacity', 'ids', 'low', 'high', 'newest')
+
+    def __init__(self, width, channels, capacity):
+        self.width = width
+        self.capacity = capacity
+        self.ids = numpy.empty(capacity, 'i8')
+        self.ids.fill(-1)
+        self.low = numpy.empty((capacity, channels))
+        self.high = numpy.empty((capacity, channels))
+        self.newest = -1
+
+    def add(self, timestamp, values):
+        bucket = int(timestamp // self.width)
+        if bucket < self.newest - self.capacity + 1:
+            return # older than anything kept
+        i = bucket % self.capacity
+        if self.ids[i] != bucket:
+            self.ids[i] = bucket
+            self.low[i] = values
+            self.high[i] = values
+        else:
+            # fmin/fmax skip NaN, a bucket is NaN only if all its values are
+            numpy.fmin(self.low[i], values, self.low[i])
+            numpy.fmax(self.high[i], values, self.high[i])
+        self.newest = max(self.newest, bucket)
+
+    def oldest(self):
+        # start time of the oldest bucket kept
+        return max(0, self.newest - self.capacity + 1) * self.width
+
+    def select(self, start, stop):
+        first, last = int(start // self.width), int(stop // self.width)
+        kept = numpy.nonzero((self.ids >= first) & (self.ids <= last))[0]
+        kept = kept[numpy.argsort(self.ids[kept])]
+        return (self.ids[kept] + 0.5) * self.width, self.low[kept], self.high[kept]
+
+class MinMaxPyramid(object):
+    def __init__(self, channels, base=1., factor=4, levels=10, capacity=4096):
+        self.channels = channels
+        self.lock = Lock()
+        self.levels = [PyramidLevel(base * factor ** k, channels, capacity) for k in range(levels)]
+
+    def add(self, timestamp, values):
+        values = numpy.asarray(values, 'f8')
+        with self.lock:
+            for level in self.levels:
+                level.add(timestamp, values)
+
+    def newest(self):
+        # end time of the newest bucket, None while empty
+        level = self.levels[0]
+        if level.newest < 0:
+            return None
+        return (level.newest + 1) * level.width
+
+    def oldest(self):
+        return self.levels[-1].oldest()
+
+    def level(self, start, stop, buckets):
+        # the finest level with at most the given number of buckets in [start, stop]
+        # that still reaches back to start, else the coarsest one
+        for level in self.levels:
+            if (stop - start) / level.width <= buckets and level.oldest() <= start:
+                return level
+        return self.levels[-1]
+
+    def select(self, start, stop, buckets):
+        # bucket centres, minima and maxima for a view of the given width in pixels
+        with self.lock:
+            return self.level(start, stop, buckets).select(start, stop)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Dialogs.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+The settings dialogs of the monitor window. They are imported the first
+time one of them is opened, so their forms aren't loaded at startup.
+
+Dialogs.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Dialogs.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from PyQt4.QtGui import QDialog
+import comdlg
+import logdlg
+
+class ComDlg(QDialog, comdlg.Ui_ComDlg):
+    
+    def __init__(self,parent = None):
+        super(ComDlg, self).__init__(parent)
+        self.setupUi(self)
+        #self.updateUi()
+
+class LogDlg(QDialog, logdlg.Ui_LogDlg):
+    
+    def __init__(self,parent = None):
+        super(LogDlg, self).__init__(parent)
+        self.setupUi(self)
@@ -32,117 +32,184 @@ along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
 - https://gist.github.com/pklaus/1378695
 """
 
+import time
+# taken before the other imports, for the startup times in the log
+LAUNCHED = time.time()
+
+
 import sys
 import platform
+import socket
 from PfeifferVacuum import MaxiGauge, MaxiGaugeError
-import time
 from PyQt4.QtCore import *
 from PyQt4.QtGui import *
-from datetime import datetime
 import GHSPanelUI
-import comdlg
-import logdlg
 from MicroTask import *
+from Acquisition import MultiRateScheduler, SampleBus, FrameSource, pollStreams, Station, KeyTracker, parseGauges, STREAM_PERIODS
+from History import History
+from Calibration import Calibration
+from LinkStats import LinkStats
+from LogWriter import LogWriter
+from Decimation import MinMaxPyramid
 
 __version__="1.0.0"
 
+### Frames per second the window is refreshed at, at most
+FRAME_RATE = 10.
+
+VALVE, PUMP = ('closed', 'open'), ('stopped', 'started')
+
+### The radioButton_<name> widget of every key of KEY_BITS, with its label
+### in the log and the words for its two states
+KEY_DISPLAY = [
+  ('A0', 'A0', VALVE), ('A1', 'A1', VALVE), ('A2', 'A2', VALVE), ('A3', 'A3', VALVE),
+  ('A4', 'A4', VALVE), ('A5', 'A5', VALVE), ('A6', 'A6', VALVE), ('A7', 'A7', VALVE),
+  ('A8', 'A8', VALVE), ('A9', 'A9', VALVE), ('A10', 'A10', VALVE),
+  ('Start', 'START', VALVE),
+  ('He3', 'Condensing He3', PUMP),
+  ('He4', 'Condensing He4', PUMP),
+  ('Norm', 'Normal Circulation', PUMP),
+  ('Rec', 'Recovery', PUMP),
+  ('Aux1', 'AUX-1', VALVE),
+  ('Reset', 'Reset', PUMP),
+  ('Auto', 'Auto', PUMP),
+] + [(str(i), str(i), VALVE) for i in range(18)] + [('S%d' % i, 'S%d' % i, PUMP) for i in range(1, 6)]
+
+### The log view keeps the latest LOG_VIEW_LINES messages, appended at
+### most every LOG_VIEW_INTERVAL ms; all of them go to EVENT_LOG
+LOG_VIEW_LINES = 1000
+LOG_VIEW_INTERVAL = 40
+EVENT_LOG = 'ghs-events.txt'
+
+### Longest wait on stop for the thread to finish its current serial
+### transaction (1 s timeout on both links), ms
+STOP_TIMEOUT = 2000
+
+STREAM_ERRORS = {
+  'ADC': 'Couldn\'t get ADC values.',
+  'KEYS': 'Couldn\'t get KEYS values.',
+  'PRESSURES': 'Couldn\'t get pressure values.',
+}
+
 class NumberThread(QThread):
     def __init__(self, parent = None):
         QThread.__init__(self,parent)
         self.problem = False    
         self.update_time = 1
+        self.stream_periods = dict(STREAM_PERIODS)
         self.running = True
+        self.concurrent = False
+        self.daemon_address = None
+        self.client = None
+        self.workers = []
+        self.failing = set()
+        self.stats = LinkStats()
+        self.scheduler = MultiRateScheduler(self.stream_periods, stats=self.stats)
+        self.bus = SampleBus()
+        self.station = Station(self.bus, self.stats)
+        self.history = History()
+        self.bus.subscribe(self.history.record)
+        self.trends = {'ADC': MinMaxPyramid(8), 'PRESSURES': MinMaxPyramid(6)}
+        self.bus.subscribe(self.recordTrend)
+        self.keyTracker = KeyTracker(self.bus)
+        self.bus.subscribe(self.onSample)
         
     def run(self):
         self.problem = False    
+        self.running = True
+        self.stats.reset()
+        self.keyTracker.reset()
+        # an attached daemon publishes the key events itself
+        self.keyTracker.enabled = self.daemon_address is None
+        if self.daemon_address is not None:
+            self.runAttached()
+            return
         self.initialization()
         self.emit(SIGNAL('panelMessage(QString)'),'Initialization looks ok')
-        time.sleep(0.2)
-        while True:
-            startTime = time.time()
-            self.getADCValues()
-            time.sleep(0.2)
-            self.getKeysValues()
-            time.sleep(0.2)
-            self.getPressuresValues()
-            while (self.update_time - (time.time()-startTime) > .2):
-                time.sleep(.2)
-            time.sleep(max([0., self.update_time - (time.time()-startTime)]))            
-            
-    def getADCValues(self):
-        try:
-            err, values = self.panel.getADC()
-            if err == 0:
-                self.emit(SIGNAL('updateADC'), values )
-            else:
-                self.emit(SIGNAL('panelMessage(QString)'),'[ADC] Error code returned: ' + err)
-                time.sleep(0.2)
-                self.emit(SIGNAL('initProblem(bool)'),self.problem)                        
-        except:
-            self.emit(SIGNAL('panelMessage(QString)'),'Couldn\'t get ADC values.')        
-            time.sleep(0.2)
-            self.emit(SIGNAL('initProblem(bool)'),self.problem)     
-
-    def getKeysValues(self):
-        try:
-            err, values = self.panel.getKeys()
-            if err == 0:
-                self.emit(SIGNAL('updateKeys'), values )
-            else:
-                self.emit(SIGNAL('panelMessage(QString)'),'[KEYS] Error code returned: ' + err)  
-                time.sleep(0.2)
-                self.emit(SIGNAL('initProblem(bool)'),self.problem)                        
-        except:
-            self.emit(SIGNAL('panelMessage(QString)'),'Couldn\'t get KEYS values.')          
-            time.sleep(0.2)
-            self.emit(SIGNAL('initProblem(bool)'),self.problem)                        
-
-    def getPressuresValues(self):
-        values = []
+        if self.concurrent:
+            self.runConcurrent()
+            return
+        self.scheduler.reset()
+        while self.running:
+            streams = self.scheduler.due()
+            if streams is None:
+                break
+            pollStreams(self.bus, streams, self.station.queries, self.station.combined)
+
+    def runConcurrent(self):
+        self.workers = self.station.workers(self.stream_periods)
+        for worker in self.workers:
+            worker.start()
+        if not self.running:
+            for worker in self.workers:
+                worker.stop()
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
+
+    def runAttached(self):
+        # the acquisition daemon owns the devices, we only view its samples
+        from GHSDaemon import DaemonClient
+        self.client = DaemonClient(self.daemon_address, self.bus)
         try:
-            ps = self.mg.pressures()
-            for sensor in ps:
-                values.append(sensor.pressure)
-            time.sleep(0.2)
-            self.emit(SIGNAL('updatePressures'), values )
-        except:
-            self.emit(SIGNAL('panelMessage(QString)'), 'Couldn\'t get pressure values.')         
-            time.sleep(0.2)
-            self.emit(SIGNAL('initProblem(bool)'),self.problem)                        
+            self.client.connect()
+        except socket.error:
+            self.emit(SIGNAL('panelMessage(QString)'),'Can\'t connect to the acquisition daemon')
+            self.problem = True
+            self.emit(SIGNAL('initProblem(bool)'),self.problem)
+            return
+        self.emit(SIGNAL('panelMessage(QString)'),'Attached to the acquisition daemon')
+        self.client.run()
+        if self.running:
+            self.emit(SIGNAL('panelMessage(QString)'),'Lost connection to the acquisition daemon')
+            self.emit(SIGNAL('initProblem(bool)'),self.problem)
+
+    def recordTrend(self, sample):
+        if sample.error is None and sample.stream in self.trends:
+            self.trends[sample.stream].add(sample.timestamp, sample.values)
+
+    def onSample(self, sample):
+        if sample.stream == 'GAPS':
+            name, down, up = sample.values
+            self.emit(SIGNAL('panelMessage(QString)'),'%s is back after a %.1f s gap' % (name, up - down))
+            return
+        if sample.error is None:
+            self.failing.discard(sample.stream)
+            return
+        # acquisition goes on, every failing stream is reported once
+        if sample.stream in self.failing:
+            return
+        self.failing.add(sample.stream)
+        if isinstance(sample.error, GHSPanelError):
+            self.emit(SIGNAL('panelMessage(QString)'), str(sample.error))
+        else:
+            self.emit(SIGNAL('panelMessage(QString)'), STREAM_ERRORS[sample.stream])
     
     def initialization(self):
+        # a device that can't be opened is retried in the background
         self.problem = False
+        self.failing = set()
         try:
-            self.panel = GHSPanel(str(self.portGHS))
+            self.station.openPanel(self.portGHS)
         except:
-            self.emit(SIGNAL('panelMessage(QString)'),'Can\'t connect socket to MicroTask')                        
-            time.sleep(0.2)
-            self.problem = True
-            self.emit(SIGNAL('initProblem(bool)'),self.problem)     
-            time.sleep(0.2)
+            self.emit(SIGNAL('panelMessage(QString)'),'Can\'t connect socket to MicroTask, retrying')                        
 
         try:
-            self.mg = MaxiGauge(str(self.portMG))
+            self.station.openMaxiGauge(self.portMG)
         except:
-            self.emit(SIGNAL('panelMessage(QString)'),'Can\'t connect socket to MaxiGauge')
-            time.sleep(0.2)
-            self.problem = True
-            self.emit(SIGNAL('initProblem(bool)'),self.problem)     
-            time.sleep(0.2)
+            self.emit(SIGNAL('panelMessage(QString)'),'Can\'t connect socket to MaxiGauge, retrying')
            
     def stop(self):
-        self.terminate()
-        time.sleep(0.2)
-        
-        if not self.problem:
-            if self.panel.connection:
-                self.panel.connection.close()
-                time.sleep(0.5)
-                del self.panel
-            if self.mg.connection:
-                self.mg.connection.close()
-                time.sleep(0.5)
-                del self.mg
+        self.running = False
+        self.scheduler.stop()
+        for worker in self.workers:
+            worker.stop()
+        if self.client is not None:
+            self.client.stop()
+        if not self.wait(STOP_TIMEOUT):
+            self.terminate()
+        self.station.close()
+        self.client = None
         
     def setAcquisitionPorts(self, portGHS, portMG):
         self.portGHS = portGHS
@@ -150,23 +217,24 @@ class NumberThread(QThread):
 
     def setUpdateTime(self, updtime):
         self.update_time = updtime
+        for stream in self.stream_periods:
+            self.setStreamPeriod(stream, updtime)
 
-    def __del__(self):
-        self.wait()
+    def setStreamPeriod(self, stream, period):
+        self.stream_periods[stream] = period
+        self.scheduler.setPeriod(stream, period)
+        for worker in self.workers:
+            worker.setPeriod(stream, period)
 
-class ComDlg(QDialog, comdlg.Ui_ComDlg):
-    
-    def __init__(self,parent = None):
-        super(ComDlg, self).__init__(parent)
-        self.setupUi(self)
-        #self.updateUi()
+    def setConcurrent(self, concurrent):
+        self.concurrent = concurrent
 
-class LogDlg(QDialog, logdlg.Ui_LogDlg):
-    
-    def __init__(self,parent = None):
-        super(LogDlg, self).__init__(parent)
-        self.setupUi(self)
+    def attach(self, address):
+        # address is (host, port) of a running GHSDaemon, None to own the devices
+        self.daemon_address = address
 
+    def __del__(self):
+        self.wait()
 
 class MainWindow(QMainWindow,GHSPanelUI.Ui_MainWindow):
     def __init__(self,parent=None):
@@ -175,22 +243,41 @@ class MainWindow(QMainWindow,GHSPanelUI.Ui_MainWindow):
         
         self.statustimer = QTimer()
         self.acquirethread = NumberThread()     
+
+        self.textBrowser.document().setMaximumBlockCount(LOG_VIEW_LINES)
+        self.pendingLog = []
+        self.logTimer = QTimer()
+        self.logTimer.setSingleShot(True)
+        self.logTimer.setInterval(LOG_VIEW_INTERVAL)
+        self.connect( self.logTimer,       SIGNAL("timeout()"), self.flushlogFrame)
+        self.eventLog = LogWriter(EVENT_LOG)
+
+        # the window is refreshed from the newest samples, not on every sample,
+        # every key event in between still goes to the event log
+        self.frames = FrameSource(self.acquirethread.bus, ['ADC', 'KEYS', 'PRESSURES'], merged=['PRESSURES'], collected=['KEYEVENTS'])
+        self.shownKeys = None
+        self.frameTimer = QTimer()
+        self.connect( self.frameTimer,     SIGNAL("timeout()"), self.renderFrame)
+        self.setFrameRate(FRAME_RATE)
         
         self.connect( self.startButton,    SIGNAL("clicked()"), self.start)
         self.connect( self.stopButton,     SIGNAL("clicked()"), self.stop) 
-        self.connect( self.acquirethread,  SIGNAL("updateADC"), self.updateADC_ui)
-        self.connect( self.acquirethread,  SIGNAL("updateKeys"), self.updateKeys_ui)
-        self.connect( self.acquirethread,  SIGNAL("updatePressures"), self.updatePressures_ui)
         self.connect( self.acquirethread,  SIGNAL("panelMessage(QString)"), self.updatelogFrame)        
         self.connect( self.acquirethread,  SIGNAL("initProblem(bool)"), self.stop)
         self.connect( self.actionNewPorts, SIGNAL("triggered()"), self.portNew)
         self.connect( self.actionLogs,     SIGNAL("triggered()"), self.logNew)
         self.connect( self.actionAbout,    SIGNAL("triggered()"), self.helpAbout)   
+        self.connect( self.actionStats,    SIGNAL("triggered()"), self.showStats)
+        self.connect( self.actionTrends,   SIGNAL("triggered()"), self.showTrends)
         
         self.statusbar.showMessage("Ready",5000)
         
+        self.trendWindow = None
+        self.startClicked = None
         self.portGHS = 'COM3'
         self.portMG = 'COM4'
+        self.keyWidgets = dict((KEY_BITS[name], (getattr(self, 'radioButton_' + name), label, wording))
+                               for name, label, wording in KEY_DISPLAY)
         
     def helpAbout(self):
         QMessageBox.about(self, "About GHS-DRS1000 Monitor",
@@ -202,8 +289,25 @@ class MainWindow(QMainWindow,GHSPanelUI.Ui_MainWindow):
         __version__, platform.python_version(),
         QT_VERSION_STR, PYQT_VERSION_STR, platform.system()))
 
+    def showTrends(self):
+        # built the first time it is opened
+        if self.trendWindow is None:
+            from TrendPlot import TrendWindow
+            self.trendWindow = TrendWindow(self.acquirethread.trends, parent=self)
+        self.trendWindow.show()
+        self.trendWindow.raise_()
+
+    def showStats(self):
+        box = QMessageBox(QMessageBox.Information, "Link statistics", "Serial link timing since the last start.", QMessageBox.Save | QMessageBox.Close, self)
+        box.setDetailedText(self.acquirethread.stats.report())
+        if box.exec_() == QMessageBox.Save:
+            filename = QFileDialog.getSaveFileName(self, "Save link statistics", "link-stats.txt")
+            if filename:
+                self.acquirethread.stats.dump(str(filename))
+                self.updatelogFrame('Link statistics saved to ' + filename)
+
     def portNew(self):
-        
+        from Dialogs import ComDlg
         dialog = ComDlg(self)        
         dialog.comboBoxPortGHS.setCurrentIndex(dialog.comboBoxPortGHS.findText(self.portGHS))
         dialog.comboBoxPortMaxiGauge.setCurrentIndex(dialog.comboBoxPortMaxiGauge.findText(self.portMG))
@@ -214,10 +318,17 @@ class MainWindow(QMainWindow,GHSPanelUI.Ui_MainWindow):
             self.updatelogFrame('New port set')         
 
     def logNew(self):
-        
+        from Dialogs import LogDlg
         dialog = LogDlg(self)        
+        periods = self.acquirethread.stream_periods
+        dialog.spinBoxADC.setValue(periods['ADC'])
+        dialog.spinBoxKeys.setValue(periods['KEYS'])
+        dialog.spinBoxPressures.setValue(periods['PRESSURES'])
         if dialog.exec_():            
-            self.updatelogFrame('New ')         
+            self.acquirethread.setStreamPeriod('ADC', dialog.spinBoxADC.value())
+            self.acquirethread.setStreamPeriod('KEYS', dialog.spinBoxKeys.value())
+            self.acquirethread.setStreamPeriod('PRESSURES', dialog.spinBoxPressures.value())
+            self.updatelogFrame('New update periods set')         
         
     def start(self):
         self.running = True
@@ -227,6 +338,7 @@ class MainWindow(QMainWindow,GHSPanelUI.Ui_MainWindow):
         self.startButton.setEnabled(False)
         self.menuSettings.setEnabled(False)
         self.acquirethread.setAcquisitionPorts(self.portGHS,self.portMG)
+        self.startClicked = time.time()
         self.acquirethread.start()
 
 
@@ -250,363 +362,98 @@ class MainWindow(QMainWindow,GHSPanelUI.Ui_MainWindow):
         self.lcdNumber_P7.display(int(values[6]))
         self.lcdNumber_P8.display(int(values[7]))
 
-    def updateKeys_ui(self, status):
-
-        offstr, onstr = 'closed', 'open'
-        stopstr, startstr = 'stopped', 'started'
-        
-        #------        
-        
-        if status[21] == 1 and self.radioButton_A0.isChecked():
-            self.radioButton_A0.setChecked(False)
-            self.updatelogFrame('\'A0\' ' + offstr)
-            
-        if status[21] == 2 and not self.radioButton_A0.isChecked():
-            self.radioButton_A0.setChecked(True)            
-            self.updatelogFrame( '\'A0\' ' + onstr)
-
-        if status[51] == 1 and self.radioButton_A1.isChecked():
-            self.radioButton_A1.setChecked(False)
-            self.updatelogFrame( '\'A1\' ' + offstr)
-            
-        if status[51] == 2 and not self.radioButton_A1.isChecked():
-            self.radioButton_A1.setChecked(True)
-            self.updatelogFrame( '\'A1\' ' + onstr)
-
-        if status[42] == 1 and self.radioButton_A2.isChecked():
-            self.radioButton_A2.setChecked(False)
-            self.updatelogFrame( '\'A2\' ' + offstr)
-
-        if status[42] == 2 and not self.radioButton_A2.isChecked():        
-            self.radioButton_A2.setChecked(True)
-            self.updatelogFrame( '\'A2\' ' + onstr)
-            
-        if status[59] == 1 and self.radioButton_A3.isChecked():
-            self.radioButton_A3.setChecked(False)
-            self.updatelogFrame( '\'A3\' ' + offstr)
-            
-        if status[59] == 2 and not self.radioButton_A3.isChecked():            
-            self.radioButton_A3.setChecked(True)
-            self.updatelogFrame( '\'A3\' ' + onstr)
-
-        if status[54] == 1 and self.radioButton_A4.isChecked():
-            self.radioButton_A4.setChecked(False)
-            self.updatelogFrame( '\'A4\' ' + offstr)
-            
-        if status[54] == 2 and not self.radioButton_A4.isChecked():
-            self.radioButton_A4.setChecked(True)
-            self.updatelogFrame( '\'A4\' ' + onstr)
-            
-        if status[48] == 1 and self.radioButton_A5.isChecked():
-            self.radioButton_A5.setChecked(False)
-            self.updatelogFrame( '\'A5\' ' + offstr)
-
-        if status[48] == 2 and not self.radioButton_A5.isChecked():
-            self.radioButton_A5.setChecked(True)
-            self.updatelogFrame( '\'A5\' ' + onstr)
-
-        if status[56] == 1 and self.radioButton_A6.isChecked():
-            self.radioButton_A6.setChecked(False)
-            self.updatelogFrame( '\'A6\' ' + offstr)
-
-        if status[56] == 2 and not self.radioButton_A6.isChecked():
-            self.radioButton_A6.setChecked(True)
-            self.updatelogFrame( '\'A6\' ' + onstr)
-
-        if status[50] == 1 and self.radioButton_A7.isChecked():
-            self.radioButton_A7.setChecked(False)
-            self.updatelogFrame( '\'A7\' ' + offstr)
-
-        if status[50] == 2 and not self.radioButton_A7.isChecked():
-            self.radioButton_A7.setChecked(True)
-            self.updatelogFrame( '\'A7\' ' + onstr)
-
-        if status[41] == 1 and self.radioButton_A8.isChecked():
-            self.radioButton_A8.setChecked(False)
-            self.updatelogFrame( '\'A8\' ' + offstr)
-
-        if status[41] == 2 and not self.radioButton_A8.isChecked():
-            self.radioButton_A8.setChecked(True)
-            self.updatelogFrame( '\'A8\' ' + onstr)
-
-        if status[39] == 1 and self.radioButton_A9.isChecked():
-            self.radioButton_A9.setChecked(False)
-            self.updatelogFrame( '\'A9\' ' + offstr)
-
-        if status[39] == 2 and not self.radioButton_A9.isChecked():
-            self.radioButton_A9.setChecked(True)
-            self.updatelogFrame( '\'A9\' ' + onstr)
-
-        if status[45] == 1 and self.radioButton_A10.isChecked():
-            self.radioButton_A10.setChecked(False)
-            self.updatelogFrame( '\'A10\' ' + offstr)
-
-        if status[45] == 2 and not self.radioButton_A10.isChecked():
-            self.radioButton_A10.setChecked(True)
-            self.updatelogFrame( '\'A10\' ' + onstr)
-
-        #------
-            
-        if status[47] == 1 and self.radioButton_Start.isChecked():
-            self.radioButton_Start.setChecked(False)
-            self.updatelogFrame( '\'START\' ' + offstr)
-
-        if status[47] == 2 and not self.radioButton_Start.isChecked():
-            self.radioButton_Start.setChecked(True)
-            self.updatelogFrame( '\'START\' ' + onstr)
-            
-        if status[60] == 1 and self.radioButton_He3.isChecked():
-            self.radioButton_He3.setChecked(False)
-            self.updatelogFrame( '\'Condensing He3\' ' + stopstr)
-
-        if status[60] == 2 and not self.radioButton_He3.isChecked():
-            self.radioButton_He3.setChecked(True)
-            self.updatelogFrame( '\'Condensing He3\' ' + startstr)
-            
-        if status[61] == 1 and self.radioButton_He4.isChecked():
-            self.radioButton_He4.setChecked(False)
-            self.updatelogFrame( '\'Condensing He4\' ' + stopstr)
-
-        if status[61] == 2 and not self.radioButton_He4.isChecked():
-            self.radioButton_He4.setChecked(True)
-            self.updatelogFrame( '\'Condensing He4\' ' + startstr)
-
-        if status[62] == 1 and self.radioButton_Norm.isChecked():
-            self.radioButton_Norm.setChecked(False)
-            self.updatelogFrame( '\'Normal Circulation\' ' + stopstr)
-
-        if status[62] == 2 and not self.radioButton_Norm.isChecked():
-            self.radioButton_Norm.setChecked(True)
-            self.updatelogFrame( '\'Normal Circulation\' ' + startstr)
-
-        if status[63] == 1 and self.radioButton_Rec.isChecked():
-            self.radioButton_Rec.setChecked(False)
-            self.updatelogFrame( '\'Recovery\' ' + stopstr)
-
-        if status[63] == 2 and not self.radioButton_Rec.isChecked():
-            self.radioButton_Rec.setChecked(True)
-            self.updatelogFrame( '\'Recovery\' ' + startstr)
-
-        if status[5] == 1 and self.radioButton_Aux1.isChecked():
-            self.radioButton_Aux1.setChecked(False)
-            self.updatelogFrame( '\'AUX-1\' ' + offstr)
-
-        if status[5] == 2 and not self.radioButton_Aux1.isChecked():
-            self.radioButton_Aux1.setChecked(True)
-            self.updatelogFrame( '\'AUX-1\' ' + onstr)
-
-        if status[9] == 1 and self.radioButton_Reset.isChecked():
-            self.radioButton_Reset.setChecked(False)
-            self.updatelogFrame( '\'Reset\' ' + stopstr)
-
-        if status[9] == 2 and not self.radioButton_Reset.isChecked():
-            self.radioButton_Reset.setChecked(True)
-            self.updatelogFrame( '\'Reset\' ' + startstr)
-
-        if status[53] == 1 and self.radioButton_Auto.isChecked():
-            self.radioButton_Auto.setChecked(False)
-            self.updatelogFrame( '\'Auto\' ' + stopstr)
-
-        if status[53] == 2 and not self.radioButton_Auto.isChecked():
-            self.radioButton_Auto.setChecked(True)
-            self.updatelogFrame( '\'Auto\' ' + startstr)
-
-
-        #------
-
-        if status[36] == 1 and self.radioButton_0.isChecked():
-            self.radioButton_0.setChecked(False)
-            self.updatelogFrame( '\'0\' ' + offstr)
-
-        if status[36] == 2 and not self.radioButton_0.isChecked():
-            self.radioButton_0.setChecked(True)
-            self.updatelogFrame( '\'0\' ' + onstr)
-
-        if status[30] == 1 and self.radioButton_1.isChecked():
-            self.radioButton_1.setChecked(False)
-            self.updatelogFrame( '\'1\' ' + offstr)
-
-        if status[30] == 2 and not self.radioButton_1.isChecked():
-            self.radioButton_1.setChecked(True)
-            self.updatelogFrame( '\'1\' ' + onstr)
-
-        if status[35] == 1 and self.radioButton_2.isChecked():
-            self.radioButton_2.setChecked(False)
-            self.updatelogFrame( '\'2\' ' + offstr)
-
-        if status[35] == 2 and not self.radioButton_2.isChecked():
-            self.radioButton_2.setChecked(True)
-            self.updatelogFrame( '\'2\' ' + onstr)
-
-        if status[33] == 1 and self.radioButton_3.isChecked():
-            self.radioButton_3.setChecked(False)
-            self.updatelogFrame( '\'3\' ' + offstr)
-
-        if status[33] == 2 and not self.radioButton_3.isChecked():
-            self.radioButton_3.setChecked(True)
-            self.updatelogFrame( '\'3\' ' + onstr)
-
-        if status[6] == 1 and self.radioButton_4.isChecked():
-            self.radioButton_4.setChecked(False)
-            self.updatelogFrame( '\'4\' ' + offstr)
-
-        if status[6] == 2 and not self.radioButton_4.isChecked():
-            self.radioButton_4.setChecked(True)
-            self.updatelogFrame( '\'4\' ' + onstr)
-
-        if status[8] == 1 and self.radioButton_5.isChecked():
-            self.radioButton_5.setChecked(False)
-            self.updatelogFrame( '\'5\' ' + offstr)
-
-        if status[8] == 2 and not self.radioButton_5.isChecked():
-            self.radioButton_5.setChecked(True)
-            self.updatelogFrame( '\'5\' ' + onstr)
-
-        if status[26] == 1 and self.radioButton_6.isChecked():
-            self.radioButton_6.setChecked(False)
-            self.updatelogFrame( '\'6\' ' + offstr)
-
-        if status[26] == 2 and not self.radioButton_6.isChecked():
-            self.radioButton_6.setChecked(True)
-            self.updatelogFrame( '\'6\' ' + onstr)
-
-        if status[23] == 1 and self.radioButton_7.isChecked():
-            self.radioButton_7.setChecked(False)
-            self.updatelogFrame( '\'7\' ' + offstr)
-
-        if status[23] == 2 and not self.radioButton_7.isChecked():
-            self.radioButton_7.setChecked(True)
-            self.updatelogFrame( '\'7\' ' + onstr)
-
-        if status[29] == 1 and self.radioButton_8.isChecked():
-            self.radioButton_8.setChecked(False)
-            self.updatelogFrame( '\'8\' ' + offstr)
-
-        if status[29] == 2 and not self.radioButton_8.isChecked():
-            self.radioButton_8.setChecked(True)
-            self.updatelogFrame( '\'8\' ' + onstr)
-
-        if status[11] == 1 and self.radioButton_9.isChecked():
-            self.radioButton_9.setChecked(False)
-            self.updatelogFrame( '\'9\' ' + offstr)
-
-        if status[11] == 2 and not self.radioButton_9.isChecked():
-            self.radioButton_9.setChecked(True)
-            self.updatelogFrame( '\'9\' ' + onstr)
-
-        if status[18] == 1 and self.radioButton_10.isChecked():
-            self.radioButton_10.setChecked(False)
-            self.updatelogFrame( '\'10\' ' + offstr)
-
-        if status[18] == 2 and not self.radioButton_10.isChecked():
-            self.radioButton_10.setChecked(True)
-            self.updatelogFrame( '\'10\' ' + onstr)
-
-        if status[20] == 1 and self.radioButton_11.isChecked():
-            self.radioButton_11.setChecked(False)
-            self.updatelogFrame( '\'11\' ' + offstr)
-
-        if status[20] == 2 and not self.radioButton_11.isChecked():
-            self.radioButton_11.setChecked(True)
-            self.updatelogFrame( '\'11\' ' + onstr)
-
-        if status[17] == 1 and self.radioButton_12.isChecked():
-            self.radioButton_12.setChecked(False)
-            self.updatelogFrame( '\'12\' ' + offstr)
-
-        if status[17] == 2 and not self.radioButton_12.isChecked():
-            self.radioButton_12.setChecked(True)
-            self.updatelogFrame( '\'12\' ' + onstr)
-
-        if status[14] == 1 and self.radioButton_13.isChecked():
-            self.radioButton_13.setChecked(False)
-            self.updatelogFrame( '\'13\' ' + offstr)
+    def setFrameRate(self, fps):
+        self.frameTimer.start(int(1000. / fps))
+
+    def renderFrame(self):
+        samples = self.frames.changed()
+        if samples and self.startClicked is not None:
+            self.updatelogFrame('First sample %.0f ms after Start' % (1000. * (time.time() - self.startClicked)))
+            self.startClicked = None
+        if 'ADC' in samples:
+            self.updateADC_ui(samples['ADC'].values)
+        if 'PRESSURES' in samples:
+            self.updatePressures_ui(samples['PRESSURES'].values)
+        for sample in samples.get('KEYEVENTS', []):
+            self.logKeyEvents(sample.values)
+        if 'KEYS' in samples:
+            self.updateKeyState_ui(samples['KEYS'].values)
+
+    def updateKeyState_ui(self, status):
+        # only the widgets of the keys that changed since the last frame are touched
+        state = KeyState.fromKeys(status)
+        if self.shownKeys is None:
+            self.updateKeys_ui(status)
+        else:
+            for index in changedBits(state.changed(self.shownKeys)):
+                self.setKey(index, status[index])
+        self.shownKeys = state
 
-        if status[14] == 2 and not self.radioButton_13.isChecked():
-            self.radioButton_13.setChecked(True)
-            self.updatelogFrame( '\'13\' ' + onstr)
-
-        if status[12] == 1 and self.radioButton_14.isChecked():
-            self.radioButton_14.setChecked(False)
-            self.updatelogFrame( '\'14\' ' + offstr)
-
-        if status[12] == 2 and not self.radioButton_14.isChecked():
-            self.radioButton_14.setChecked(True)
-            self.updatelogFrame( '\'14\' ' + onstr)
-
-        if status[2] == 1 and self.radioButton_15.isChecked():
-            self.radioButton_15.setChecked(False)
-            self.updatelogFrame( '\'15\' ' + offstr)
-
-        if status[2] == 2 and not self.radioButton_15.isChecked():
-            self.radioButton_15.setChecked(True)
-            self.updatelogFrame( '\'15\' ' + onstr)
-
-        if status[3] == 1 and self.radioButton_16.isChecked():
-            self.radioButton_16.setChecked(False)
-            self.updatelogFrame( '\'16\' ' + offstr)
-
-        if status[3] == 2 and not self.radioButton_16.isChecked():
-            self.radioButton_16.setChecked(True)
-            self.updatelogFrame( '\'16\' ' + onstr)
-
-        if status[27] == 1 and self.radioButton_17.isChecked():
-            self.radioButton_17.setChecked(False)
-            self.updatelogFrame( '\'17\' ' + offstr)
-
-        if status[27] == 2 and not self.radioButton_17.isChecked():
-            self.radioButton_17.setChecked(True)
-            self.updatelogFrame( '\'17\' ' + onstr)
-
-         #------
-
-        if status[38] == 1 and self.radioButton_S1.isChecked():
-            self.radioButton_S1.setChecked(False)
-            self.updatelogFrame( '\'S1\' ' + stopstr)
-
-        if status[38] == 2 and not self.radioButton_S1.isChecked():
-            self.radioButton_S1.setChecked(True)
-            self.updatelogFrame( '\'S1\' ' + startstr)
-
-        if status[32] == 1 and self.radioButton_S2.isChecked():
-            self.radioButton_S2.setChecked(False)
-            self.updatelogFrame( '\'S2\' ' + stopstr)
-
-        if status[32] == 2 and not self.radioButton_S2.isChecked():
-            self.radioButton_S2.setChecked(True)
-            self.updatelogFrame( '\'S2\' ' + startstr)
-
-        if status[24] == 1 and self.radioButton_S3.isChecked():
-            self.radioButton_S3.setChecked(False)
-            self.updatelogFrame( '\'S3\' ' + stopstr)
-
-        if status[24] == 2 and not self.radioButton_S3.isChecked():
-            self.radioButton_S3.setChecked(True)
-            self.updatelogFrame( '\'S3\' ' + startstr)
-
-        if status[57] == 1 and self.radioButton_S4.isChecked():
-            self.radioButton_S4.setChecked(False)
-            self.updatelogFrame( '\'S4\' ' + stopstr)
-
-        if status[57] == 2 and not self.radioButton_S4.isChecked():
-            self.radioButton_S4.setChecked(True)
-            self.updatelogFrame( '\'S4\' ' + startstr)
-
-        if status[44] == 1 and self.radioButton_S5.isChecked():
-            self.radioButton_S5.setChecked(False)
-            self.updatelogFrame( '\'S5\' ' + stopstr)
-
-        if status[44] == 2 and not self.radioButton_S5.isChecked():
-            self.radioButton_S5.setChecked(True)
-            self.updatelogFrame( '\'S5\' ' + startstr)
+    def updateKeys_ui(self, status):
+        # a whole KEYS? map
+        for index in self.keyWidgets:
+            self.setKey(index, status[index])
+
+    def setKey(self, index, value):
+        if index not in self.keyWidgets:
+            return
+        widget = self.keyWidgets[index][0]
+        if value == 1:
+            widget.setChecked(False)
+        elif value == 2:
+            widget.setChecked(True)
+
+    def logKeyEvents(self, events):
+        # called before the checkboxes show the frame, a key that opened and
+        # closed again between two frames is logged twice all the same
+        for event in events:
+            if event.index not in self.keyWidgets or event.new not in (1, 2):
+                continue
+            widget, label, (offstr, onstr) = self.keyWidgets[event.index]
+            if event.old not in (1, 2) and widget.isChecked() == (event.new == 2):
+                # first or once invalid reading, logged only if it differs from the window
+                continue
+            self.updatelogFrame('\'%s\' %s' % (label, onstr if event.new == 2 else offstr), event.timestamp)
 
     def updatePressures_ui(self, values):    
-        self.lcdNumber_IVC.display('%.1E' % values[5])
-        self.lcdNumber_STIL.display('%.1E' % values[4])
+        # NaN: the sensor wasn't read this time, keep its last value
+        if values[5] == values[5]:
+            self.lcdNumber_IVC.display('%.1E' % values[5])
+        if values[4] == values[4]:
+            self.lcdNumber_STIL.display('%.1E' % values[4])
         
-    def updatelogFrame(self,message):
-        timeStamp=datetime.today().strftime(' [%H:%M:%S, %d-%m-%Y]')
-        self.textBrowser.append(message + timeStamp)
+    def updatelogFrame(self, message, timestamp=None):
+        # queued, the view is updated once per LOG_VIEW_INTERVAL
+        self.pendingLog.append((timestamp if timestamp is not None else time.time(), unicode(message)))
+        if not self.logTimer.isActive():
+            self.logTimer.start()
+
+    def flushlogFrame(self):
+        if not self.pendingLog:
+            return
+        lines = []
+        stamped, timeStamp = None, ''
+        for t, message in self.pendingLog:
+            if int(t) != stamped:
+                stamped = int(t)
+                timeStamp = time.strftime(' [%H:%M:%S, %d-%m-%Y]', time.localtime(t))
+            lines.append(message + timeStamp)
+            self.eventLog.write(lines[-1].encode('utf-8'))
+        self.pendingLog = []
+        scrollBar = self.textBrowser.verticalScrollBar()
+        following = scrollBar.value() == scrollBar.maximum()
+        cursor = QTextCursor(self.textBrowser.document())
+        cursor.movePosition(QTextCursor.End)
+        if not self.textBrowser.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText('\n'.join(lines[-LOG_VIEW_LINES:]))
+        if following:
+            scrollBar.setValue(scrollBar.maximum())
+
+    def closeEvent(self, e):
+        self.flushlogFrame()
+        self.eventLog.close()
+        e.accept()
         
     def keyPressEvent(self, e):
         
@@ -616,8 +463,20 @@ class MainWindow(QMainWindow,GHSPanelUI.Ui_MainWindow):
             self.close()        
          
 if __name__ == "__main__":
+    IMPORTED = time.time()
     app = QApplication(sys.argv)
     form = MainWindow()
+    form.acquirethread.setConcurrent('--concurrent' in sys.argv)
+    if '--gauges' in sys.argv:
+        form.acquirethread.station.gauges.setPeriods(parseGauges(sys.argv[sys.argv.index('--gauges') + 1]))
+    if '--calibration' in sys.argv:
+        form.acquirethread.station.calibration = Calibration.load(sys.argv[sys.argv.index('--calibration') + 1])
+    if '--fps' in sys.argv:
+        form.setFrameRate(float(sys.argv[sys.argv.index('--fps') + 1]))
+    if '--attach' in sys.argv:
+        from GHSDaemon import parseAddress
+        form.acquirethread.attach(parseAddress(sys.argv[sys.argv.index('--attach') + 1]))
     form.show()
+    form.updatelogFrame('Window shown %.0f ms after launch (imports %.0f ms)' % (1000. * (time.time() - LAUNCHED), 1000. * (IMPORTED - LAUNCHED)))
 #    app.connect(form.startButton, SIGNAL("clicked()"), app, SLOT("quit()"))
     app.exec_()
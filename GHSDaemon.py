@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+GHSDaemon.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Headless acquisition service. It owns the GHS panel and the MaxiGauge,
+records every sample to a file and serves the samples to any number of
+viewers over TCP, one JSON object per line. The Qt window attaches to it
+with  python GHS-DRS1000.py --attach host:port
+
+  python GHSDaemon.py --ghs COM3 --mg COM4 --listen 0.0.0.0:5025
+
+GHSDaemon.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+GHSDaemon.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import sys
+import json
+import time
+import signal
+import socket
+import argparse
+import SocketServer
+from Queue import Queue, Full, Empty
+from threading import Event, Lock, Thread
+from Acquisition import SampleBus, Station, KeyTracker, KeyEvent, parseGauges, positivePeriod, STREAM_PERIODS
+from MicroTask import GHSPanelError, KEY_NAMES
+from PfeifferVacuum import CONTINUOUS_INTERVALS
+from LinkStats import LinkStats
+from LogWriter import LogWriter
+from StreamStats import ChannelStats
+from Calibration import Calibration
+
+DEFAULT_PORT = 5025
+
+### Streams the Recorder can average, with their number of channels
+AVERAGED_STREAMS = {'ADC': 8, 'ADCRAW': 8, 'PRESSURES': 6}
+
+class RemoteError(Exception):
+    pass
+
+def parseAddress(text, host='localhost'):
+    if ':' in text:
+        host, port = text.rsplit(':', 1)
+        return host, int(port)
+    return host, int(text)
+
+def periodArgument(text):
+    try:
+        return positivePeriod(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def encodeSample(sample):
+    message = {'stream': sample.stream, 'timestamp': sample.timestamp}
+    if sample.error is None:
+        message['values'] = sample.values
+    else:
+        message['error'] = str(sample.error)
+        message['errorType'] = type(sample.error).__name__
+    return json.dumps(message) + '\n'
+
+def decodeSample(bus, line):
+    message = json.loads(line)
+    error = None
+    if 'error' in message:
+        if message.get('errorType') == 'GHSPanelError':
+            error = GHSPanelError(str(message['error']))
+        else:
+            error = RemoteError(str(message['error']))
+    values = message.get('values')
+    if message['stream'] == 'KEYEVENTS':
+        values = [KeyEvent(*event) for event in values]
+    return bus.publish(str(message['stream']), values, message['timestamp'], error)
+
+def formatKeyEvent(event):
+    return "%s:%s->%s" % (KEY_NAMES.get(event.index, event.index), event.old, event.new)
+
+class Recorder(object):
+    """Appends every sample to a text file: time, stream, values.
+
+    KEYEVENTS values are written as name:old->new, one per changed key,
+    with the index instead of the name for an unnamed entry of the map.
+
+    With average > 1 every average samples of ADC and PRESSURES are
+    written as one STREAM-STATS line instead: mean, stddev, min, max of
+    every channel, then the number of valid values of every channel.
+    PRESSURESTATUS is then only written when the statuses change.
+    The file is written by a LogWriter, options are passed on to it.
+    """
+    def __init__(self, filename, average=0, **options):
+        self.filename = filename
+        self.average = average
+        self.aggregates = dict((stream, ChannelStats(n)) for stream, n in AVERAGED_STREAMS.items())
+        self.statuses = None
+        self.writer = LogWriter(filename, **options)
+
+    def record(self, sample):
+        if self.average > 1 and sample.error is None and sample.stream in self.aggregates:
+            aggregate = self.aggregates[sample.stream]
+            aggregate.add(sample.values, sample.timestamp)
+            if aggregate.samples >= self.average:
+                line = "%.3f, %s-STATS, " % (aggregate.midtime(), sample.stream) + ', '.join([repr(val) for val in aggregate.row() + aggregate.count])
+                aggregate.reset()
+                self.writer.write(line)
+            return
+        if self.average > 1 and sample.stream == 'PRESSURESTATUS':
+            if sample.values == self.statuses:
+                return
+            self.statuses = sample.values
+        if sample.error is None and sample.stream == 'KEYEVENTS':
+            line = "%.3f, %s, " % (sample.timestamp, sample.stream) + ', '.join([formatKeyEvent(event) for event in sample.values])
+        elif sample.error is None:
+            line = "%.3f, %s, " % (sample.timestamp, sample.stream) + ', '.join([repr(val) for val in sample.values])
+        else:
+            line = "%.3f, %s, ERROR %s" % (sample.timestamp, sample.stream, sample.error)
+        self.writer.write(line)
+
+    def close(self):
+        self.writer.close()
+
+class ViewerHandler(SocketServer.StreamRequestHandler):
+    # every viewer gets its own queue, a stalled viewer only loses its own samples
+    def handle(self):
+        queue = self.server.addViewer()
+        try:
+            while not self.server.stopping.isSet():
+                try:
+                    line = queue.get(timeout=0.5)
+                except Empty:
+                    continue
+                self.wfile.write(line)
+                self.wfile.flush()
+        except socket.error:
+            pass
+        finally:
+            self.server.removeViewer(queue)
+
+    def finish(self):
+        # flushing the socket of a viewer that went away is not an error
+        try:
+            SocketServer.StreamRequestHandler.finish(self)
+        except socket.error:
+            pass
+
+class StateServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    """Streams the bus to the viewers; new viewers get the latest state first."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, bus, backlog=1000):
+        SocketServer.TCPServer.__init__(self, address, ViewerHandler)
+        self.bus = bus
+        self.backlog = backlog
+        self.stopping = Event()
+        self.lock = Lock()
+        self.viewers = []
+        bus.subscribe(self.broadcast)
+
+    def addViewer(self):
+        queue = Queue(self.backlog)
+        with self.lock:
+            self.viewers.append(queue)
+            for sample in self.bus.snapshot():
+                queue.put_nowait(encodeSample(sample))
+        return queue
+
+    def removeViewer(self, queue):
+        with self.lock:
+            self.viewers.remove(queue)
+
+    def broadcast(self, sample):
+        line = encodeSample(sample)
+        with self.lock:
+            for queue in self.viewers:
+                try:
+                    queue.put_nowait(line)
+                except Full:
+                    pass
+
+    def stop(self):
+        self.stopping.set()
+        self.shutdown()
+        self.server_close()
+
+class DaemonClient(object):
+    """Replays the samples of a running GHSDaemon into a local SampleBus."""
+    def __init__(self, address, bus):
+        self.address = address
+        self.bus = bus
+        self.connection = None
+
+    def connect(self, timeout=5.):
+        self.connection = socket.create_connection(self.address, timeout)
+        self.connection.settimeout(None)
+
+    def run(self):
+        # returns when the daemon goes away or stop() is called
+        try:
+            for line in self.connection.makefile('r'):
+                decodeSample(self.bus, line)
+        except (socket.error, ValueError):
+            pass
+
+    def stop(self):
+        if self.connection is not None:
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            self.connection.close()
+
+class GHSDaemon(object):
+    def __init__(self, portGHS, portMG, address, logfilename, periods, statsfilename=None, gauges=None, continuous=None, logOptions={}, average=0, calibration=None):
+        self.portGHS = portGHS
+        self.portMG = portMG
+        self.address = address
+        self.logfilename = logfilename
+        self.logOptions = logOptions
+        self.average = average
+        self.periods = periods
+        self.statsfilename = statsfilename
+        self.stopping = Event()
+        self.bus = SampleBus()
+        self.keyTracker = KeyTracker(self.bus)
+        self.stats = LinkStats()
+        self.station = Station(self.bus, self.stats, calibration)
+        if gauges is not None:
+            self.station.gauges.setPeriods(gauges)
+        self.station.setGaugeStream(continuous)
+
+    def run(self):
+        # a device that can't be opened is retried by its DeviceLink
+        try:
+            self.station.openPanel(self.portGHS)
+        except Exception as e:
+            sys.stderr.write("Can't open the GHS panel on %s, retrying: %s\n" % (self.portGHS, e))
+        try:
+            self.station.openMaxiGauge(self.portMG)
+        except Exception as e:
+            sys.stderr.write("Can't open the MaxiGauge on %s, retrying: %s\n" % (self.portMG, e))
+        self.recorder = Recorder(self.logfilename, self.average, **self.logOptions)
+        self.bus.subscribe(self.recorder.record)
+        self.server = StateServer(self.address, self.bus)
+        serverThread = Thread(target=self.server.serve_forever)
+        serverThread.daemon = True
+        serverThread.start()
+        workers = self.station.workers(self.periods)
+        for worker in workers:
+            worker.start()
+        while not self.stopping.isSet():
+            time.sleep(0.5)
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join()
+        self.server.stop()
+        self.recorder.close()
+        self.station.close()
+        if self.statsfilename:
+            self.stats.dump(self.statsfilename)
+
+    def stop(self, *args):
+        self.stopping.set()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless acquisition of the DRS1000 gas handling system')
+    parser.add_argument('--ghs', default='COM3', help='serial port of the MicroTask GHS panel')
+    parser.add_argument('--mg', default='COM4', help='serial port of the MaxiGauge, SIM for a simulated one')
+    parser.add_argument('--continuous', type=int, choices=sorted(CONTINUOUS_INTERVALS), default=None,
+                        help='stream the MaxiGauge in its continuous mode (0: 100 ms, 1: 1 s, 2: 1 min) instead of polling it')
+    parser.add_argument('--listen', default='localhost:%d' % DEFAULT_PORT, help='host:port the viewers connect to')
+    parser.add_argument('--log', default='ghs-data.txt', help='file every sample is appended to')
+    parser.add_argument('--average', type=int, default=0, metavar='N', help='log mean, stddev, min and max of every N ADC and pressure samples instead of each sample')
+    parser.add_argument('--log-size', type=float, default=0, metavar='MB', help='start a new log file at this size (default never)')
+    parser.add_argument('--log-hours', type=float, default=0, metavar='HOURS', help='start a new log file after this time (default never)')
+    parser.add_argument('--log-keep', type=int, default=0, metavar='N', help='number of old log files kept (default all)')
+    parser.add_argument('--fsync', type=float, default=5., metavar='SECONDS', help='interval the log file is synced to disk')
+    parser.add_argument('--stats', default=None, help='file the link statistics are written to on exit')
+    parser.add_argument('--calibration', type=Calibration.load, default=None, metavar='FILE', help='JSON file with the calibration curves of the ADC channels')
+    parser.add_argument('--gauges', type=parseGauges, default=None, metavar='SENSOR[:SECONDS],...', help='MaxiGauge sensors to read, e.g. 5,6:10 (default all)')
+    for stream in sorted(STREAM_PERIODS):
+        parser.add_argument('--' + stream.lower(), type=periodArgument, default=STREAM_PERIODS[stream], metavar='SECONDS', help='%s poll period' % stream)
+    args = parser.parse_args(argv)
+    periods = dict((stream, getattr(args, stream.lower())) for stream in STREAM_PERIODS)
+    logOptions = {'maxBytes': int(args.log_size * 2**20), 'rotateInterval': args.log_hours * 3600,
+                  'backups': args.log_keep, 'fsyncInterval': args.fsync}
+    daemon = GHSDaemon(args.ghs, args.mg, parseAddress(args.listen), args.log, periods, args.stats, args.gauges, args.continuous, logOptions, args.average, args.calibration)
+    signal.signal(signal.SIGINT, daemon.stop)
+    signal.signal(signal.SIGTERM, daemon.stop)
+    daemon.run()
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,40 @@ except AttributeError:
     def _translate(context, text, disambig):
         return QtGui.QApplication.translate(context, text, disambig)
 
+### Hand edited: the widgets share their QFont objects and style sheet strings
+### instead of building identical ones for each widget, see sharedFont and
+### the *_STYLE constants. Keep this when the file is generated again from GHSPanel.ui.
+
+_fonts = {}
+
+### QFont setters for the keyword arguments of sharedFont, applied in this order
+FONT_SETTINGS = [('bold', 'setBold'), ('italic', 'setItalic'), ('weight', 'setWeight'),
+                 ('kerning', 'setKerning'), ('strategy', 'setStyleStrategy')]
+
+def sharedFont(family, pointSize=None, **settings):
+    key = (family, pointSize, tuple(sorted(settings.items())))
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = QtGui.QFont()
+        font.setFamily(_fromUtf8(family))
+        if pointSize is not None:
+            font.setPointSize(pointSize)
+        for name, setter in FONT_SETTINGS:
+            if name in settings:
+                getattr(font, setter)(settings[name])
+    return font
+
+### Style sheets used by the window, converted once
+LCD_STYLE = _fromUtf8("background-color: rgb(0, 0, 0);\n"
+"color: rgb(0, 255, 0);\n"
+"font: 10pt \"Arial\";")
+YELLOW_LINE_STYLE = _fromUtf8("color: rgb(255, 255, 0);\n"
+"border-color: rgb(255, 255, 0);\n"
+"background-color: rgb(255, 255, 0);")
+GREEN_LINE_STYLE = _fromUtf8("color: rgb(0, 170, 0);\n"
+"background-color: rgb(0, 170, 0);\n"
+"border-color: rgb(0, 170, 0);")
+
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName(_fromUtf8("MainWindow"))
@@ -53,60 +87,36 @@ class Ui_MainWindow(object):
         self.auxiliaryCircuitDock.setObjectName(_fromUtf8("auxiliaryCircuitDock"))
         self.lcdNumber_P1 = QtGui.QLCDNumber(self.auxiliaryCircuitDock)
         self.lcdNumber_P1.setGeometry(QtCore.QRect(110, 290, 64, 23))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Arial"))
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setItalic(False)
-        font.setWeight(50)
-        self.lcdNumber_P1.setFont(font)
-        self.lcdNumber_P1.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P1.setFont(sharedFont("Arial", 10, bold=False, italic=False, weight=50))
+        self.lcdNumber_P1.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P1.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P1.setObjectName(_fromUtf8("lcdNumber_P1"))
         self.lcdNumber_P2 = QtGui.QLCDNumber(self.auxiliaryCircuitDock)
         self.lcdNumber_P2.setGeometry(QtCore.QRect(190, 290, 64, 23))
-        self.lcdNumber_P2.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P2.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P2.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P2.setObjectName(_fromUtf8("lcdNumber_P2"))
         self.lcdNumber_P3 = QtGui.QLCDNumber(self.auxiliaryCircuitDock)
         self.lcdNumber_P3.setGeometry(QtCore.QRect(270, 290, 64, 23))
-        self.lcdNumber_P3.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P3.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P3.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P3.setObjectName(_fromUtf8("lcdNumber_P3"))
         self.label_P1 = QtGui.QLabel(self.auxiliaryCircuitDock)
         self.label_P1.setGeometry(QtCore.QRect(110, 270, 21, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_P1.setFont(font)
+        self.label_P1.setFont(sharedFont("Sans Serif", 8))
         self.label_P1.setObjectName(_fromUtf8("label_P1"))
         self.label_P2 = QtGui.QLabel(self.auxiliaryCircuitDock)
         self.label_P2.setGeometry(QtCore.QRect(190, 270, 21, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_P2.setFont(font)
+        self.label_P2.setFont(sharedFont("Sans Serif", 8))
         self.label_P2.setObjectName(_fromUtf8("label_P2"))
         self.label_P3 = QtGui.QLabel(self.auxiliaryCircuitDock)
         self.label_P3.setGeometry(QtCore.QRect(270, 270, 21, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Arial"))
-        font.setPointSize(8)
-        self.label_P3.setFont(font)
+        self.label_P3.setFont(sharedFont("Arial", 8))
         self.label_P3.setObjectName(_fromUtf8("label_P3"))
         self.radioButton_A1 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A1.setEnabled(False)
         self.radioButton_A1.setGeometry(QtCore.QRect(200, 210, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A1.setFont(font)
+        self.radioButton_A1.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A1.setMouseTracking(False)
         self.radioButton_A1.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A1.setCheckable(True)
@@ -117,9 +127,7 @@ class Ui_MainWindow(object):
         self.line.setEnabled(True)
         self.line.setGeometry(QtCore.QRect(220, 240, 4, 41))
         self.line.setAutoFillBackground(False)
-        self.line.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line.setStyleSheet(YELLOW_LINE_STYLE)
         self.line.setFrameShadow(QtGui.QFrame.Plain)
         self.line.setLineWidth(0)
         self.line.setMidLineWidth(0)
@@ -130,9 +138,7 @@ class Ui_MainWindow(object):
         self.line_2.setEnabled(True)
         self.line_2.setGeometry(QtCore.QRect(220, 10, 4, 191))
         self.line_2.setAutoFillBackground(False)
-        self.line_2.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_2.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_2.setFrameShadow(QtGui.QFrame.Plain)
         self.line_2.setLineWidth(0)
         self.line_2.setMidLineWidth(0)
@@ -143,9 +149,7 @@ class Ui_MainWindow(object):
         self.line_3.setEnabled(True)
         self.line_3.setGeometry(QtCore.QRect(140, 10, 4, 271))
         self.line_3.setAutoFillBackground(False)
-        self.line_3.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_3.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_3.setFrameShadow(QtGui.QFrame.Plain)
         self.line_3.setLineWidth(0)
         self.line_3.setMidLineWidth(0)
@@ -156,9 +160,7 @@ class Ui_MainWindow(object):
         self.line_4.setEnabled(True)
         self.line_4.setGeometry(QtCore.QRect(300, 240, 4, 41))
         self.line_4.setAutoFillBackground(False)
-        self.line_4.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_4.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_4.setFrameShadow(QtGui.QFrame.Plain)
         self.line_4.setLineWidth(0)
         self.line_4.setMidLineWidth(0)
@@ -168,10 +170,7 @@ class Ui_MainWindow(object):
         self.radioButton_A2 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A2.setEnabled(False)
         self.radioButton_A2.setGeometry(QtCore.QRect(280, 210, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A2.setFont(font)
+        self.radioButton_A2.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A2.setMouseTracking(False)
         self.radioButton_A2.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A2.setAutoExclusive(False)
@@ -180,9 +179,7 @@ class Ui_MainWindow(object):
         self.line_5.setEnabled(True)
         self.line_5.setGeometry(QtCore.QRect(300, 180, 4, 21))
         self.line_5.setAutoFillBackground(False)
-        self.line_5.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_5.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_5.setFrameShadow(QtGui.QFrame.Plain)
         self.line_5.setLineWidth(0)
         self.line_5.setMidLineWidth(0)
@@ -192,10 +189,7 @@ class Ui_MainWindow(object):
         self.radioButton_S5 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_S5.setEnabled(False)
         self.radioButton_S5.setGeometry(QtCore.QRect(280, 150, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_S5.setFont(font)
+        self.radioButton_S5.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_S5.setMouseTracking(False)
         self.radioButton_S5.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_S5.setCheckable(True)
@@ -205,9 +199,7 @@ class Ui_MainWindow(object):
         self.line_6.setEnabled(True)
         self.line_6.setGeometry(QtCore.QRect(300, 120, 4, 21))
         self.line_6.setAutoFillBackground(False)
-        self.line_6.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_6.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_6.setFrameShadow(QtGui.QFrame.Plain)
         self.line_6.setLineWidth(0)
         self.line_6.setMidLineWidth(0)
@@ -217,10 +209,7 @@ class Ui_MainWindow(object):
         self.radioButton_A0 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A0.setEnabled(False)
         self.radioButton_A0.setGeometry(QtCore.QRect(280, 90, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A0.setFont(font)
+        self.radioButton_A0.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A0.setMouseTracking(False)
         self.radioButton_A0.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A0.setStyleSheet(_fromUtf8(""))
@@ -231,9 +220,7 @@ class Ui_MainWindow(object):
         self.line_9.setEnabled(True)
         self.line_9.setGeometry(QtCore.QRect(300, 320, 4, 111))
         self.line_9.setAutoFillBackground(False)
-        self.line_9.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_9.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_9.setFrameShadow(QtGui.QFrame.Plain)
         self.line_9.setLineWidth(0)
         self.line_9.setMidLineWidth(0)
@@ -244,9 +231,7 @@ class Ui_MainWindow(object):
         self.line_10.setEnabled(True)
         self.line_10.setGeometry(QtCore.QRect(220, 320, 4, 111))
         self.line_10.setAutoFillBackground(False)
-        self.line_10.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_10.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_10.setFrameShadow(QtGui.QFrame.Plain)
         self.line_10.setLineWidth(0)
         self.line_10.setMidLineWidth(0)
@@ -257,9 +242,7 @@ class Ui_MainWindow(object):
         self.line_11.setEnabled(True)
         self.line_11.setGeometry(QtCore.QRect(140, 320, 4, 111))
         self.line_11.setAutoFillBackground(False)
-        self.line_11.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_11.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_11.setFrameShadow(QtGui.QFrame.Plain)
         self.line_11.setLineWidth(0)
         self.line_11.setMidLineWidth(0)
@@ -269,10 +252,7 @@ class Ui_MainWindow(object):
         self.radioButton_A4 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A4.setEnabled(False)
         self.radioButton_A4.setGeometry(QtCore.QRect(160, 380, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A4.setFont(font)
+        self.radioButton_A4.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A4.setMouseTracking(False)
         self.radioButton_A4.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A4.setAutoExclusive(False)
@@ -280,10 +260,7 @@ class Ui_MainWindow(object):
         self.radioButton_A5 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A5.setEnabled(False)
         self.radioButton_A5.setGeometry(QtCore.QRect(240, 380, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A5.setFont(font)
+        self.radioButton_A5.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A5.setMouseTracking(False)
         self.radioButton_A5.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A5.setAutoExclusive(False)
@@ -291,10 +268,7 @@ class Ui_MainWindow(object):
         self.radioButton_A3 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A3.setEnabled(False)
         self.radioButton_A3.setGeometry(QtCore.QRect(70, 380, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A3.setFont(font)
+        self.radioButton_A3.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A3.setMouseTracking(False)
         self.radioButton_A3.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A3.setAutoExclusive(False)
@@ -303,9 +277,7 @@ class Ui_MainWindow(object):
         self.line_12.setEnabled(True)
         self.line_12.setGeometry(QtCore.QRect(120, 390, 31, 4))
         self.line_12.setAutoFillBackground(False)
-        self.line_12.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_12.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_12.setFrameShadow(QtGui.QFrame.Plain)
         self.line_12.setLineWidth(0)
         self.line_12.setMidLineWidth(0)
@@ -316,9 +288,7 @@ class Ui_MainWindow(object):
         self.line_13.setEnabled(True)
         self.line_13.setGeometry(QtCore.QRect(210, 390, 27, 4))
         self.line_13.setAutoFillBackground(False)
-        self.line_13.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_13.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_13.setFrameShadow(QtGui.QFrame.Plain)
         self.line_13.setLineWidth(0)
         self.line_13.setMidLineWidth(0)
@@ -329,9 +299,7 @@ class Ui_MainWindow(object):
         self.line_14.setEnabled(True)
         self.line_14.setGeometry(QtCore.QRect(290, 390, 10, 4))
         self.line_14.setAutoFillBackground(False)
-        self.line_14.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_14.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_14.setFrameShadow(QtGui.QFrame.Plain)
         self.line_14.setLineWidth(0)
         self.line_14.setMidLineWidth(0)
@@ -341,10 +309,7 @@ class Ui_MainWindow(object):
         self.radioButton_A6 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A6.setEnabled(False)
         self.radioButton_A6.setGeometry(QtCore.QRect(120, 440, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A6.setFont(font)
+        self.radioButton_A6.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A6.setMouseTracking(False)
         self.radioButton_A6.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A6.setAutoExclusive(False)
@@ -352,10 +317,7 @@ class Ui_MainWindow(object):
         self.radioButton_A7 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A7.setEnabled(False)
         self.radioButton_A7.setGeometry(QtCore.QRect(200, 440, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A7.setFont(font)
+        self.radioButton_A7.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A7.setMouseTracking(False)
         self.radioButton_A7.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A7.setAutoExclusive(False)
@@ -363,10 +325,7 @@ class Ui_MainWindow(object):
         self.radioButton_A8 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_A8.setEnabled(False)
         self.radioButton_A8.setGeometry(QtCore.QRect(280, 440, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A8.setFont(font)
+        self.radioButton_A8.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A8.setMouseTracking(False)
         self.radioButton_A8.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A8.setAutoExclusive(False)
@@ -375,9 +334,7 @@ class Ui_MainWindow(object):
         self.line_7.setEnabled(True)
         self.line_7.setGeometry(QtCore.QRect(140, 470, 4, 31))
         self.line_7.setAutoFillBackground(False)
-        self.line_7.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_7.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_7.setFrameShadow(QtGui.QFrame.Plain)
         self.line_7.setLineWidth(0)
         self.line_7.setMidLineWidth(0)
@@ -388,9 +345,7 @@ class Ui_MainWindow(object):
         self.line_8.setEnabled(True)
         self.line_8.setGeometry(QtCore.QRect(220, 470, 4, 31))
         self.line_8.setAutoFillBackground(False)
-        self.line_8.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_8.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_8.setFrameShadow(QtGui.QFrame.Plain)
         self.line_8.setLineWidth(0)
         self.line_8.setMidLineWidth(0)
@@ -401,9 +356,7 @@ class Ui_MainWindow(object):
         self.line_15.setEnabled(True)
         self.line_15.setGeometry(QtCore.QRect(300, 470, 4, 34))
         self.line_15.setAutoFillBackground(False)
-        self.line_15.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_15.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_15.setFrameShadow(QtGui.QFrame.Plain)
         self.line_15.setLineWidth(0)
         self.line_15.setMidLineWidth(0)
@@ -414,9 +367,7 @@ class Ui_MainWindow(object):
         self.line_16.setEnabled(True)
         self.line_16.setGeometry(QtCore.QRect(120, 500, 181, 4))
         self.line_16.setAutoFillBackground(False)
-        self.line_16.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_16.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_16.setFrameShadow(QtGui.QFrame.Plain)
         self.line_16.setLineWidth(0)
         self.line_16.setMidLineWidth(0)
@@ -426,10 +377,7 @@ class Ui_MainWindow(object):
         self.radioButton_S4 = QtGui.QRadioButton(self.auxiliaryCircuitDock)
         self.radioButton_S4.setEnabled(False)
         self.radioButton_S4.setGeometry(QtCore.QRect(70, 490, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_S4.setFont(font)
+        self.radioButton_S4.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_S4.setMouseTracking(False)
         self.radioButton_S4.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_S4.setAutoExclusive(False)
@@ -438,9 +386,7 @@ class Ui_MainWindow(object):
         self.line_17.setEnabled(True)
         self.line_17.setGeometry(QtCore.QRect(30, 500, 31, 4))
         self.line_17.setAutoFillBackground(False)
-        self.line_17.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_17.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_17.setFrameShadow(QtGui.QFrame.Plain)
         self.line_17.setLineWidth(0)
         self.line_17.setMidLineWidth(0)
@@ -451,9 +397,7 @@ class Ui_MainWindow(object):
         self.line_18.setEnabled(True)
         self.line_18.setGeometry(QtCore.QRect(30, 390, 31, 4))
         self.line_18.setAutoFillBackground(False)
-        self.line_18.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_18.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_18.setFrameShadow(QtGui.QFrame.Plain)
         self.line_18.setLineWidth(0)
         self.line_18.setMidLineWidth(0)
@@ -464,9 +408,7 @@ class Ui_MainWindow(object):
         self.line_19.setEnabled(True)
         self.line_19.setGeometry(QtCore.QRect(30, 10, 4, 491))
         self.line_19.setAutoFillBackground(False)
-        self.line_19.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_19.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_19.setFrameShadow(QtGui.QFrame.Plain)
         self.line_19.setLineWidth(0)
         self.line_19.setMidLineWidth(0)
@@ -477,9 +419,7 @@ class Ui_MainWindow(object):
         self.line_55.setEnabled(True)
         self.line_55.setGeometry(QtCore.QRect(300, 10, 4, 71))
         self.line_55.setAutoFillBackground(False)
-        self.line_55.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_55.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_55.setFrameShadow(QtGui.QFrame.Plain)
         self.line_55.setLineWidth(0)
         self.line_55.setMidLineWidth(0)
@@ -488,32 +428,19 @@ class Ui_MainWindow(object):
         self.line_55.setObjectName(_fromUtf8("line_55"))
         self.label_5 = QtGui.QLabel(self.auxiliaryCircuitDock)
         self.label_5.setGeometry(QtCore.QRect(40, 20, 61, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(6)
-        self.label_5.setFont(font)
+        self.label_5.setFont(sharedFont("Sans Serif", 6))
         self.label_5.setObjectName(_fromUtf8("label_5"))
         self.label_6 = QtGui.QLabel(self.auxiliaryCircuitDock)
         self.label_6.setGeometry(QtCore.QRect(150, 20, 61, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(6)
-        font.setItalic(False)
-        self.label_6.setFont(font)
+        self.label_6.setFont(sharedFont("Sans Serif", 6, italic=False))
         self.label_6.setObjectName(_fromUtf8("label_6"))
         self.label_7 = QtGui.QLabel(self.auxiliaryCircuitDock)
         self.label_7.setGeometry(QtCore.QRect(230, 20, 61, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(6)
-        self.label_7.setFont(font)
+        self.label_7.setFont(sharedFont("Sans Serif", 6))
         self.label_7.setObjectName(_fromUtf8("label_7"))
         self.label_8 = QtGui.QLabel(self.auxiliaryCircuitDock)
         self.label_8.setGeometry(QtCore.QRect(310, 0, 51, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(6)
-        self.label_8.setFont(font)
+        self.label_8.setFont(sharedFont("Sans Serif", 6))
         self.label_8.setObjectName(_fromUtf8("label_8"))
         self.mixtureCircuitDock = QtGui.QGroupBox(self.centralwidget)
         self.mixtureCircuitDock.setGeometry(QtCore.QRect(470, 20, 481, 531))
@@ -527,83 +454,54 @@ class Ui_MainWindow(object):
         self.mixtureCircuitDock.setObjectName(_fromUtf8("mixtureCircuitDock"))
         self.lcdNumber_P4 = QtGui.QLCDNumber(self.mixtureCircuitDock)
         self.lcdNumber_P4.setGeometry(QtCore.QRect(20, 210, 64, 23))
-        self.lcdNumber_P4.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P4.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P4.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P4.setObjectName(_fromUtf8("lcdNumber_P4"))
         self.lcdNumber_P5 = QtGui.QLCDNumber(self.mixtureCircuitDock)
         self.lcdNumber_P5.setGeometry(QtCore.QRect(200, 490, 64, 23))
-        self.lcdNumber_P5.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P5.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P5.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P5.setObjectName(_fromUtf8("lcdNumber_P5"))
         self.lcdNumber_P6 = QtGui.QLCDNumber(self.mixtureCircuitDock)
         self.lcdNumber_P6.setGeometry(QtCore.QRect(140, 310, 64, 23))
-        self.lcdNumber_P6.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P6.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P6.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P6.setObjectName(_fromUtf8("lcdNumber_P6"))
         self.lcdNumber_P7 = QtGui.QLCDNumber(self.mixtureCircuitDock)
         self.lcdNumber_P7.setGeometry(QtCore.QRect(140, 370, 64, 23))
-        self.lcdNumber_P7.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P7.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P7.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P7.setObjectName(_fromUtf8("lcdNumber_P7"))
         self.lcdNumber_P8 = QtGui.QLCDNumber(self.mixtureCircuitDock)
         self.lcdNumber_P8.setGeometry(QtCore.QRect(260, 200, 64, 23))
-        self.lcdNumber_P8.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_P8.setStyleSheet(LCD_STYLE)
         self.lcdNumber_P8.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_P8.setObjectName(_fromUtf8("lcdNumber_P8"))
         self.label_P4 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_P4.setGeometry(QtCore.QRect(20, 190, 21, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(9)
-        self.label_P4.setFont(font)
+        self.label_P4.setFont(sharedFont("Sans Serif", 9))
         self.label_P4.setObjectName(_fromUtf8("label_P4"))
         self.label_P5 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_P5.setGeometry(QtCore.QRect(200, 470, 21, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_P5.setFont(font)
+        self.label_P5.setFont(sharedFont("Sans Serif", 8))
         self.label_P5.setObjectName(_fromUtf8("label_P5"))
         self.label_P6 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_P6.setGeometry(QtCore.QRect(140, 290, 71, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        font.setKerning(True)
-        font.setStyleStrategy(QtGui.QFont.PreferDefault)
-        self.label_P6.setFont(font)
+        self.label_P6.setFont(sharedFont("Sans Serif", 8, kerning=True, strategy=QtGui.QFont.PreferDefault))
         self.label_P6.setObjectName(_fromUtf8("label_P6"))
         self.label_P7 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_P7.setGeometry(QtCore.QRect(140, 350, 71, 16))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_P7.setFont(font)
+        self.label_P7.setFont(sharedFont("Sans Serif", 8))
         self.label_P7.setObjectName(_fromUtf8("label_P7"))
         self.label_P8 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_P8.setGeometry(QtCore.QRect(330, 205, 41, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_P8.setFont(font)
+        self.label_P8.setFont(sharedFont("Sans Serif", 8))
         self.label_P8.setObjectName(_fromUtf8("label_P8"))
         self.line_20 = QtGui.QFrame(self.mixtureCircuitDock)
         self.line_20.setEnabled(True)
         self.line_20.setGeometry(QtCore.QRect(50, 240, 4, 121))
         self.line_20.setAutoFillBackground(False)
-        self.line_20.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_20.setStyleSheet(GREEN_LINE_STYLE)
         self.line_20.setFrameShadow(QtGui.QFrame.Plain)
         self.line_20.setLineWidth(0)
         self.line_20.setMidLineWidth(0)
@@ -613,10 +511,7 @@ class Ui_MainWindow(object):
         self.radioButton_2 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_2.setEnabled(False)
         self.radioButton_2.setGeometry(QtCore.QRect(30, 370, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_2.setFont(font)
+        self.radioButton_2.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_2.setMouseTracking(False)
         self.radioButton_2.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_2.setAutoExclusive(False)
@@ -625,9 +520,7 @@ class Ui_MainWindow(object):
         self.line_21.setEnabled(True)
         self.line_21.setGeometry(QtCore.QRect(50, 400, 4, 41))
         self.line_21.setAutoFillBackground(False)
-        self.line_21.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_21.setStyleSheet(GREEN_LINE_STYLE)
         self.line_21.setFrameShadow(QtGui.QFrame.Plain)
         self.line_21.setLineWidth(0)
         self.line_21.setMidLineWidth(0)
@@ -637,10 +530,7 @@ class Ui_MainWindow(object):
         self.radioButton_3 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_3.setEnabled(False)
         self.radioButton_3.setGeometry(QtCore.QRect(30, 450, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_3.setFont(font)
+        self.radioButton_3.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_3.setMouseTracking(False)
         self.radioButton_3.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_3.setAutoExclusive(False)
@@ -649,9 +539,7 @@ class Ui_MainWindow(object):
         self.line_22.setEnabled(True)
         self.line_22.setGeometry(QtCore.QRect(50, 480, 4, 24))
         self.line_22.setAutoFillBackground(False)
-        self.line_22.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_22.setStyleSheet(GREEN_LINE_STYLE)
         self.line_22.setFrameShadow(QtGui.QFrame.Plain)
         self.line_22.setLineWidth(0)
         self.line_22.setMidLineWidth(0)
@@ -662,9 +550,7 @@ class Ui_MainWindow(object):
         self.line_23.setEnabled(True)
         self.line_23.setGeometry(QtCore.QRect(50, 500, 51, 4))
         self.line_23.setAutoFillBackground(False)
-        self.line_23.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_23.setStyleSheet(GREEN_LINE_STYLE)
         self.line_23.setFrameShadow(QtGui.QFrame.Plain)
         self.line_23.setLineWidth(0)
         self.line_23.setMidLineWidth(0)
@@ -674,10 +560,7 @@ class Ui_MainWindow(object):
         self.radioButton_S3 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_S3.setEnabled(False)
         self.radioButton_S3.setGeometry(QtCore.QRect(110, 490, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_S3.setFont(font)
+        self.radioButton_S3.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_S3.setMouseTracking(False)
         self.radioButton_S3.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_S3.setAutoExclusive(False)
@@ -686,9 +569,7 @@ class Ui_MainWindow(object):
         self.line_24.setEnabled(True)
         self.line_24.setGeometry(QtCore.QRect(160, 500, 31, 4))
         self.line_24.setAutoFillBackground(False)
-        self.line_24.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_24.setStyleSheet(GREEN_LINE_STYLE)
         self.line_24.setFrameShadow(QtGui.QFrame.Plain)
         self.line_24.setLineWidth(0)
         self.line_24.setMidLineWidth(0)
@@ -699,9 +580,7 @@ class Ui_MainWindow(object):
         self.line_25.setEnabled(True)
         self.line_25.setGeometry(QtCore.QRect(270, 500, 181, 4))
         self.line_25.setAutoFillBackground(False)
-        self.line_25.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_25.setStyleSheet(GREEN_LINE_STYLE)
         self.line_25.setFrameShadow(QtGui.QFrame.Plain)
         self.line_25.setLineWidth(0)
         self.line_25.setMidLineWidth(0)
@@ -712,9 +591,7 @@ class Ui_MainWindow(object):
         self.line_26.setEnabled(True)
         self.line_26.setGeometry(QtCore.QRect(320, 480, 4, 24))
         self.line_26.setAutoFillBackground(False)
-        self.line_26.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_26.setStyleSheet(GREEN_LINE_STYLE)
         self.line_26.setFrameShadow(QtGui.QFrame.Plain)
         self.line_26.setLineWidth(0)
         self.line_26.setMidLineWidth(0)
@@ -725,9 +602,7 @@ class Ui_MainWindow(object):
         self.line_27.setEnabled(True)
         self.line_27.setGeometry(QtCore.QRect(390, 480, 4, 24))
         self.line_27.setAutoFillBackground(False)
-        self.line_27.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_27.setStyleSheet(GREEN_LINE_STYLE)
         self.line_27.setFrameShadow(QtGui.QFrame.Plain)
         self.line_27.setLineWidth(0)
         self.line_27.setMidLineWidth(0)
@@ -738,9 +613,7 @@ class Ui_MainWindow(object):
         self.line_28.setEnabled(True)
         self.line_28.setGeometry(QtCore.QRect(450, 480, 4, 24))
         self.line_28.setAutoFillBackground(False)
-        self.line_28.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_28.setStyleSheet(GREEN_LINE_STYLE)
         self.line_28.setFrameShadow(QtGui.QFrame.Plain)
         self.line_28.setLineWidth(0)
         self.line_28.setMidLineWidth(0)
@@ -750,10 +623,7 @@ class Ui_MainWindow(object):
         self.radioButton_4 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_4.setEnabled(False)
         self.radioButton_4.setGeometry(QtCore.QRect(370, 450, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_4.setFont(font)
+        self.radioButton_4.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_4.setMouseTracking(False)
         self.radioButton_4.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_4.setAutoExclusive(False)
@@ -762,9 +632,7 @@ class Ui_MainWindow(object):
         self.line_29.setEnabled(True)
         self.line_29.setGeometry(QtCore.QRect(50, 420, 181, 4))
         self.line_29.setAutoFillBackground(False)
-        self.line_29.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_29.setStyleSheet(GREEN_LINE_STYLE)
         self.line_29.setFrameShadow(QtGui.QFrame.Plain)
         self.line_29.setLineWidth(0)
         self.line_29.setMidLineWidth(0)
@@ -774,10 +642,7 @@ class Ui_MainWindow(object):
         self.radioButton_12 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_12.setEnabled(False)
         self.radioButton_12.setGeometry(QtCore.QRect(240, 410, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_12.setFont(font)
+        self.radioButton_12.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_12.setMouseTracking(False)
         self.radioButton_12.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_12.setAutoExclusive(False)
@@ -785,10 +650,7 @@ class Ui_MainWindow(object):
         self.radioButton_9 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_9.setEnabled(False)
         self.radioButton_9.setGeometry(QtCore.QRect(300, 450, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_9.setFont(font)
+        self.radioButton_9.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_9.setMouseTracking(False)
         self.radioButton_9.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_9.setAutoExclusive(False)
@@ -797,9 +659,7 @@ class Ui_MainWindow(object):
         self.line_30.setEnabled(True)
         self.line_30.setGeometry(QtCore.QRect(320, 370, 4, 71))
         self.line_30.setAutoFillBackground(False)
-        self.line_30.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_30.setStyleSheet(GREEN_LINE_STYLE)
         self.line_30.setFrameShadow(QtGui.QFrame.Plain)
         self.line_30.setLineWidth(0)
         self.line_30.setMidLineWidth(0)
@@ -810,9 +670,7 @@ class Ui_MainWindow(object):
         self.line_31.setEnabled(True)
         self.line_31.setGeometry(QtCore.QRect(290, 420, 31, 4))
         self.line_31.setAutoFillBackground(False)
-        self.line_31.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_31.setStyleSheet(GREEN_LINE_STYLE)
         self.line_31.setFrameShadow(QtGui.QFrame.Plain)
         self.line_31.setLineWidth(0)
         self.line_31.setMidLineWidth(0)
@@ -822,10 +680,7 @@ class Ui_MainWindow(object):
         self.radioButton_10 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_10.setEnabled(False)
         self.radioButton_10.setGeometry(QtCore.QRect(240, 370, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_10.setFont(font)
+        self.radioButton_10.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_10.setMouseTracking(False)
         self.radioButton_10.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_10.setAutoExclusive(False)
@@ -834,9 +689,7 @@ class Ui_MainWindow(object):
         self.line_32.setEnabled(True)
         self.line_32.setGeometry(QtCore.QRect(290, 380, 31, 4))
         self.line_32.setAutoFillBackground(False)
-        self.line_32.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_32.setStyleSheet(GREEN_LINE_STYLE)
         self.line_32.setFrameShadow(QtGui.QFrame.Plain)
         self.line_32.setLineWidth(0)
         self.line_32.setMidLineWidth(0)
@@ -847,9 +700,7 @@ class Ui_MainWindow(object):
         self.line_33.setEnabled(True)
         self.line_33.setGeometry(QtCore.QRect(210, 380, 21, 4))
         self.line_33.setAutoFillBackground(False)
-        self.line_33.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_33.setStyleSheet(GREEN_LINE_STYLE)
         self.line_33.setFrameShadow(QtGui.QFrame.Plain)
         self.line_33.setLineWidth(0)
         self.line_33.setMidLineWidth(0)
@@ -859,10 +710,7 @@ class Ui_MainWindow(object):
         self.radioButton_14 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_14.setEnabled(False)
         self.radioButton_14.setGeometry(QtCore.QRect(300, 340, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_14.setFont(font)
+        self.radioButton_14.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_14.setMouseTracking(False)
         self.radioButton_14.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_14.setAutoExclusive(False)
@@ -871,9 +719,7 @@ class Ui_MainWindow(object):
         self.line_34.setEnabled(True)
         self.line_34.setGeometry(QtCore.QRect(320, 310, 4, 21))
         self.line_34.setAutoFillBackground(False)
-        self.line_34.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_34.setStyleSheet(GREEN_LINE_STYLE)
         self.line_34.setFrameShadow(QtGui.QFrame.Plain)
         self.line_34.setLineWidth(0)
         self.line_34.setMidLineWidth(0)
@@ -884,9 +730,7 @@ class Ui_MainWindow(object):
         self.line_35.setEnabled(True)
         self.line_35.setGeometry(QtCore.QRect(290, 320, 31, 4))
         self.line_35.setAutoFillBackground(False)
-        self.line_35.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_35.setStyleSheet(GREEN_LINE_STYLE)
         self.line_35.setFrameShadow(QtGui.QFrame.Plain)
         self.line_35.setLineWidth(0)
         self.line_35.setMidLineWidth(0)
@@ -896,10 +740,7 @@ class Ui_MainWindow(object):
         self.radioButton_11 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_11.setEnabled(False)
         self.radioButton_11.setGeometry(QtCore.QRect(240, 310, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_11.setFont(font)
+        self.radioButton_11.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_11.setMouseTracking(False)
         self.radioButton_11.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_11.setAutoExclusive(False)
@@ -908,9 +749,7 @@ class Ui_MainWindow(object):
         self.line_36.setEnabled(True)
         self.line_36.setGeometry(QtCore.QRect(210, 320, 21, 4))
         self.line_36.setAutoFillBackground(False)
-        self.line_36.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_36.setStyleSheet(GREEN_LINE_STYLE)
         self.line_36.setFrameShadow(QtGui.QFrame.Plain)
         self.line_36.setLineWidth(0)
         self.line_36.setMidLineWidth(0)
@@ -921,9 +760,7 @@ class Ui_MainWindow(object):
         self.line_37.setEnabled(True)
         self.line_37.setGeometry(QtCore.QRect(390, 400, 4, 41))
         self.line_37.setAutoFillBackground(False)
-        self.line_37.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_37.setStyleSheet(GREEN_LINE_STYLE)
         self.line_37.setFrameShadow(QtGui.QFrame.Plain)
         self.line_37.setLineWidth(0)
         self.line_37.setMidLineWidth(0)
@@ -933,10 +770,7 @@ class Ui_MainWindow(object):
         self.radioButton_15 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_15.setEnabled(False)
         self.radioButton_15.setGeometry(QtCore.QRect(430, 450, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_15.setFont(font)
+        self.radioButton_15.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_15.setMouseTracking(False)
         self.radioButton_15.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_15.setAutoExclusive(False)
@@ -945,9 +779,7 @@ class Ui_MainWindow(object):
         self.line_38.setEnabled(True)
         self.line_38.setGeometry(QtCore.QRect(450, 400, 4, 41))
         self.line_38.setAutoFillBackground(False)
-        self.line_38.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_38.setStyleSheet(GREEN_LINE_STYLE)
         self.line_38.setFrameShadow(QtGui.QFrame.Plain)
         self.line_38.setLineWidth(0)
         self.line_38.setMidLineWidth(0)
@@ -956,25 +788,17 @@ class Ui_MainWindow(object):
         self.line_38.setObjectName(_fromUtf8("line_38"))
         self.label_9 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_9.setGeometry(QtCore.QRect(376, 380, 31, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_9.setFont(font)
+        self.label_9.setFont(sharedFont("Sans Serif", 8))
         self.label_9.setObjectName(_fromUtf8("label_9"))
         self.label_10 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_10.setGeometry(QtCore.QRect(420, 380, 61, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_10.setFont(font)
+        self.label_10.setFont(sharedFont("Sans Serif", 8))
         self.label_10.setObjectName(_fromUtf8("label_10"))
         self.line_39 = QtGui.QFrame(self.mixtureCircuitDock)
         self.line_39.setEnabled(True)
         self.line_39.setGeometry(QtCore.QRect(390, 310, 4, 61))
         self.line_39.setAutoFillBackground(False)
-        self.line_39.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_39.setStyleSheet(GREEN_LINE_STYLE)
         self.line_39.setFrameShadow(QtGui.QFrame.Plain)
         self.line_39.setLineWidth(0)
         self.line_39.setMidLineWidth(0)
@@ -985,9 +809,7 @@ class Ui_MainWindow(object):
         self.line_40.setEnabled(True)
         self.line_40.setGeometry(QtCore.QRect(450, 310, 4, 61))
         self.line_40.setAutoFillBackground(False)
-        self.line_40.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_40.setStyleSheet(GREEN_LINE_STYLE)
         self.line_40.setFrameShadow(QtGui.QFrame.Plain)
         self.line_40.setLineWidth(0)
         self.line_40.setMidLineWidth(0)
@@ -998,9 +820,7 @@ class Ui_MainWindow(object):
         self.line_44.setEnabled(True)
         self.line_44.setGeometry(QtCore.QRect(100, 400, 4, 21))
         self.line_44.setAutoFillBackground(False)
-        self.line_44.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_44.setStyleSheet(GREEN_LINE_STYLE)
         self.line_44.setFrameShadow(QtGui.QFrame.Plain)
         self.line_44.setLineWidth(0)
         self.line_44.setMidLineWidth(0)
@@ -1010,10 +830,7 @@ class Ui_MainWindow(object):
         self.radioButton_8 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_8.setEnabled(False)
         self.radioButton_8.setGeometry(QtCore.QRect(80, 370, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_8.setFont(font)
+        self.radioButton_8.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_8.setMouseTracking(False)
         self.radioButton_8.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_8.setAutoExclusive(False)
@@ -1022,9 +839,7 @@ class Ui_MainWindow(object):
         self.line_45.setEnabled(True)
         self.line_45.setGeometry(QtCore.QRect(100, 250, 4, 111))
         self.line_45.setAutoFillBackground(False)
-        self.line_45.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_45.setStyleSheet(GREEN_LINE_STYLE)
         self.line_45.setFrameShadow(QtGui.QFrame.Plain)
         self.line_45.setLineWidth(0)
         self.line_45.setMidLineWidth(0)
@@ -1034,10 +849,7 @@ class Ui_MainWindow(object):
         self.radioButton_13 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_13.setEnabled(False)
         self.radioButton_13.setGeometry(QtCore.QRect(300, 280, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_13.setFont(font)
+        self.radioButton_13.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_13.setMouseTracking(False)
         self.radioButton_13.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_13.setAutoExclusive(False)
@@ -1045,10 +857,7 @@ class Ui_MainWindow(object):
         self.radioButton_5 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_5.setEnabled(False)
         self.radioButton_5.setGeometry(QtCore.QRect(370, 280, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_5.setFont(font)
+        self.radioButton_5.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_5.setMouseTracking(False)
         self.radioButton_5.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_5.setAutoExclusive(False)
@@ -1056,10 +865,7 @@ class Ui_MainWindow(object):
         self.radioButton_16 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_16.setEnabled(False)
         self.radioButton_16.setGeometry(QtCore.QRect(430, 280, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_16.setFont(font)
+        self.radioButton_16.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_16.setMouseTracking(False)
         self.radioButton_16.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_16.setAutoExclusive(False)
@@ -1068,9 +874,7 @@ class Ui_MainWindow(object):
         self.line_46.setEnabled(True)
         self.line_46.setGeometry(QtCore.QRect(320, 250, 4, 21))
         self.line_46.setAutoFillBackground(False)
-        self.line_46.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_46.setStyleSheet(GREEN_LINE_STYLE)
         self.line_46.setFrameShadow(QtGui.QFrame.Plain)
         self.line_46.setLineWidth(0)
         self.line_46.setMidLineWidth(0)
@@ -1081,9 +885,7 @@ class Ui_MainWindow(object):
         self.line_47.setEnabled(True)
         self.line_47.setGeometry(QtCore.QRect(390, 250, 4, 21))
         self.line_47.setAutoFillBackground(False)
-        self.line_47.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_47.setStyleSheet(GREEN_LINE_STYLE)
         self.line_47.setFrameShadow(QtGui.QFrame.Plain)
         self.line_47.setLineWidth(0)
         self.line_47.setMidLineWidth(0)
@@ -1094,9 +896,7 @@ class Ui_MainWindow(object):
         self.line_48.setEnabled(True)
         self.line_48.setGeometry(QtCore.QRect(450, 250, 4, 21))
         self.line_48.setAutoFillBackground(False)
-        self.line_48.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_48.setStyleSheet(GREEN_LINE_STYLE)
         self.line_48.setFrameShadow(QtGui.QFrame.Plain)
         self.line_48.setLineWidth(0)
         self.line_48.setMidLineWidth(0)
@@ -1107,9 +907,7 @@ class Ui_MainWindow(object):
         self.line_49.setEnabled(True)
         self.line_49.setGeometry(QtCore.QRect(60, 250, 391, 4))
         self.line_49.setAutoFillBackground(False)
-        self.line_49.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_49.setStyleSheet(GREEN_LINE_STYLE)
         self.line_49.setFrameShadow(QtGui.QFrame.Plain)
         self.line_49.setLineWidth(0)
         self.line_49.setMidLineWidth(0)
@@ -1120,9 +918,7 @@ class Ui_MainWindow(object):
         self.line_51.setEnabled(True)
         self.line_51.setGeometry(QtCore.QRect(290, 230, 4, 20))
         self.line_51.setAutoFillBackground(False)
-        self.line_51.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_51.setStyleSheet(GREEN_LINE_STYLE)
         self.line_51.setFrameShadow(QtGui.QFrame.Plain)
         self.line_51.setLineWidth(0)
         self.line_51.setMidLineWidth(0)
@@ -1133,9 +929,7 @@ class Ui_MainWindow(object):
         self.line_52.setEnabled(True)
         self.line_52.setGeometry(QtCore.QRect(50, 180, 4, 21))
         self.line_52.setAutoFillBackground(False)
-        self.line_52.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_52.setStyleSheet(GREEN_LINE_STYLE)
         self.line_52.setFrameShadow(QtGui.QFrame.Plain)
         self.line_52.setLineWidth(0)
         self.line_52.setMidLineWidth(0)
@@ -1146,9 +940,7 @@ class Ui_MainWindow(object):
         self.line_53.setEnabled(True)
         self.line_53.setGeometry(QtCore.QRect(50, 190, 91, 4))
         self.line_53.setAutoFillBackground(False)
-        self.line_53.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_53.setStyleSheet(GREEN_LINE_STYLE)
         self.line_53.setFrameShadow(QtGui.QFrame.Plain)
         self.line_53.setLineWidth(0)
         self.line_53.setMidLineWidth(0)
@@ -1158,10 +950,7 @@ class Ui_MainWindow(object):
         self.radioButton_0 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_0.setEnabled(False)
         self.radioButton_0.setGeometry(QtCore.QRect(30, 150, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_0.setFont(font)
+        self.radioButton_0.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_0.setMouseTracking(False)
         self.radioButton_0.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_0.setAutoExclusive(False)
@@ -1170,9 +959,7 @@ class Ui_MainWindow(object):
         self.line_54.setEnabled(True)
         self.line_54.setGeometry(QtCore.QRect(50, 120, 4, 21))
         self.line_54.setAutoFillBackground(False)
-        self.line_54.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_54.setStyleSheet(GREEN_LINE_STYLE)
         self.line_54.setFrameShadow(QtGui.QFrame.Plain)
         self.line_54.setLineWidth(0)
         self.line_54.setMidLineWidth(0)
@@ -1182,10 +969,7 @@ class Ui_MainWindow(object):
         self.radioButton_S1 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_S1.setEnabled(False)
         self.radioButton_S1.setGeometry(QtCore.QRect(30, 90, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_S1.setFont(font)
+        self.radioButton_S1.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_S1.setMouseTracking(False)
         self.radioButton_S1.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_S1.setAutoExclusive(False)
@@ -1194,9 +978,7 @@ class Ui_MainWindow(object):
         self.line_58.setEnabled(True)
         self.line_58.setGeometry(QtCore.QRect(50, 60, 4, 21))
         self.line_58.setAutoFillBackground(False)
-        self.line_58.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_58.setStyleSheet(GREEN_LINE_STYLE)
         self.line_58.setFrameShadow(QtGui.QFrame.Plain)
         self.line_58.setLineWidth(0)
         self.line_58.setMidLineWidth(0)
@@ -1207,9 +989,7 @@ class Ui_MainWindow(object):
         self.line_59.setEnabled(True)
         self.line_59.setGeometry(QtCore.QRect(50, 70, 91, 4))
         self.line_59.setAutoFillBackground(False)
-        self.line_59.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_59.setStyleSheet(GREEN_LINE_STYLE)
         self.line_59.setFrameShadow(QtGui.QFrame.Plain)
         self.line_59.setLineWidth(0)
         self.line_59.setMidLineWidth(0)
@@ -1220,9 +1000,7 @@ class Ui_MainWindow(object):
         self.line_60.setEnabled(True)
         self.line_60.setGeometry(QtCore.QRect(140, 70, 4, 11))
         self.line_60.setAutoFillBackground(False)
-        self.line_60.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_60.setStyleSheet(GREEN_LINE_STYLE)
         self.line_60.setFrameShadow(QtGui.QFrame.Plain)
         self.line_60.setLineWidth(0)
         self.line_60.setMidLineWidth(0)
@@ -1232,10 +1010,7 @@ class Ui_MainWindow(object):
         self.radioButton_S2 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_S2.setEnabled(False)
         self.radioButton_S2.setGeometry(QtCore.QRect(120, 90, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_S2.setFont(font)
+        self.radioButton_S2.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_S2.setMouseTracking(False)
         self.radioButton_S2.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_S2.setAutoExclusive(False)
@@ -1244,9 +1019,7 @@ class Ui_MainWindow(object):
         self.line_61.setEnabled(True)
         self.line_61.setGeometry(QtCore.QRect(140, 120, 4, 21))
         self.line_61.setAutoFillBackground(False)
-        self.line_61.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_61.setStyleSheet(GREEN_LINE_STYLE)
         self.line_61.setFrameShadow(QtGui.QFrame.Plain)
         self.line_61.setLineWidth(0)
         self.line_61.setMidLineWidth(0)
@@ -1256,10 +1029,7 @@ class Ui_MainWindow(object):
         self.radioButton_1 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_1.setEnabled(False)
         self.radioButton_1.setGeometry(QtCore.QRect(120, 150, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_1.setFont(font)
+        self.radioButton_1.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_1.setMouseTracking(False)
         self.radioButton_1.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_1.setAutoExclusive(False)
@@ -1268,9 +1038,7 @@ class Ui_MainWindow(object):
         self.line_62.setEnabled(True)
         self.line_62.setGeometry(QtCore.QRect(140, 180, 4, 14))
         self.line_62.setAutoFillBackground(False)
-        self.line_62.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_62.setStyleSheet(GREEN_LINE_STYLE)
         self.line_62.setFrameShadow(QtGui.QFrame.Plain)
         self.line_62.setLineWidth(0)
         self.line_62.setMidLineWidth(0)
@@ -1279,19 +1047,13 @@ class Ui_MainWindow(object):
         self.line_62.setObjectName(_fromUtf8("line_62"))
         self.label_11 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_11.setGeometry(QtCore.QRect(30, 40, 41, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        font.setItalic(False)
-        self.label_11.setFont(font)
+        self.label_11.setFont(sharedFont("Sans Serif", 8, italic=False))
         self.label_11.setObjectName(_fromUtf8("label_11"))
         self.line_63 = QtGui.QFrame(self.mixtureCircuitDock)
         self.line_63.setEnabled(True)
         self.line_63.setGeometry(QtCore.QRect(50, 10, 4, 21))
         self.line_63.setAutoFillBackground(False)
-        self.line_63.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_63.setStyleSheet(GREEN_LINE_STYLE)
         self.line_63.setFrameShadow(QtGui.QFrame.Plain)
         self.line_63.setLineWidth(0)
         self.line_63.setMidLineWidth(0)
@@ -1302,9 +1064,7 @@ class Ui_MainWindow(object):
         self.line_64.setEnabled(True)
         self.line_64.setGeometry(QtCore.QRect(50, 20, 151, 4))
         self.line_64.setAutoFillBackground(False)
-        self.line_64.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_64.setStyleSheet(GREEN_LINE_STYLE)
         self.line_64.setFrameShadow(QtGui.QFrame.Plain)
         self.line_64.setLineWidth(0)
         self.line_64.setMidLineWidth(0)
@@ -1315,9 +1075,7 @@ class Ui_MainWindow(object):
         self.line_65.setEnabled(True)
         self.line_65.setGeometry(QtCore.QRect(200, 20, 4, 101))
         self.line_65.setAutoFillBackground(False)
-        self.line_65.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_65.setStyleSheet(GREEN_LINE_STYLE)
         self.line_65.setFrameShadow(QtGui.QFrame.Plain)
         self.line_65.setLineWidth(0)
         self.line_65.setMidLineWidth(0)
@@ -1327,10 +1085,7 @@ class Ui_MainWindow(object):
         self.radioButton_17 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_17.setEnabled(False)
         self.radioButton_17.setGeometry(QtCore.QRect(180, 130, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_17.setFont(font)
+        self.radioButton_17.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_17.setMouseTracking(False)
         self.radioButton_17.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_17.setAutoExclusive(False)
@@ -1339,9 +1094,7 @@ class Ui_MainWindow(object):
         self.line_66.setEnabled(True)
         self.line_66.setGeometry(QtCore.QRect(200, 160, 4, 12))
         self.line_66.setAutoFillBackground(False)
-        self.line_66.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_66.setStyleSheet(GREEN_LINE_STYLE)
         self.line_66.setFrameShadow(QtGui.QFrame.Plain)
         self.line_66.setLineWidth(0)
         self.line_66.setMidLineWidth(0)
@@ -1352,9 +1105,7 @@ class Ui_MainWindow(object):
         self.line_67.setEnabled(True)
         self.line_67.setGeometry(QtCore.QRect(200, 170, 134, 4))
         self.line_67.setAutoFillBackground(False)
-        self.line_67.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_67.setStyleSheet(GREEN_LINE_STYLE)
         self.line_67.setFrameShadow(QtGui.QFrame.Plain)
         self.line_67.setLineWidth(0)
         self.line_67.setMidLineWidth(0)
@@ -1365,9 +1116,7 @@ class Ui_MainWindow(object):
         self.line_68.setEnabled(True)
         self.line_68.setGeometry(QtCore.QRect(250, 130, 4, 41))
         self.line_68.setAutoFillBackground(False)
-        self.line_68.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_68.setStyleSheet(GREEN_LINE_STYLE)
         self.line_68.setFrameShadow(QtGui.QFrame.Plain)
         self.line_68.setLineWidth(0)
         self.line_68.setMidLineWidth(0)
@@ -1378,9 +1127,7 @@ class Ui_MainWindow(object):
         self.line_69.setEnabled(True)
         self.line_69.setGeometry(QtCore.QRect(330, 130, 4, 41))
         self.line_69.setAutoFillBackground(False)
-        self.line_69.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_69.setStyleSheet(GREEN_LINE_STYLE)
         self.line_69.setFrameShadow(QtGui.QFrame.Plain)
         self.line_69.setLineWidth(0)
         self.line_69.setMidLineWidth(0)
@@ -1391,9 +1138,7 @@ class Ui_MainWindow(object):
         self.line_70.setEnabled(True)
         self.line_70.setGeometry(QtCore.QRect(290, 170, 4, 21))
         self.line_70.setAutoFillBackground(False)
-        self.line_70.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_70.setStyleSheet(GREEN_LINE_STYLE)
         self.line_70.setFrameShadow(QtGui.QFrame.Plain)
         self.line_70.setLineWidth(0)
         self.line_70.setMidLineWidth(0)
@@ -1403,10 +1148,7 @@ class Ui_MainWindow(object):
         self.radioButton_6 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_6.setEnabled(False)
         self.radioButton_6.setGeometry(QtCore.QRect(230, 100, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_6.setFont(font)
+        self.radioButton_6.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_6.setMouseTracking(False)
         self.radioButton_6.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_6.setAutoExclusive(False)
@@ -1414,10 +1156,7 @@ class Ui_MainWindow(object):
         self.radioButton_7 = QtGui.QRadioButton(self.mixtureCircuitDock)
         self.radioButton_7.setEnabled(False)
         self.radioButton_7.setGeometry(QtCore.QRect(310, 100, 41, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_7.setFont(font)
+        self.radioButton_7.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_7.setMouseTracking(False)
         self.radioButton_7.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_7.setAutoExclusive(False)
@@ -1426,9 +1165,7 @@ class Ui_MainWindow(object):
         self.line_71.setEnabled(True)
         self.line_71.setGeometry(QtCore.QRect(250, 10, 4, 81))
         self.line_71.setAutoFillBackground(False)
-        self.line_71.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_71.setStyleSheet(GREEN_LINE_STYLE)
         self.line_71.setFrameShadow(QtGui.QFrame.Plain)
         self.line_71.setLineWidth(0)
         self.line_71.setMidLineWidth(0)
@@ -1439,9 +1176,7 @@ class Ui_MainWindow(object):
         self.line_72.setEnabled(True)
         self.line_72.setGeometry(QtCore.QRect(330, 10, 4, 81))
         self.line_72.setAutoFillBackground(False)
-        self.line_72.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_72.setStyleSheet(GREEN_LINE_STYLE)
         self.line_72.setFrameShadow(QtGui.QFrame.Plain)
         self.line_72.setLineWidth(0)
         self.line_72.setMidLineWidth(0)
@@ -1450,32 +1185,21 @@ class Ui_MainWindow(object):
         self.line_72.setObjectName(_fromUtf8("line_72"))
         self.label_12 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_12.setGeometry(QtCore.QRect(60, 0, 51, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(6)
-        self.label_12.setFont(font)
+        self.label_12.setFont(sharedFont("Sans Serif", 6))
         self.label_12.setObjectName(_fromUtf8("label_12"))
         self.label_13 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_13.setGeometry(QtCore.QRect(260, 20, 51, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(6)
-        self.label_13.setFont(font)
+        self.label_13.setFont(sharedFont("Sans Serif", 6))
         self.label_13.setObjectName(_fromUtf8("label_13"))
         self.label_14 = QtGui.QLabel(self.mixtureCircuitDock)
         self.label_14.setGeometry(QtCore.QRect(340, 20, 51, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(6)
-        self.label_14.setFont(font)
+        self.label_14.setFont(sharedFont("Sans Serif", 6))
         self.label_14.setObjectName(_fromUtf8("label_14"))
         self.line_42 = QtGui.QFrame(self.centralwidget)
         self.line_42.setEnabled(True)
         self.line_42.setGeometry(QtCore.QRect(420, 340, 4, 34))
         self.line_42.setAutoFillBackground(False)
-        self.line_42.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_42.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_42.setFrameShadow(QtGui.QFrame.Plain)
         self.line_42.setLineWidth(0)
         self.line_42.setMidLineWidth(0)
@@ -1485,10 +1209,7 @@ class Ui_MainWindow(object):
         self.radioButton_A9 = QtGui.QRadioButton(self.centralwidget)
         self.radioButton_A9.setEnabled(False)
         self.radioButton_A9.setGeometry(QtCore.QRect(400, 310, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A9.setFont(font)
+        self.radioButton_A9.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A9.setMouseTracking(False)
         self.radioButton_A9.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A9.setAutoExclusive(False)
@@ -1497,9 +1218,7 @@ class Ui_MainWindow(object):
         self.line_43.setEnabled(True)
         self.line_43.setGeometry(QtCore.QRect(420, 270, 4, 31))
         self.line_43.setAutoFillBackground(False)
-        self.line_43.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_43.setStyleSheet(GREEN_LINE_STYLE)
         self.line_43.setFrameShadow(QtGui.QFrame.Plain)
         self.line_43.setLineWidth(0)
         self.line_43.setMidLineWidth(0)
@@ -1509,10 +1228,7 @@ class Ui_MainWindow(object):
         self.radioButton_A10 = QtGui.QRadioButton(self.centralwidget)
         self.radioButton_A10.setEnabled(False)
         self.radioButton_A10.setGeometry(QtCore.QRect(400, 30, 51, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.radioButton_A10.setFont(font)
+        self.radioButton_A10.setFont(sharedFont("Sans Serif", 8))
         self.radioButton_A10.setMouseTracking(False)
         self.radioButton_A10.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_A10.setAutoExclusive(False)
@@ -1521,9 +1237,7 @@ class Ui_MainWindow(object):
         self.line_57.setEnabled(True)
         self.line_57.setGeometry(QtCore.QRect(460, 40, 61, 4))
         self.line_57.setAutoFillBackground(False)
-        self.line_57.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_57.setStyleSheet(GREEN_LINE_STYLE)
         self.line_57.setFrameShadow(QtGui.QFrame.Plain)
         self.line_57.setLineWidth(0)
         self.line_57.setMidLineWidth(0)
@@ -1534,9 +1248,7 @@ class Ui_MainWindow(object):
         self.line_50.setEnabled(True)
         self.line_50.setGeometry(QtCore.QRect(420, 270, 91, 4))
         self.line_50.setAutoFillBackground(False)
-        self.line_50.setStyleSheet(_fromUtf8("color: rgb(0, 170, 0);\n"
-"background-color: rgb(0, 170, 0);\n"
-"border-color: rgb(0, 170, 0);"))
+        self.line_50.setStyleSheet(GREEN_LINE_STYLE)
         self.line_50.setFrameShadow(QtGui.QFrame.Plain)
         self.line_50.setLineWidth(0)
         self.line_50.setMidLineWidth(0)
@@ -1545,70 +1257,46 @@ class Ui_MainWindow(object):
         self.line_50.setObjectName(_fromUtf8("line_50"))
         self.maxiGaugeDock = QtGui.QGroupBox(self.centralwidget)
         self.maxiGaugeDock.setGeometry(QtCore.QRect(381, 565, 181, 125))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(9)
-        self.maxiGaugeDock.setFont(font)
+        self.maxiGaugeDock.setFont(sharedFont("Sans Serif", 9))
         self.maxiGaugeDock.setObjectName(_fromUtf8("maxiGaugeDock"))
         self.lcdNumber_IVC = QtGui.QLCDNumber(self.maxiGaugeDock)
         self.lcdNumber_IVC.setGeometry(QtCore.QRect(50, 30, 64, 23))
-        self.lcdNumber_IVC.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_IVC.setStyleSheet(LCD_STYLE)
         self.lcdNumber_IVC.setSmallDecimalPoint(True)
         self.lcdNumber_IVC.setNumDigits(6)
         self.lcdNumber_IVC.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_IVC.setObjectName(_fromUtf8("lcdNumber_IVC"))
         self.lcdNumber_STIL = QtGui.QLCDNumber(self.maxiGaugeDock)
         self.lcdNumber_STIL.setGeometry(QtCore.QRect(50, 70, 64, 23))
-        self.lcdNumber_STIL.setStyleSheet(_fromUtf8("background-color: rgb(0, 0, 0);\n"
-"color: rgb(0, 255, 0);\n"
-"font: 10pt \"Arial\";"))
+        self.lcdNumber_STIL.setStyleSheet(LCD_STYLE)
         self.lcdNumber_STIL.setSmallDecimalPoint(True)
         self.lcdNumber_STIL.setNumDigits(6)
         self.lcdNumber_STIL.setSegmentStyle(QtGui.QLCDNumber.Flat)
         self.lcdNumber_STIL.setObjectName(_fromUtf8("lcdNumber_STIL"))
         self.label = QtGui.QLabel(self.maxiGaugeDock)
         self.label.setGeometry(QtCore.QRect(10, 33, 31, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label.setFont(font)
+        self.label.setFont(sharedFont("Sans Serif", 8))
         self.label.setObjectName(_fromUtf8("label"))
         self.label_2 = QtGui.QLabel(self.maxiGaugeDock)
         self.label_2.setGeometry(QtCore.QRect(10, 73, 41, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_2.setFont(font)
+        self.label_2.setFont(sharedFont("Sans Serif", 8))
         self.label_2.setObjectName(_fromUtf8("label_2"))
         self.label_3 = QtGui.QLabel(self.maxiGaugeDock)
         self.label_3.setGeometry(QtCore.QRect(120, 38, 51, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_3.setFont(font)
+        self.label_3.setFont(sharedFont("Sans Serif", 8))
         self.label_3.setObjectName(_fromUtf8("label_3"))
         self.label_4 = QtGui.QLabel(self.maxiGaugeDock)
         self.label_4.setGeometry(QtCore.QRect(120, 78, 51, 17))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(8)
-        self.label_4.setFont(font)
+        self.label_4.setFont(sharedFont("Sans Serif", 8))
         self.label_4.setObjectName(_fromUtf8("label_4"))
         self.systemStatusDock = QtGui.QGroupBox(self.centralwidget)
         self.systemStatusDock.setGeometry(QtCore.QRect(10, 565, 361, 125))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(9)
-        self.systemStatusDock.setFont(font)
+        self.systemStatusDock.setFont(sharedFont("Sans Serif", 9))
         self.systemStatusDock.setObjectName(_fromUtf8("systemStatusDock"))
         self.radioButton_Start = QtGui.QRadioButton(self.systemStatusDock)
         self.radioButton_Start.setEnabled(False)
         self.radioButton_Start.setGeometry(QtCore.QRect(10, 30, 81, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        self.radioButton_Start.setFont(font)
+        self.radioButton_Start.setFont(sharedFont("Sans Serif"))
         self.radioButton_Start.setMouseTracking(False)
         self.radioButton_Start.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_Start.setChecked(False)
@@ -1619,9 +1307,7 @@ class Ui_MainWindow(object):
         self.radioButton_He3 = QtGui.QRadioButton(self.systemStatusDock)
         self.radioButton_He3.setEnabled(False)
         self.radioButton_He3.setGeometry(QtCore.QRect(280, 60, 61, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        self.radioButton_He3.setFont(font)
+        self.radioButton_He3.setFont(sharedFont("Sans Serif"))
         self.radioButton_He3.setMouseTracking(False)
         self.radioButton_He3.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_He3.setAutoExclusive(False)
@@ -1629,9 +1315,7 @@ class Ui_MainWindow(object):
         self.radioButton_He4 = QtGui.QRadioButton(self.systemStatusDock)
         self.radioButton_He4.setEnabled(False)
         self.radioButton_He4.setGeometry(QtCore.QRect(280, 30, 61, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        self.radioButton_He4.setFont(font)
+        self.radioButton_He4.setFont(sharedFont("Sans Serif"))
         self.radioButton_He4.setMouseTracking(False)
         self.radioButton_He4.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_He4.setAutoExclusive(False)
@@ -1639,9 +1323,7 @@ class Ui_MainWindow(object):
         self.radioButton_Norm = QtGui.QRadioButton(self.systemStatusDock)
         self.radioButton_Norm.setEnabled(False)
         self.radioButton_Norm.setGeometry(QtCore.QRect(120, 30, 161, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        self.radioButton_Norm.setFont(font)
+        self.radioButton_Norm.setFont(sharedFont("Sans Serif"))
         self.radioButton_Norm.setMouseTracking(False)
         self.radioButton_Norm.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_Norm.setAutoExclusive(False)
@@ -1649,9 +1331,7 @@ class Ui_MainWindow(object):
         self.radioButton_Rec = QtGui.QRadioButton(self.systemStatusDock)
         self.radioButton_Rec.setEnabled(False)
         self.radioButton_Rec.setGeometry(QtCore.QRect(120, 60, 91, 22))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        self.radioButton_Rec.setFont(font)
+        self.radioButton_Rec.setFont(sharedFont("Sans Serif"))
         self.radioButton_Rec.setMouseTracking(False)
         self.radioButton_Rec.setFocusPolicy(QtCore.Qt.NoFocus)
         self.radioButton_Rec.setAutoExclusive(False)
@@ -1684,40 +1364,26 @@ class Ui_MainWindow(object):
         self.line_73.setObjectName(_fromUtf8("line_73"))
         self.logDock = QtGui.QGroupBox(self.centralwidget)
         self.logDock.setGeometry(QtCore.QRect(572, 565, 371, 101))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(9)
-        self.logDock.setFont(font)
+        self.logDock.setFont(sharedFont("Sans Serif", 9))
         self.logDock.setObjectName(_fromUtf8("logDock"))
         self.textBrowser = QtGui.QTextBrowser(self.logDock)
         self.textBrowser.setGeometry(QtCore.QRect(10, 30, 361, 61))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Arial"))
-        font.setPointSize(8)
-        self.textBrowser.setFont(font)
+        self.textBrowser.setFont(sharedFont("Arial", 8))
         self.textBrowser.setObjectName(_fromUtf8("textBrowser"))
         self.startButton = QtGui.QPushButton(self.centralwidget)
         self.startButton.setGeometry(QtCore.QRect(580, 670, 95, 21))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(9)
-        self.startButton.setFont(font)
+        self.startButton.setFont(sharedFont("Sans Serif", 9))
         self.startButton.setObjectName(_fromUtf8("startButton"))
         self.stopButton = QtGui.QPushButton(self.centralwidget)
         self.stopButton.setEnabled(False)
         self.stopButton.setGeometry(QtCore.QRect(690, 670, 95, 21))
-        font = QtGui.QFont()
-        font.setFamily(_fromUtf8("Sans Serif"))
-        font.setPointSize(9)
-        self.stopButton.setFont(font)
+        self.stopButton.setFont(sharedFont("Sans Serif", 9))
         self.stopButton.setObjectName(_fromUtf8("stopButton"))
         self.line_41 = QtGui.QFrame(self.centralwidget)
         self.line_41.setEnabled(True)
         self.line_41.setGeometry(QtCore.QRect(310, 370, 111, 4))
         self.line_41.setAutoFillBackground(False)
-        self.line_41.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_41.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_41.setFrameShadow(QtGui.QFrame.Plain)
         self.line_41.setLineWidth(0)
         self.line_41.setMidLineWidth(0)
@@ -1728,9 +1394,7 @@ class Ui_MainWindow(object):
         self.line_56.setEnabled(True)
         self.line_56.setGeometry(QtCore.QRect(310, 40, 81, 4))
         self.line_56.setAutoFillBackground(False)
-        self.line_56.setStyleSheet(_fromUtf8("color: rgb(255, 255, 0);\n"
-"border-color: rgb(255, 255, 0);\n"
-"background-color: rgb(255, 255, 0);"))
+        self.line_56.setStyleSheet(YELLOW_LINE_STYLE)
         self.line_56.setFrameShadow(QtGui.QFrame.Plain)
         self.line_56.setLineWidth(0)
         self.line_56.setMidLineWidth(0)
@@ -1744,6 +1408,8 @@ class Ui_MainWindow(object):
         self.menubar.setObjectName(_fromUtf8("menubar"))
         self.menuSettings = QtGui.QMenu(self.menubar)
         self.menuSettings.setObjectName(_fromUtf8("menuSettings"))
+        self.menuView = QtGui.QMenu(self.menubar)
+        self.menuView.setObjectName(_fromUtf8("menuView"))
         self.menuHelp = QtGui.QMenu(self.menubar)
         self.menuHelp.setObjectName(_fromUtf8("menuHelp"))
         MainWindow.setMenuBar(self.menubar)
@@ -1753,14 +1419,20 @@ class Ui_MainWindow(object):
         self.actionNewPorts = QtGui.QAction(MainWindow)
         self.actionNewPorts.setObjectName(_fromUtf8("actionNewPorts"))
         self.actionLogs = QtGui.QAction(MainWindow)
-        self.actionLogs.setEnabled(False)
         self.actionLogs.setObjectName(_fromUtf8("actionLogs"))
         self.actionAbout = QtGui.QAction(MainWindow)
         self.actionAbout.setObjectName(_fromUtf8("actionAbout"))
+        self.actionStats = QtGui.QAction(MainWindow)
+        self.actionStats.setObjectName(_fromUtf8("actionStats"))
+        self.actionTrends = QtGui.QAction(MainWindow)
+        self.actionTrends.setObjectName(_fromUtf8("actionTrends"))
         self.menuSettings.addAction(self.actionLogs)
         self.menuSettings.addAction(self.actionNewPorts)
+        self.menuView.addAction(self.actionTrends)
+        self.menuHelp.addAction(self.actionStats)
         self.menuHelp.addAction(self.actionAbout)
         self.menubar.addAction(self.menuSettings.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
         self.menubar.addAction(self.menuHelp.menuAction())
 
         self.retranslateUi(MainWindow)
@@ -1838,8 +1510,11 @@ class Ui_MainWindow(object):
         self.startButton.setText(_translate("MainWindow", "&Start", None))
         self.stopButton.setText(_translate("MainWindow", "S&top", None))
         self.menuSettings.setTitle(_translate("MainWindow", "S&ettings", None))
+        self.menuView.setTitle(_translate("MainWindow", "&View", None))
         self.menuHelp.setTitle(_translate("MainWindow", "&?", None))
         self.actionNewPorts.setText(_translate("MainWindow", "&Ports...", None))
         self.actionLogs.setText(_translate("MainWindow", "&Logs...", None))
         self.actionAbout.setText(_translate("MainWindow", "&About", None))
+        self.actionStats.setText(_translate("MainWindow", "Link &statistics...", None))
+        self.actionTrends.setText(_translate("MainWindow", "&Trends...", None))
 
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+History.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+In-memory history of the acquisition in a preallocated NumPy ring
+buffer. Every row holds the time, the 8 panel ADC channels calibrated
+and as raw counts, the 6 gauge pressures with their status and the
+KEYS? map packed into 64 bits.
+Streams arriving at different rates are merged by carrying the latest
+value of the others forward, and of every gauge sensor that wasn't read
+(NaN) in a PRESSURES sample. Samples of the different devices can come
+in slightly out of time order, so the times of the rows are not sorted.
+
+Every row is written twice, at i and i + capacity, so that the latest
+rows are always one contiguous slice, copied in one go by last().
+Both last() and window() return copies taken under the lock, a writer
+never changes rows a reader holds.
+
+History.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+History.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+
+- This module depends on NumPy
+"""
+
+import numpy
+from threading import Lock
+from MicroTask import KeyState
+
+HISTORY_DTYPE = numpy.dtype([
+  ('time', 'f8'),          # seconds since the epoch
+  ('adc', 'f4', (8,)),     # panel ADC channels P1 ... P8, calibrated
+  ('raw', 'i4', (8,)),     # the raw counts they were calibrated from
+  ('pressure', 'f8', (6,)),# MaxiGauge sensors 1 ... 6, mbar
+  ('status', 'i1', (6,)),  # PRESSURE_READING_STATUS, -1 if unknown
+  ('keys', 'u8'),          # bit i set when KEYS? entry i is 2, see KeyState
+  ('keymask', 'u8'),       # bit i set when KEYS? entry i is valid
+])
+
+DEFAULT_CAPACITY = 2**18   # a row per ADC, KEYS and PRESSURES sample: about one day at 1 Hz, 74 MB
+
+class History(object):
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.lock = Lock()
+        self.data = numpy.zeros(2 * capacity, dtype=HISTORY_DTYPE)
+        self.current = numpy.zeros(1, dtype=HISTORY_DTYPE)
+        self.current['pressure'] = float('nan')
+        self.current['status'] = -1
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, timestamp):
+        # stores the current row, O(1)
+        with self.lock:
+            self.current['time'] = timestamp
+            self.data[self.head] = self.current[0]
+            self.data[self.head + self.capacity] = self.current[0]
+            self.head = (self.head + 1) % self.capacity
+            self.count += 1
+
+    def record(self, sample):
+        # SampleBus subscriber
+        if sample.error is not None:
+            # a failed gauge reading leaves a visible gap, not stale values
+            if sample.stream == 'PRESSURES':
+                with self.lock:
+                    self.current['pressure'] = float('nan')
+                    self.current['status'] = -1
+            return
+        with self.lock:
+            if sample.stream == 'ADCRAW':
+                # comes just before its ADC sample, which appends the row
+                self.current['raw'] = sample.values
+                return
+            elif sample.stream == 'PRESSURESTATUS':
+                # the same for the PRESSURES sample
+                self.current['status'] = sample.values
+                return
+            elif sample.stream == 'ADC':
+                self.current['adc'] = sample.values
+            elif sample.stream == 'KEYS':
+                state = KeyState.fromKeys(sample.values)
+                self.current['keys'] = state.word
+                self.current['keymask'] = state.mask
+            elif sample.stream == 'PRESSURES':
+                values = numpy.asarray(sample.values, 'f8')
+                read = ~numpy.isnan(values)
+                self.current['pressure'][0][read] = values[read]
+            else:
+                return
+        self.append(sample.timestamp)
+
+    def latest(self, n):
+        # view of the latest n rows, oldest first, the lock must be held
+        n = len(self) if n is None else min(n, len(self))
+        end = self.head + self.capacity
+        return self.data[end - n:end]
+
+    def last(self, n=None):
+        # copy of the latest n rows, oldest first
+        with self.lock:
+            return self.latest(n).copy()
+
+    def window(self, start, stop=None):
+        # copy of the rows with start <= time < stop, in the order they were stored
+        with self.lock:
+            rows = self.latest(None)
+            times = rows['time']
+            selected = times >= start
+            if stop is not None:
+                selected &= times < stop
+            return rows[selected]
+
+    def recalibrate(self, calibration):
+        # recomputes the calibrated ADC values of the whole history from the raw counts
+        with self.lock:
+            self.data['adc'] = calibration.apply(self.data['raw'])
+            self.current['adc'] = calibration.apply(self.current['raw'])
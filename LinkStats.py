@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+LinkStats.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Timing statistics of the serial links: a latency histogram, the bytes
+moved, errors and timeouts of every command sent to the GHS panel and
+the MaxiGauge, the reconnect attempts of every device, and how late
+every poll stream starts compared with its deadline.
+
+LinkStats.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LinkStats.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import time
+from bisect import bisect_right
+from threading import Lock
+
+### Upper edges of the histogram bins in seconds, the last bin is open
+LATENCY_BINS = [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1., 2., 5.]
+
+class Timing(object):
+    __slots__ = ('count', 'errors', 'timeouts', 'bytesOut', 'bytesIn', 'total', 'maximum', 'bins')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytesOut = 0
+        self.bytesIn = 0
+        self.total = 0.
+        self.maximum = 0.
+        self.bins = [0] * (len(LATENCY_BINS) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        self.bins[bisect_right(LATENCY_BINS, seconds)] += 1
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.
+
+    def percentile(self, fraction):
+        # upper edge of the bin holding the given fraction of the samples,
+        # but never above the slowest sample
+        needed = fraction * self.count
+        seen = 0
+        for i, n in enumerate(self.bins):
+            seen += n
+            if n and seen >= needed:
+                return min(LATENCY_BINS[i], self.maximum) if i < len(LATENCY_BINS) else self.maximum
+        return 0.
+
+class LinkStats(object):
+    def __init__(self):
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.commands = {}
+            self.cycles = {}
+            self.overruns = {}
+            self.retries = {}
+
+    def command(self, device, command, seconds, bytesOut, bytesIn, error=False, timeout=False):
+        with self.lock:
+            timing = self.commands.get((device, command))
+            if timing is None:
+                timing = self.commands[(device, command)] = Timing()
+            timing.add(seconds)
+            timing.bytesOut += bytesOut
+            timing.bytesIn += bytesIn
+            timing.errors += bool(error)
+            timing.timeouts += bool(timeout)
+
+    def cycle(self, stream, lateness, missed=0):
+        with self.lock:
+            timing = self.cycles.get(stream)
+            if timing is None:
+                timing = self.cycles[stream] = Timing()
+            timing.add(max(0., lateness))
+            self.overruns[stream] = self.overruns.get(stream, 0) + missed
+
+    def retry(self, device):
+        with self.lock:
+            self.retries[device] = self.retries.get(device, 0) + 1
+
+    def report(self):
+        lines = ["Link statistics over %.0f s" % (time.time() - self.started), ""]
+        lines.append("%-22s %7s %8s %8s %8s %8s %6s %6s %9s %9s" % ('command', 'count', 'mean ms', 'p50 ms', 'p99 ms', 'max ms', 'errors', 'tmout', 'bytes out', 'bytes in'))
+        with self.lock:
+            for (device, command), t in sorted(self.commands.items()):
+                lines.append("%-22s %7d %8.1f %8.1f %8.1f %8.1f %6d %6d %9d %9d" % ('%s %s' % (device, command), t.count,
+                             1e3 * t.mean(), 1e3 * t.percentile(.5), 1e3 * t.percentile(.99), 1e3 * t.maximum,
+                             t.errors, t.timeouts, t.bytesOut, t.bytesIn))
+            lines.append("")
+            lines.append("%-22s %7s %8s %8s %8s %8s" % ('stream start lateness', 'cycles', 'mean ms', 'p99 ms', 'max ms', 'overrun'))
+            for stream, t in sorted(self.cycles.items()):
+                lines.append("%-22s %7d %8.1f %8.1f %8.1f %8d" % (stream, t.count, 1e3 * t.mean(), 1e3 * t.percentile(.99),
+                             1e3 * t.maximum, self.overruns.get(stream, 0)))
+            lines.append("")
+            for device, n in sorted(self.retries.items()):
+                lines.append("%s reconnect attempts: %d" % (device, n))
+            lines.append("Latency bins (ms): " + ' '.join(['%g' % (1e3 * edge) for edge in LATENCY_BINS]))
+            for (device, command), t in sorted(self.commands.items()):
+                lines.append("%-22s %s" % ('%s %s' % (device, command), ' '.join(map(str, t.bins))))
+        return '\n'.join(lines)
+
+    def dump(self, filename):
+        with open(filename, 'w') as f:
+            f.write(self.report() + '\n')
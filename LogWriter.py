@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+LogWriter.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Measurement log files written from a background thread. The polling
+threads only put lines into a bounded queue; the writer joins whatever
+is queued into one write, rotates the file when it gets too big or too
+old and fsyncs it every fsyncInterval seconds. A stalled disk fills the
+queue, after which lines are dropped and counted, the polling goes on.
+
+LogWriter.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+LogWriter.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import sys
+import glob
+import time
+from Queue import Queue, Full, Empty
+from threading import Event, Thread
+
+class LogWriter(object):
+    """Appends lines to filename without blocking the caller.
+
+    maxBytes and rotateInterval (seconds) start a new file once exceeded,
+    0 disables them; the old file is renamed to filename.YYYYmmdd-HHMMSS
+    and only the newest backups of those are kept, 0 keeps all of them.
+    """
+    def __init__(self, filename, maxBytes=0, rotateInterval=0, backups=0, fsyncInterval=5., batch=1000, backlog=10000):
+        self.filename = filename
+        self.maxBytes = maxBytes
+        self.rotateInterval = rotateInterval
+        self.backups = backups
+        self.fsyncInterval = fsyncInterval
+        self.batch = batch
+        self.queue = Queue(backlog)
+        self.dropped = 0
+        self.logfile = None
+        self.openFile()
+        self.thread = Thread(target=self.run, name='LogWriter ' + os.path.basename(filename))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def write(self, line):
+        # never blocks, a line that doesn't fit into the queue is dropped
+        try:
+            self.queue.put_nowait(line)
+        except Full:
+            self.dropped += 1
+
+    def flush(self, timeout=5.):
+        # waits until everything queued so far is on disk
+        done = Event()
+        try:
+            self.queue.put(done, timeout=timeout)
+        except Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout=5.):
+        # gives up after timeout if the disk is stalled, the queued lines are lost then
+        try:
+            self.queue.put(None, timeout=timeout)
+        except Full:
+            return False
+        self.thread.join(timeout)
+        return not self.thread.isAlive()
+
+    def openFile(self):
+        self.logfile = open(self.filename, 'a')
+        self.size = self.logfile.tell()
+        self.opened = time.time()
+        self.synced = self.opened
+
+    def run(self):
+        running = True
+        while running:
+            try:
+                items = [self.queue.get(timeout=self.fsyncInterval or 1.)]
+            except Empty:
+                items = []
+            while len(items) < self.batch:
+                try:
+                    items.append(self.queue.get_nowait())
+                except Empty:
+                    break
+            lines = []
+            events = []
+            for item in items:
+                if item is None:
+                    running = False
+                elif isinstance(item, str):
+                    lines.append(item)
+                else:
+                    events.append(item)
+            try:
+                self.store(lines, sync=bool(events) or not running)
+            except (IOError, OSError) as e:
+                self.dropped += len(lines)
+                sys.stderr.write("Can't write %s: %s\n" % (self.filename, e))
+            for event in events:
+                event.set()
+        self.logfile.close()
+
+    def store(self, lines, sync=False):
+        if lines:
+            data = '\n'.join(lines) + '\n'
+            self.logfile.write(data)
+            self.size += len(data)
+        now = time.time()
+        if sync or (self.fsyncInterval and now - self.synced >= self.fsyncInterval):
+            self.logfile.flush()
+            os.fsync(self.logfile.fileno())
+            self.synced = now
+        if (self.maxBytes and self.size >= self.maxBytes) or (self.rotateInterval and now - self.opened >= self.rotateInterval):
+            self.rotate()
+
+    def rotate(self):
+        self.logfile.flush()
+        os.fsync(self.logfile.fileno())
+        self.logfile.close()
+        backup = stamp = self.filename + time.strftime('.%Y%m%d-%H%M%S')
+        backups = self.backupFiles()
+        if backups and backups[-1].startswith(stamp):
+            # rotated before within this second
+            backup = '%s-%d' % (stamp, int(backups[-1][len(stamp) + 1:] or 0) + 1)
+        os.rename(self.filename, backup)
+        if self.backups:
+            for old in (backups + [backup])[:-self.backups]:
+                os.remove(old)
+        self.openFile()
+
+    def backupFiles(self):
+        # oldest first, filename.YYYYmmdd-HHMMSS-i is the i-th one of that second
+        def order(name):
+            fields = name[len(self.filename) + 1:].split('-')
+            return fields[:2], int(fields[2]) if len(fields) > 2 else 0
+        return sorted(glob.glob(self.filename + '.[0-9]*'), key=order)
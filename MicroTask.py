@@ -31,6 +31,7 @@ import serial
 import time
 import signal
 import math
+import string
 
 class GHSPanel(object):
     def __init__(self, serialPort, baud=9600, debug=False):
@@ -41,6 +42,8 @@ class GHSPanel(object):
             raise se
             pass
         self.logfilename = ''
+        self.stats = None
+        self.parsers = {'ADC?': ResponseParser(ADC_FIELDS), 'KEYS?': ResponseParser(KEYS_FIELDS)}
         
     def checkStatus(self):
         id = self.send('STATUS?')
@@ -50,32 +53,166 @@ class GHSPanel(object):
         pass
     
     def getADC(self):
-        Poffset = [0.6098,0.6083,0.61409,1,0.6073,0.6081,0.60849,0.0468]
         status, values = self.send('ADC?')
-        valuescorr = [int(values[i] * Poffset[i]) for i in range(8)]
-        return status, valuescorr
+        return status, correctADC(values)
+
+    def getRawADC(self):
+        return self.send('ADC?')
         
     def getKeys(self):
         status, keymap = self.send('KEYS?')
         return status, keymap
+
+    def getState(self):
+        # ADC? and KEYS? in one round trip, both sampled at nearly the same time;
+        # the ADC values are the raw counts
+        replies = self.query(['ADC?', 'KEYS?'])
+        return replies['ADC?'], replies['KEYS?']
     
     def send(self, command):
+        return self.query([command])[command]
+
+    def query(self, commands):
+        # the commands are written back to back, the panel answers them in order
+        start = time.time()
         self.connection.flushInput()
-        self.connection.write(command + LINE_TERMINATION_GHS)
-        response_str = self.connection.readline().split("\n")[0]
-        response = response_str.split("\t")
-        errcode = int(response[0])
-        vals = response[1].split(",")
-        data = []
-        for raw_vals in vals:
-            data.append(int(raw_vals))
-        return errcode, data
-     
+        request = ''.join([command + LINE_TERMINATION_GHS for command in commands])
+        self.connection.write(request)
+        lines = []
+        for command in commands:
+            lines.append(self.connection.readline())
+            if not lines[-1].endswith(LINE_TERMINATION_GHS):
+                break
+        if self.stats is not None:
+            self.stats.command('GHSPanel', '+'.join(commands), time.time() - start, len(request), sum(map(len, lines)),
+                               timeout=not lines[-1].endswith(LINE_TERMINATION_GHS))
+        replies = {}
+        for command, line in zip(commands, lines):
+            parser = self.parsers.get(command)
+            replies[command] = parseResponse(line) if parser is None else parser.parse(line)
+        return replies     
      
     def __del__(self):
 #        self.disconnect()
         if hasattr(self,'connection') and self.connection: self.connection.close()
 
+def parseResponse(line):
+    response_str = line.split("\n")[0]
+    response = response_str.split("\t")
+    errcode = int(response[0])
+    vals = response[1].split(",")
+    data = []
+    for raw_vals in vals:
+        data.append(int(raw_vals))
+    return errcode, data
+
+def correctADC(values):
+    return [int(value * offset) for value, offset in zip(values, ADC_OFFSET)]
+
+class ResponseParser(object):
+    """Decodes 'err<TAB>v1,v2,...<LF>' replies with a fixed number of fields.
+
+    The values are decoded into a preallocated list; a reply of one digit
+    per field, like the KEYS? map, is decoded with one translate call.
+    parse() returns the error code and a copy of the values, since the
+    callers keep them; a non-zero error code comes with no values, the
+    fields of such a reply are not checked. A reply cut short raises
+    GHSPanelTimeout, one with the wrong number of fields or a bad value
+    GHSPanelError.
+    """
+    def __init__(self, fields):
+        self.fields = fields
+        self.values = [0] * fields
+        self.separators = ',' * (fields - 1)
+
+    def parse(self, line):
+        if not line.endswith(LINE_TERMINATION_GHS):
+            raise GHSPanelTimeout('Incomplete reply from the GHS panel: %r' % line)
+        return self.decode(line[:-1])
+
+    def decode(self, reply):
+        head, tab, payload = reply.partition(SPECIAL_CHARACTERS_GHS['HT'])
+        try:
+            errcode = int(head)
+        except ValueError:
+            raise GHSPanelError('Bad reply from the GHS panel: %r' % reply)
+        if errcode != 0:
+            return errcode, []
+        if len(payload) == 2 * self.fields - 1 and payload[1::2] == self.separators:
+            digits = payload[0::2]
+            if digits.isdigit():
+                self.values[:] = bytearray(digits.translate(DIGIT_VALUES))
+                return errcode, self.values[:]
+        fields = payload.split(',')
+        if len(fields) != self.fields:
+            raise GHSPanelError('%d values instead of %d in the reply of the GHS panel' % (len(fields), self.fields))
+        try:
+            self.values[:] = map(int, fields)
+        except ValueError:
+            raise GHSPanelError('Bad value in the reply of the GHS panel: %r' % reply)
+        return errcode, self.values[:]
+
+class KeyState(object):
+    """The KEYS? map packed into two 64 bit words.
+
+    Bit i of word is set when entry i reads 2 (open/started), bit i of
+    mask when entry i holds a valid reading, 1 or 2. Keys are addressed by
+    their index or by their name in KEY_BITS.
+    """
+    __slots__ = ('word', 'mask')
+
+    def __init__(self, word=0, mask=0):
+        self.word = word
+        self.mask = mask
+
+    @classmethod
+    def fromKeys(cls, keymap):
+        word = mask = 0
+        bit = 1
+        for key in keymap:
+            if key == 2:
+                word |= bit
+                mask |= bit
+            elif key == 1:
+                mask |= bit
+            bit <<= 1
+        return cls(word, mask)
+
+    def __getitem__(self, key):
+        # True when open/started, False when closed/stopped, None if unknown
+        bit = 1 << KEY_BITS.get(key, key)
+        if not self.mask & bit:
+            return None
+        return bool(self.word & bit)
+
+    def __eq__(self, other):
+        return self.word == other.word and self.mask == other.mask
+
+    def __ne__(self, other):
+        return not self == other
+
+    def changed(self, other):
+        # bits that differ from the other state, in value or in validity
+        return ((self.word ^ other.word) & self.mask & other.mask) | (self.mask ^ other.mask)
+
+    def keys(self):
+        # the KEYS? map again, 0 where the entry was not valid
+        return [(2 if self.word >> i & 1 else 1) if self.mask >> i & 1 else 0 for i in range(KEYS_FIELDS)]
+
+def changedBits(bits):
+    # indices of the set bits, lowest first
+    indices = []
+    while bits:
+        low = bits & -bits
+        indices.append(low.bit_length() - 1)
+        bits ^= low
+    return indices
+
+class GHSPanelError(Exception):
+    pass
+
+class GHSPanelTimeout(Exception):
+    pass
     
 ### Special characters: command end or command separators    
 SPECIAL_CHARACTERS_GHS = { 
@@ -87,6 +224,29 @@ SPECIAL_CHARACTERS_GHS = {
 
 LINE_TERMINATION_GHS = SPECIAL_CHARACTERS_GHS['LF']
 
+### Number of values in the replies to ADC? and KEYS?
+ADC_FIELDS = 8
+KEYS_FIELDS = 64
+
+### Position of every key in the KEYS? map, named as on the panel:
+### pumps A0-A10, compressors S1-S5, valves 0-17 and the mode flags
+KEY_BITS = {
+  'A0': 21, 'A1': 51, 'A2': 42, 'A3': 59, 'A4': 54, 'A5': 48,
+  'A6': 56, 'A7': 50, 'A8': 41, 'A9': 39, 'A10': 45,
+  'S1': 38, 'S2': 32, 'S3': 24, 'S4': 57, 'S5': 44,
+  '0': 36, '1': 30, '2': 35, '3': 33, '4': 6, '5': 8, '6': 26, '7': 23, '8': 29,
+  '9': 11, '10': 18, '11': 20, '12': 17, '13': 14, '14': 12, '15': 2, '16': 3, '17': 27,
+  'Start': 47, 'He3': 60, 'He4': 61, 'Norm': 62, 'Rec': 63, 'Aux1': 5, 'Reset': 9, 'Auto': 53,
+}
+
+KEY_NAMES = dict((bit, name) for name, bit in KEY_BITS.items())
+
+### '0' ... '9' to the bytes 0 ... 9
+DIGIT_VALUES = string.maketrans('0123456789', ''.join([chr(i) for i in range(10)]))
+
+### Correction factors of the 8 on-board ADC channels
+ADC_OFFSET = [0.6098,0.6083,0.61409,1,0.6073,0.6081,0.60849,0.0468]
+
 ### Functional command set
 COMMAND_GHS = {
   'ID?',      # Get identification of panel
@@ -29,16 +29,33 @@ import serial
 import time
 import signal
 import math
+from LogWriter import LogWriter
+from StreamStats import ChannelStats
 
 class MaxiGauge (object):
-    def __init__(self, serialPort, baud=9600, debug=False):
+    def __init__(self, serialPort, baud=9600, debug=False, connection=None):
         self.debug=debug
-        try:
-            self.connection = serial.Serial(serialPort, baudrate=baud, timeout=0.2)
-        except serial.serialutil.SerialException as se:
-            raise MaxiGaugeError(se)
+        if connection is not None:
+            self.connection = connection ## e.g. a MaxiGaugeSimulator
+        else:
+            try:
+                self.connection = serial.Serial(serialPort, baudrate=baud, timeout=0.2)
+            except serial.serialutil.SerialException as se:
+                raise MaxiGaugeError(se)
         #self.send(C['ETX']) ### We might reset the connection first, but it doesn't really matter:
         self.logfilename = 'measurement-data.txt'
+        self.logwriter = None
+        self.log_max_bytes = 0          ## rotate measurement-data.txt at this size, 0: never
+        self.log_rotate_interval = 0    ## or after this many seconds, 0: never
+        self.log_fsync_interval = 5.
+        self.log_statistics = False     ## log stddev, min, max and valid count of every sensor after the means
+        self.stats = None
+        self.read_timeout = 1.
+        self.pipeline_depth = 6
+        self.rx_buffer = ''
+        self.bytesOut = 0
+        self.bytesIn = 0
+        self.parser = None
 
     def checkDevice(self):
         message = "The Display Contrast is currently set to %d (out of 20).\n" % self.displayContrast()
@@ -62,16 +79,82 @@ class MaxiGauge (object):
     def pressures(self):
         return [self.pressure(i+1) for i in range(6)]
 
+    def pressures_batch(self, sensors = (1,2,3,4,5,6), depth = None):
+        ## Pipelined version of pressures(): every PRx is sent together with its ENQ and up
+        ## to `depth` of them are in flight, the replies are parsed in order as they arrive.
+        if depth is None: depth = self.pipeline_depth
+        depth = max(1, depth)
+        for sensor in sensors:
+            if sensor < 1 or sensor >6: raise MaxiGaugeError('Sensor can only be between 1 and 6. You choose ' + str(sensor))
+        start = time.time()
+        self.bytesOut = self.bytesIn = 0
+        self.flush_input()
+        batch = PressureBatch(start)
+        sent = 0
+        try:
+            for i, sensor in enumerate(sensors):
+                if sent < len(sensors) and sent < i + depth:
+                    self.write(batch_request(sensors[sent:i + depth]))
+                    sent = min(len(sensors), i + depth)
+                line = self.read()
+                if len(line) > 0 and line[-1] == C['NAK']:
+                    raise nak_error(self.read())
+                if len(line) == 0 or line[-1] == C['ACQ']:
+                    line = self.read()
+                ## else the controller forgot the acknowledge (see getACQorNAK) and this is the data already
+                batch.set(sensor, *parse_status(line))
+        except MaxiGaugeTimeout:
+            self.record('PR*', start, timeout=True)
+            raise
+        except MaxiGaugeError:
+            self.record('PR*', start, error=True)
+            raise
+        self.record('PR*', start)
+        return batch
+
     def pressure(self, sensor):
         if sensor < 1 or sensor >6: raise MaxiGaugeError('Sensor can only be between 1 and 6. You choose ' + str(sensor))
         reading = self.send('PR%d' % sensor, 1)  ## reading will have the form x,x.xxxEsx <CR><LF> (see p.88)
-        try:
-            r = reading[0].split(',')
-            status = int(r[0])
-            pressure = float(r[-1])
-        except:
-            raise MaxiGaugeError("Problem interpreting the returned line:\n%s" % reading)
-        return PressureReading(sensor, status, pressure)
+        return parse_pressure(sensor, reading[0])
+
+    def start_continuous_output(self, interval = 0):
+        ## COM mode (p.87): the controller sends all six readings every 100 ms (0), 1 s (1) or 1 min (2)
+        if interval not in CONTINUOUS_INTERVALS: raise MaxiGaugeError('Interval can only be one of %s' % CONTINUOUS_INTERVALS.keys())
+        self.flush_input()
+        self.write('COM,%d' % interval + LINE_TERMINATION)
+        self.getACQorNAK()
+        self.enquire()
+        self.parser = ContinuousParser()
+        self.continuous_interval = CONTINUOUS_INTERVALS[interval]
+        self.continuous_timeout = 5 * self.continuous_interval + 1.
+        self.last_record = time.time()
+
+    def stop_continuous_output(self):
+        self.write(C['ETX'])
+        self.parser = None
+        time.sleep(0.1)
+        self.flush_input()
+
+    def read_continuous(self):
+        ## non-blocking: returns the PressureBatch records completed since the last call
+        waiting = self.connection.inWaiting()
+        now = time.time()
+        if not waiting and not self.rx_buffer:
+            if now - self.last_record > self.continuous_timeout:
+                raise MaxiGaugeTimeout('No continuous output from MaxiGauge for %.1f s' % (now - self.last_record))
+            return []
+        data = self.rx_buffer + self.connection.read(waiting)
+        self.rx_buffer = ''
+        self.bytesIn += len(data)
+        records = self.parser.feed(data, now)
+        if records:
+            ## the records came one interval apart, the last one just now; the
+            ## spacing shrinks if that would put them before the previous call
+            step = min(self.continuous_interval, (now - self.last_record) / len(records))
+            for i, batch in enumerate(records):
+                batch.timestamp = now - (len(records) - 1 - i) * step
+            self.last_record = now
+        return records
 
     def signal_handler(self, sig, frame):
         self.stopping_continuous_update.set()
@@ -111,19 +194,18 @@ class MaxiGauge (object):
         #self.history = history
         #log = None
         #f.close()
-        cache = []
+        aggregate = ChannelStats(6)
         while not self.stopping_continuous_update.isSet():
             startTime = time.time()
             self.update_counter += 1
-            self.cached_pressures = self.pressures()
-            cache.append([time.time()] + [sensor.pressure if sensor.status in [0,1,2] else float('nan') for sensor in self.cached_pressures] )
+            self.cached_pressures = self.pressures_batch()
+            aggregate.add(self.cached_pressures.valid(), self.cached_pressures.timestamp)
             if self.log_every > 0 and (self.update_counter%self.log_every == 0):
-                logtime = cache[self.log_every/2][0]
-                cache = zip(*cache) # transpose cache
-                cache = cache[1:] # remove first element
-                avgs = [(sum(vals)/self.log_every) for vals in cache]
-                self.log_to_file(logtime=logtime, logvalues=avgs)
-                cache = []
+                if self.log_statistics:
+                    self.log_to_file(logtime=aggregate.midtime(), logvalues=aggregate.row(), counts=aggregate.count)
+                else:
+                    self.log_to_file(logtime=aggregate.midtime(), logvalues=aggregate.means())
+                aggregate.reset()
             time.sleep(0.1) # we want a minimum pause of 0.1 s
             while not self.stopping_continuous_update.isSet() and (self.update_time - (time.time()-startTime) > .2):
                 time.sleep(.2)
@@ -135,75 +217,114 @@ class MaxiGauge (object):
         #interrupt_main()
 
 
-    def log_to_file(self, logtime = None, logvalues = None):
-        try:
-            self.logfile
-        except:
-            self.logfile = file(self.logfilename, 'a')
+    def log_to_file(self, logtime = None, logvalues = None, counts = None):
+        ## the line is only queued, LogWriter writes it from its own thread
+        if self.logwriter is None:
+            self.logwriter = LogWriter(self.logfilename, maxBytes = self.log_max_bytes,
+                                       rotateInterval = self.log_rotate_interval, fsyncInterval = self.log_fsync_interval)
         if not logtime:
             logtime = time.time()
         if not logvalues:
-            logvalues = [sensor.pressure if sensor.status in [0,1,2] else float('nan') for sensor in self.cached_pressures]
+            logvalues = self.cached_pressures.valid()
         line = "%d, " % logtime + ', '.join(["%.3E" % val if not math.isnan(val) else '' for val in logvalues])
-        self.logfile.write(line+'\n')
+        if counts is not None:
+            line += ', ' + ', '.join(["%d" % n for n in counts])
+        self.logwriter.write(line)
         #self.history.append([int(time.time())] + [sensor.pressure if sensor.status in [0,1,2] else None for sensor in self.cached_pressures])
         #self.flush_logfile()
 
     def flush_logfile(self):
-        try:
-            self.logfile.flush()
-        except:
-            pass
+        if self.logwriter is not None:
+            self.logwriter.flush()
+
+    def close_logfile(self):
+        if self.logwriter is not None:
+            self.logwriter.close()
+            self.logwriter = None
 
     def debugMessage(self, message):
         if self.debug: print(repr(message))
 
     def send(self, mnemonic, numEnquiries = 0):
-        self.connection.flushInput()
+        start = time.time()
+        self.bytesOut = self.bytesIn = 0
+        self.flush_input()
         self.write(mnemonic+LINE_TERMINATION)
         #if mnemonic != C['ETX']: self.read()
         #self.read()
-        self.getACQorNAK()
-        response = []
-        for i in range(numEnquiries):
-            self.enquire()
-            response.append(self.read())
+        try:
+            self.getACQorNAK()
+            response = []
+            for i in range(numEnquiries):
+                self.enquire()
+                response.append(self.read())
+        except MaxiGaugeTimeout:
+            self.record(mnemonic, start, timeout=True)
+            raise
+        except MaxiGaugeError:
+            self.record(mnemonic, start, error=True)
+            raise
+        self.record(mnemonic, start, timeout=self.bytesIn == 0)
         return response
 
+    def record(self, mnemonic, start, error=False, timeout=False):
+        if self.stats is not None:
+            self.stats.command('MaxiGauge', mnemonic, time.time() - start, self.bytesOut, self.bytesIn, error, timeout)
+
     def write(self,what):
         self.debugMessage(what)
+        self.bytesOut += len(what)
         self.connection.write(what)
 
     def enquire(self):
         self.write(C['ENQ'])
 
-    def read(self):
-        data = ""
+    def flush_input(self):
+        self.connection.flushInput()
+        self.rx_buffer = ''
+
+    def read(self, timeout = None):
+        # reads one line, taking whatever bytes are waiting at each call,
+        # and gives up once timeout seconds have passed in total. Bytes
+        # beyond the line end are kept for the next call.
+        if timeout is None: timeout = self.read_timeout
+        deadline = time.time() + timeout
+        chunks = [self.rx_buffer]
+        x = self.rx_buffer
         while True:
-            x = self.connection.read()
+            if LINE_TERMINATION[-1] in x:
+                data = "".join(chunks)
+                end = data.find(LINE_TERMINATION)
+                if end >= 0:
+                    self.rx_buffer = data[end+len(LINE_TERMINATION):]
+                    return data[:end]
+            if time.time() > deadline:
+                self.rx_buffer = "".join(chunks)
+                raise MaxiGaugeTimeout("No complete line from MaxiGauge within %.1f s, got %r" % (timeout, self.rx_buffer))
+            x = self.connection.read(max(1, self.connection.inWaiting()))
             self.debugMessage(x)
-            data += x
-            if len(data)>1 and data[-2:]==LINE_TERMINATION:
-                break
-        return data[:-len(LINE_TERMINATION)]
+            self.bytesIn += len(x)
+            chunks.append(x)
 
     def getACQorNAK(self):
-        returncode = self.connection.readline()
-        self.debugMessage(returncode)
+        try:
+            returncode = self.read(self.connection.timeout)
+        except MaxiGaugeTimeout:
+            returncode = ''
         ## The following is usually expected but our MaxiGauge controller sometimes forgets this parameter... That seems to be a bug with the DCC command.
-        #if len(returncode)<3: raise MaxiGaugeError('Only received a line termination from MaxiGauge. Was expecting ACQ or NAK.')
-        if len(returncode)<3: self.debugMessage('Only received a line termination from MaxiGauge. Was expecting ACQ or NAK.')
-        if len(returncode)>2 and returncode[-3] == C['NAK']:
+        #if len(returncode)<1: raise MaxiGaugeError('Only received a line termination from MaxiGauge. Was expecting ACQ or NAK.')
+        if len(returncode)<1: self.debugMessage('Only received a line termination from MaxiGauge. Was expecting ACQ or NAK.')
+        if len(returncode)>0 and returncode[-1] == C['NAK']:
             self.enquire()
             returnedError = self.read()
             error = str(returnedError).split(',' , 1)
             print repr(error)
             errmsg = { 'System Error': ERR_CODES[0][int(error[0])] , 'Gauge Error': ERR_CODES[1][int(error[1])] }
             raise MaxiGaugeNAK(errmsg)
-        #if len(returncode)>2 and returncode[-3] != C['ACQ']: raise MaxiGaugeError('Expecting ACQ or NAK from MaxiGauge but neither were sent.')
-        if len(returncode)>2 and returncode[-3] != C['ACQ']: self.debugMessage('Expecting ACQ or NAK from MaxiGauge but neither were sent.')
+        #if len(returncode)>0 and returncode[-1] != C['ACQ']: raise MaxiGaugeError('Expecting ACQ or NAK from MaxiGauge but neither were sent.')
+        if len(returncode)>0 and returncode[-1] != C['ACQ']: self.debugMessage('Expecting ACQ or NAK from MaxiGauge but neither were sent.')
         # if no exception raised so far, the interface is just fine:
-        return returncode[:-(len(LINE_TERMINATION)+1)]
+        return returncode[:-1]
         
     def disconnect(self):
         try:
@@ -216,12 +337,81 @@ class MaxiGauge (object):
         #self.send(C['ETX'])
         if hasattr(self, 'connection') and self.connection: self.connection.close()
 
+class ContinuousParser(object):
+    """Incremental parser of the COM mode output, six status,pressure pairs per line.
+
+    Bytes can be fed in arbitrary pieces. A line that does not hold exactly six
+    valid pairs (garbled, or the tail of a line we joined in the middle) is
+    counted in `dropped` and skipped, parsing resumes with the next line.
+    """
+    def __init__(self, sensors = 6, max_line = 256):
+        self.sensors = sensors
+        self.max_line = max_line
+        self.buffer = ''
+        self.dropped = 0
+
+    def feed(self, data, timestamp = None):
+        ## returns a PressureBatch for every complete and valid line
+        if timestamp is None: timestamp = time.time()
+        self.buffer += data
+        records = []
+        while True:
+            end = self.buffer.find(C['LF'])
+            if end < 0:
+                if len(self.buffer) > self.max_line: ## no line end in sight, throw the garbage away
+                    self.buffer = ''
+                    self.dropped += 1
+                break
+            line = self.buffer[:end].rstrip(C['CR'])
+            self.buffer = self.buffer[end+1:]
+            batch = self.parse(line, timestamp)
+            if batch is None:
+                self.dropped += 1
+            else:
+                records.append(batch)
+        return records
+
+    def parse(self, line, timestamp = None):
+        fields = line.split(',')
+        if len(fields) != 2 * self.sensors: return None
+        batch = PressureBatch(timestamp)
+        try:
+            for i in range(self.sensors):
+                batch.set(i+1, int(fields[2*i]), float(fields[2*i+1]))
+        except (ValueError, MaxiGaugeError):
+            return None
+        return batch
+
+def batch_request(sensors):
+    ## every PRx together with its ENQ, for the pipelined pressure reads
+    return ''.join(['PR%d' % s + LINE_TERMINATION + C['ENQ'] for s in sensors])
+
+def nak_error(line):
+    ## the error enquired after a NAK, 'x,x' -> MaxiGaugeNAK
+    error = str(line).split(',' , 1)
+    return MaxiGaugeNAK({ 'System Error': ERR_CODES[0][int(error[0])] , 'Gauge Error': ERR_CODES[1][int(error[1])] })
+
+def parse_status(line):
+    ## 'x,x.xxxEsx' -> (status, pressure)
+    try:
+        r = line.split(',')
+        return int(r[0]), float(r[-1])
+    except:
+        raise MaxiGaugeError("Problem interpreting the returned line:\n%s" % line)
+
+def parse_pressure(sensor, line):
+    status, pressure = parse_status(line)
+    return PressureReading(sensor, status, pressure)
+
 class PressureReading(object):
+    __slots__ = ('id', 'status', 'pressure')
+
     def __init__(self, id, status, pressure):
-        if int(id) not in range(1,7): raise MaxiGaugeError('Pressure Gauge ID must be between 1-6')
-        self.id = int(id)
-        if int(status) not in PRESSURE_READING_STATUS.keys(): raise MaxiGaugeError('The Pressure Status must be in the range %s' % PRESSURE_READING_STATUS.keys())
-        self.status = int(status)
+        id, status = int(id), int(status)
+        if not 1 <= id <= 6: raise MaxiGaugeError('Pressure Gauge ID must be between 1-6')
+        if status not in PRESSURE_READING_STATUS: raise MaxiGaugeError('The Pressure Status must be in the range %s' % PRESSURE_READING_STATUS.keys())
+        self.id = id
+        self.status = status
         self.pressure = float(pressure)
 
     def statusMsg(self):
@@ -230,6 +420,45 @@ class PressureReading(object):
     def __repr__(self):
         return "Gauge #%d: Status %d (%s), Pressure: %f mbar\n" % (self.id, self.status, self.statusMsg(), self.pressure)
 
+class PressureBatch(object):
+    """Status and pressure of all six gauges from one read, in two flat lists.
+
+    A gauge that was not part of the read has status -1 and a NaN pressure.
+    Iterating gives a PressureReading per gauge read, for code that wants them.
+    """
+    __slots__ = ('timestamp', 'ids', 'statuses', 'pressures')
+
+    def __init__(self, timestamp = None):
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.ids = []
+        self.statuses = [-1] * 6
+        self.pressures = [float('nan')] * 6
+
+    def set(self, sensor, status, pressure):
+        if not 1 <= sensor <= 6: raise MaxiGaugeError('Pressure Gauge ID must be between 1-6')
+        if status not in PRESSURE_READING_STATUS: raise MaxiGaugeError('The Pressure Status must be in the range %s' % PRESSURE_READING_STATUS.keys())
+        if self.statuses[sensor-1] < 0: self.ids.append(sensor)
+        self.statuses[sensor-1] = status
+        self.pressures[sensor-1] = pressure
+
+    def valid(self):
+        ## the pressures, NaN where the gauge has no usable value
+        return [p if s in VALID_STATUS else float('nan') for s, p in zip(self.statuses, self.pressures)]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for sensor in self.ids:
+            yield PressureReading(sensor, self.statuses[sensor-1], self.pressures[sensor-1])
+
+    def __getitem__(self, i):
+        sensor = self.ids[i]
+        return PressureReading(sensor, self.statuses[sensor-1], self.pressures[sensor-1])
+
+    def __repr__(self):
+        return ''.join([repr(reading) for reading in self])
+
 
 ### ------ now we define the exceptions that could occur ------
 
@@ -239,6 +468,9 @@ class MaxiGaugeError(Exception):
 class MaxiGaugeNAK(MaxiGaugeError):
     pass
 
+class MaxiGaugeTimeout(MaxiGaugeError):
+    pass
+
 ### ------- Control Symbols as defined on p. 81 of the english
 ###        manual for the Pfeiffer Vacuum TPG256A  -----------
 C = { 
@@ -253,6 +485,13 @@ C = {
 
 LINE_TERMINATION=C['CR']+C['LF'] # CR, LF and CRLF are all possible (p.82)
 
+### Output intervals of the continuous mode (COM) in seconds
+CONTINUOUS_INTERVALS = {
+  0: 0.1,
+  1: 1.,
+  2: 60.,
+}
+
 ### Mnemonics as defined on p. 85
 M = [
   'BAU', # Baud rate                           Baud rate                                    95
@@ -336,3 +575,6 @@ PRESSURE_READING_STATUS = {
   5: 'No sensor',
   6: 'Identification error'
 }
+
+### statuses with a usable pressure value
+VALID_STATUS = frozenset([0, 1, 2])
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Simulator.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Stand-ins for the serial connection of the instruments, to run and test
+the acquisition without hardware:
+
+  mg = MaxiGauge(None, connection=MaxiGaugeSimulator())
+
+MaxiGaugeSimulator answers the PRx requests and produces the continuous
+output of the COM mode, optionally garbling some of the records.
+
+Simulator.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Simulator.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import time
+import math
+import random
+from PfeifferVacuum import C, LINE_TERMINATION, CONTINUOUS_INTERVALS
+
+class MaxiGaugeSimulator(object):
+    """Serial connection of a TPG256A with six drifting gauges.
+
+    garble is the probability that a continuous record is corrupted: cut
+    short, a byte flipped, or its line end lost.
+    """
+    def __init__(self, pressures=(1e3, 1e-2, 1e-3, 1e-4, 1e-5, 1e-6), statuses=(0,0,0,0,0,0),
+                 garble=0., timeout=0.2, seed=None):
+        self.pressures = list(pressures)
+        self.statuses = list(statuses)
+        self.garble = garble
+        self.timeout = timeout
+        self.random = random.Random(seed)
+        self.output = ''
+        self.input = ''
+        self.last = None
+        self.interval = None
+        self.next_record = 0.
+
+    ### ------ serial.Serial interface ------
+
+    def write(self, data):
+        for x in data:
+            if x == C['ETX']:
+                self.interval = None
+                self.input = ''
+            elif x == C['ENQ']:
+                self.enquiry()
+            else:
+                self.input += x
+                if self.input.endswith(LINE_TERMINATION):
+                    self.last = self.input[:-len(LINE_TERMINATION)]
+                    self.input = ''
+                    self.output += C['ACQ'] + LINE_TERMINATION
+        return len(data)
+
+    def inWaiting(self):
+        self.produce()
+        return len(self.output)
+
+    def read(self, size=1):
+        deadline = time.time() + self.timeout
+        while self.inWaiting() < size and time.time() < deadline:
+            time.sleep(0.005)
+        data, self.output = self.output[:size], self.output[size:]
+        return data
+
+    def readline(self):
+        deadline = time.time() + self.timeout
+        while C['LF'] not in self.output and time.time() < deadline:
+            time.sleep(0.005)
+            self.produce()
+        end = self.output.find(C['LF']) + 1 or len(self.output)
+        data, self.output = self.output[:end], self.output[end:]
+        return data
+
+    def flushInput(self):
+        self.produce()
+        self.output = ''
+
+    def close(self):
+        self.interval = None
+
+    ### ------ the simulated controller ------
+
+    def drift(self):
+        self.pressures = [p * math.exp(self.random.gauss(0, 0.01)) for p in self.pressures]
+
+    def record(self):
+        return ','.join(['%d,%.4E' % (s, p) for s, p in zip(self.statuses, self.pressures)])
+
+    def enquiry(self):
+        if self.last is None:
+            return
+        if self.last.startswith('PR') and self.last[2:].isdigit():
+            sensor = int(self.last[2:]) - 1
+            self.drift()
+            self.output += '%d,%.4E' % (self.statuses[sensor], self.pressures[sensor]) + LINE_TERMINATION
+        elif self.last.startswith('COM,'):
+            self.interval = CONTINUOUS_INTERVALS[int(self.last[4:])]
+            self.next_record = time.time()
+        else:
+            self.output += '0' + LINE_TERMINATION
+
+    def produce(self):
+        if self.interval is None:
+            return
+        now = time.time()
+        while self.next_record <= now:
+            self.drift()
+            line = self.record() + LINE_TERMINATION
+            if self.random.random() < self.garble:
+                line = self.corrupt(line)
+            self.output += line
+            self.next_record += self.interval
+
+    def corrupt(self, line):
+        damage = self.random.randint(0, 2)
+        if damage == 0:
+            return line[:self.random.randint(1, len(line) - 3)]
+        if damage == 1:
+            i = self.random.randint(0, len(line) - 3)
+            return line[:i] + chr(self.random.randint(33, 126)) + line[i+1:]
+        return line[:-len(LINE_TERMINATION)]
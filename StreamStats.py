@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+StreamStats.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Running mean, standard deviation (Welford), minimum, maximum and number
+of valid samples of every channel of a stream, in constant memory. NaN
+or None values are left out instead of spoiling the whole average.
+
+StreamStats.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+StreamStats.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import math
+
+NAN = float('nan')
+
+class ChannelStats(object):
+    def __init__(self, channels):
+        self.channels = channels
+        self.reset()
+
+    def reset(self):
+        n = self.channels
+        self.samples = 0
+        self.first = None
+        self.last = None
+        self.count = [0] * n
+        self.mean = [0.] * n
+        self.m2 = [0.] * n
+        self.min = [float('inf')] * n
+        self.max = [float('-inf')] * n
+
+    def add(self, values, timestamp=None):
+        self.samples += 1
+        if timestamp is not None:
+            if self.first is None:
+                self.first = timestamp
+            self.last = timestamp
+        count, mean, m2 = self.count, self.mean, self.m2
+        for i, x in enumerate(values):
+            if x is None or x != x:
+                continue
+            n = count[i] = count[i] + 1
+            delta = x - mean[i]
+            mean[i] += delta / n
+            m2[i] += delta * (x - mean[i])
+            if x < self.min[i]: self.min[i] = x
+            if x > self.max[i]: self.max[i] = x
+
+    def midtime(self):
+        # middle of the first and the last sample time
+        if self.first is None:
+            return None
+        return (self.first + self.last) / 2.
+
+    def means(self):
+        return [m if n else NAN for n, m in zip(self.count, self.mean)]
+
+    def stddevs(self):
+        # sample standard deviation, 0 for a single value
+        return [math.sqrt(m2 / (n - 1)) if n > 1 else (0. if n else NAN) for n, m2 in zip(self.count, self.m2)]
+
+    def minima(self):
+        return [m if n else NAN for n, m in zip(self.count, self.min)]
+
+    def maxima(self):
+        return [m if n else NAN for n, m in zip(self.count, self.max)]
+
+    def row(self):
+        # mean, stddev, min, max of channel 1, then of channel 2, ...
+        row = []
+        for values in zip(self.means(), self.stddevs(), self.minima(), self.maxima()):
+            row.extend(values)
+        return row
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+TrendPlot.py is a part of software for reading values/keys from
+the gas handling system of the Dilution Refrigerator DRS1000
+
+Scrolling trend plots of the panel ADC channels and the gauge pressures.
+A plot draws every channel as the band between the minima and maxima of
+a MinMaxPyramid level, one bucket per pixel or less, so the cost of a
+repaint depends on the width of the plot and not on the number of
+samples.
+
+Mouse wheel zooms the time axis around the pointer, dragging pans it,
+a double click returns to following the latest samples.
+
+TrendPlot.py is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+TrendPlot.py is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with PfeifferVacuum.py. If not, see <http://www.gnu.org/licenses/>.
+
+- This module depends on NumPy
+"""
+
+import time
+import numpy
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+
+### Colours of the channels, in order
+TREND_COLORS = ['#e41a1c', '#377eb8', '#4daf4a', '#984ea3', '#ff7f00', '#a0a000', '#a65628', '#f781bf']
+
+### Shortest and longest time span shown, seconds
+MIN_SPAN = 10.
+MAX_SPAN = 365 * 86400.
+
+class TrendPlot(QWidget):
+    def __init__(self, pyramid, labels, logarithmic=False, span=600., parent=None):
+        super(TrendPlot, self).__init__(parent)
+        self.pyramid = pyramid
+        self.labels = labels
+        self.logarithmic = logarithmic
+        self.span = span
+        self.stop = None     # right edge of the view, None while following
+        self.dragFrom = None
+        self.setMinimumSize(300, 150)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.pens = [QPen(QColor(color)) for color in TREND_COLORS]
+        self.brushes = [QBrush(QColor(color).lighter(150)) for color in TREND_COLORS]
+
+    def view(self):
+        stop = self.stop
+        if stop is None:
+            stop = self.pyramid.newest() or time.time()
+        return stop - self.span, stop
+
+    def transform(self, values):
+        if self.logarithmic:
+            with numpy.errstate(invalid='ignore', divide='ignore'):
+                return numpy.log10(numpy.where(values > 0, values, numpy.nan))
+        return values
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        metrics = painter.fontMetrics()
+        left, bottom = metrics.width('-0.0E-00') + 6, metrics.height() + 4
+        area = QRectF(left, 4, self.width() - left - 4, self.height() - bottom - 4)
+        start, stop = self.view()
+        centres, low, high = self.pyramid.select(start, stop, max(1, int(area.width())))
+        low, high = self.transform(low), self.transform(high)
+        highs, lows = high[numpy.isfinite(high)], low[numpy.isfinite(low)]
+        if highs.size and lows.size:
+            top, base = highs.max(), lows.min()
+        else:
+            top, base = 1., 0.
+        if top == base:
+            top, base = top + 0.5, base - 0.5
+        x = area.left() + (centres - start) / (stop - start) * area.width()
+        scale = area.height() / (top - base)
+        painter.setPen(QColor(Qt.gray))
+        painter.drawRect(area)
+        for i in range(3):
+            value = base + (top - base) * i / 2.
+            y = area.bottom() - (value - base) * scale
+            text = ('%.1E' % 10 ** value) if self.logarithmic else ('%.4g' % value)
+            painter.drawText(QRectF(0, y - metrics.height() / 2., left - 4, metrics.height()), Qt.AlignRight | Qt.AlignVCenter, text)
+        painter.drawText(QRectF(area.left(), area.bottom() + 2, area.width(), metrics.height()), Qt.AlignLeft,
+                         time.strftime('%d-%m %H:%M:%S', time.localtime(start)))
+        painter.drawText(QRectF(area.left(), area.bottom() + 2, area.width(), metrics.height()), Qt.AlignRight,
+                         time.strftime('%d-%m %H:%M:%S', time.localtime(stop)))
+        painter.setClipRect(area)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        for channel in range(low.shape[1] if low.ndim == 2 else 0):
+            self.drawBand(painter, channel, x, area.bottom() - (low[:, channel] - base) * scale,
+                          area.bottom() - (high[:, channel] - base) * scale)
+        painter.setClipping(False)
+        for channel, label in enumerate(self.labels):
+            painter.setPen(self.pens[channel % len(self.pens)])
+            painter.drawText(QPointF(area.left() + 6 + 40 * channel, area.top() + metrics.ascent() + 2), label)
+
+    def drawBand(self, painter, channel, x, yLow, yHigh):
+        # one polygon per run of buckets with values: upper edge forward, lower edge back
+        valid = numpy.isfinite(yLow) & numpy.isfinite(yHigh)
+        edges = numpy.diff(numpy.concatenate(([0], valid.view('i1'), [0])))
+        painter.setPen(self.pens[channel % len(self.pens)])
+        painter.setBrush(self.brushes[channel % len(self.brushes)])
+        for first, last in zip(numpy.nonzero(edges == 1)[0], numpy.nonzero(edges == -1)[0]):
+            if last - first == 1:
+                painter.drawLine(QPointF(x[first], yLow[first]), QPointF(x[first], yHigh[first]))
+                continue
+            polygon = QPolygonF([QPointF(x[i], yHigh[i]) for i in range(first, last)] +
+                                [QPointF(x[i], yLow[i]) for i in range(last - 1, first - 1, -1)])
+            painter.drawPolygon(polygon)
+
+    def wheelEvent(self, event):
+        start, stop = self.view()
+        anchor = start + (stop - start) * event.x() / float(max(1, self.width()))
+        factor = 0.5 if event.delta() > 0 else 2.
+        span = min(MAX_SPAN, max(MIN_SPAN, self.span * factor))
+        newStop = anchor + (stop - anchor) * span / self.span
+        self.span = span
+        if self.stop is not None or newStop < stop:
+            self.stop = newStop
+        self.update()
+
+    def mousePressEvent(self, event):
+        self.dragFrom = (event.x(), self.view()[1])
+
+    def mouseMoveEvent(self, event):
+        if self.dragFrom is None:
+            return
+        x, stop = self.dragFrom
+        self.stop = stop - (event.x() - x) * self.span / float(max(1, self.width()))
+        newest = self.pyramid.newest()
+        if newest is not None and self.stop >= newest:
+            self.stop = None
+        self.update()
+
+    def mouseReleaseEvent(self, event):
+        self.dragFrom = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.stop = None
+        self.update()
+
+class TrendWindow(QWidget):
+    """Trends of the pressures and the ADC channels, repainted every interval ms."""
+    def __init__(self, trends, interval=1000, parent=None):
+        super(TrendWindow, self).__init__(parent, Qt.Window)
+        self.setWindowTitle('GHS-DRS1000 Trends')
+        self.pressures = TrendPlot(trends['PRESSURES'], ['G%d' % (i + 1) for i in range(6)], logarithmic=True)
+        self.adc = TrendPlot(trends['ADC'], ['P%d' % (i + 1) for i in range(8)])
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.pressures)
+        layout.addWidget(self.adc)
+        self.resize(800, 600)
+        self.timer = QTimer(self)
+        self.connect(self.timer, SIGNAL("timeout()"), self.refresh)
+        self.timer.start(interval)
+
+    def refresh(self):
+        if self.isVisible():
+            self.pressures.update()
+            self.adc.update()
@@ -27,30 +27,45 @@ class Ui_LogDlg(object):
     def setupUi(self, LogDlg):
         LogDlg.setObjectName(_fromUtf8("LogDlg"))
         LogDlg.setWindowModality(QtCore.Qt.WindowModal)
-        LogDlg.resize(368, 167)
+        LogDlg.resize(368, 192)
         self.buttonBox = QtGui.QDialogButtonBox(LogDlg)
-        self.buttonBox.setGeometry(QtCore.QRect(100, 120, 181, 32))
+        self.buttonBox.setGeometry(QtCore.QRect(100, 145, 181, 32))
         self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
         self.buttonBox.setStandardButtons(QtGui.QDialogButtonBox.Cancel|QtGui.QDialogButtonBox.Ok)
         self.buttonBox.setObjectName(_fromUtf8("buttonBox"))
         self.label = QtGui.QLabel(LogDlg)
-        self.label.setGeometry(QtCore.QRect(30, 25, 101, 17))
+        self.label.setGeometry(QtCore.QRect(30, 25, 121, 17))
         self.label.setObjectName(_fromUtf8("label"))
-        self.spinBoxUpdate = QtGui.QSpinBox(LogDlg)
-        self.spinBoxUpdate.setGeometry(QtCore.QRect(170, 20, 59, 27))
-        self.spinBoxUpdate.setMinimum(1)
-        self.spinBoxUpdate.setMaximum(1800)
-        self.spinBoxUpdate.setProperty("value", 1)
-        self.spinBoxUpdate.setObjectName(_fromUtf8("spinBoxUpdate"))
-        self.label_3 = QtGui.QLabel(LogDlg)
-        self.label_3.setGeometry(QtCore.QRect(30, 74, 121, 17))
-        self.label_3.setObjectName(_fromUtf8("label_3"))
-        self.spinBoxSave = QtGui.QSpinBox(LogDlg)
-        self.spinBoxSave.setEnabled(True)
-        self.spinBoxSave.setGeometry(QtCore.QRect(170, 70, 59, 27))
-        self.spinBoxSave.setMinimum(1)
-        self.spinBoxSave.setMaximum(100)
-        self.spinBoxSave.setObjectName(_fromUtf8("spinBoxSave"))
+        self.spinBoxADC = QtGui.QDoubleSpinBox(LogDlg)
+        self.spinBoxADC.setGeometry(QtCore.QRect(170, 20, 69, 27))
+        self.spinBoxADC.setDecimals(1)
+        self.spinBoxADC.setMinimum(0.1)
+        self.spinBoxADC.setMaximum(1800.0)
+        self.spinBoxADC.setSingleStep(0.1)
+        self.spinBoxADC.setProperty("value", 1.0)
+        self.spinBoxADC.setObjectName(_fromUtf8("spinBoxADC"))
+        self.label_2 = QtGui.QLabel(LogDlg)
+        self.label_2.setGeometry(QtCore.QRect(30, 65, 121, 17))
+        self.label_2.setObjectName(_fromUtf8("label_2"))
+        self.spinBoxKeys = QtGui.QDoubleSpinBox(LogDlg)
+        self.spinBoxKeys.setGeometry(QtCore.QRect(170, 60, 69, 27))
+        self.spinBoxKeys.setDecimals(1)
+        self.spinBoxKeys.setMinimum(0.1)
+        self.spinBoxKeys.setMaximum(1800.0)
+        self.spinBoxKeys.setSingleStep(0.1)
+        self.spinBoxKeys.setProperty("value", 1.0)
+        self.spinBoxKeys.setObjectName(_fromUtf8("spinBoxKeys"))
+        self.label_4 = QtGui.QLabel(LogDlg)
+        self.label_4.setGeometry(QtCore.QRect(30, 105, 121, 17))
+        self.label_4.setObjectName(_fromUtf8("label_4"))
+        self.spinBoxPressures = QtGui.QDoubleSpinBox(LogDlg)
+        self.spinBoxPressures.setGeometry(QtCore.QRect(170, 100, 69, 27))
+        self.spinBoxPressures.setDecimals(1)
+        self.spinBoxPressures.setMinimum(0.1)
+        self.spinBoxPressures.setMaximum(1800.0)
+        self.spinBoxPressures.setSingleStep(0.1)
+        self.spinBoxPressures.setProperty("value", 1.0)
+        self.spinBoxPressures.setObjectName(_fromUtf8("spinBoxPressures"))
 
         self.retranslateUi(LogDlg)
         QtCore.QObject.connect(self.buttonBox, QtCore.SIGNAL(_fromUtf8("accepted()")), LogDlg.accept)
@@ -59,6 +74,10 @@ class Ui_LogDlg(object):
 
     def retranslateUi(self, LogDlg):
         LogDlg.setWindowTitle(_translate("LogDlg", "Dialog", None))
-        self.label.setText(_translate("LogDlg", "Update every", None))
-        self.label_3.setText(_translate("LogDlg", "Save to file every", None))
+        self.label.setText(_translate("LogDlg", "ADC every", None))
+        self.spinBoxADC.setSuffix(_translate("LogDlg", " s", None))
+        self.label_2.setText(_translate("LogDlg", "Keys every", None))
+        self.spinBoxKeys.setSuffix(_translate("LogDlg", " s", None))
+        self.label_4.setText(_translate("LogDlg", "Pressures every", None))
+        self.spinBoxPressures.setSuffix(_translate("LogDlg", " s", None))
 
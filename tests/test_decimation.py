@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Unit tests of Decimation.py, run from the top directory with
+python -m unittest discover tests
+"""
+
+import math
+import unittest
+from Decimation import MinMaxPyramid
+
+class MinMaxPyramidTest(unittest.TestCase):
+    def test_empty(self):
+        pyramid = MinMaxPyramid(1)
+        self.assertEqual(pyramid.newest(), None)
+        times, low, high = pyramid.select(0., 100., 10)
+        self.assertEqual(len(times), 0)
+
+    def test_buckets(self):
+        pyramid = MinMaxPyramid(2, base=1., factor=4, levels=3)
+        for t, values in [(10.2, (1., 5.)), (10.7, (3., float('nan'))), (11.5, (2., 4.))]:
+            pyramid.add(t, values)
+        self.assertEqual(pyramid.newest(), 12.)
+        times, low, high = pyramid.select(10., 12., 10)
+        self.assertEqual(list(times), [10.5, 11.5])
+        self.assertEqual(low.tolist(), [[1., 5.], [2., 4.]])
+        self.assertEqual(high.tolist(), [[3., 5.], [2., 4.]])
+
+    def test_nan_only_when_all_values_are(self):
+        pyramid = MinMaxPyramid(1, levels=1)
+        pyramid.add(0.1, [float('nan')])
+        times, low, high = pyramid.select(0., 1., 10)
+        self.assertTrue(math.isnan(low[0, 0]) and math.isnan(high[0, 0]))
+        pyramid.add(0.2, [7.])
+        times, low, high = pyramid.select(0., 1., 10)
+        self.assertEqual((low[0, 0], high[0, 0]), (7., 7.))
+
+    def test_coarser_levels(self):
+        pyramid = MinMaxPyramid(1, base=1., factor=4, levels=3)
+        for t in range(64):
+            pyramid.add(t + 0.5, [t])
+        self.assertEqual(pyramid.level(0., 64., 64).width, 1.)
+        self.assertEqual(pyramid.level(0., 64., 16).width, 4.)
+        times, low, high = pyramid.select(0., 63.9, 4)
+        self.assertEqual(list(times), [8., 24., 40., 56.])
+        self.assertEqual(low[:, 0].tolist(), [0., 16., 32., 48.])
+        self.assertEqual(high[:, 0].tolist(), [15., 31., 47., 63.])
+
+    def test_old_buckets_are_overwritten(self):
+        pyramid = MinMaxPyramid(1, base=1., levels=1, capacity=4)
+        for t in range(6):
+            pyramid.add(t, [t])
+        self.assertEqual(pyramid.oldest(), 2.)
+        times, low, high = pyramid.select(0., 6., 10)
+        self.assertEqual(list(times), [2.5, 3.5, 4.5, 5.5])
+        pyramid.add(0.5, [100.])
+        self.assertEqual(pyramid.select(0., 6., 10)[1][:, 0].tolist(), [2., 3., 4., 5.])
+
+if __name__ == '__main__':
+    unittest.main()
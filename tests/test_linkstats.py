@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Unit tests of LinkStats.py, run from the top directory with
+python -m unittest discover tests
+"""
+
+import unittest
+from LinkStats import LinkStats, Timing, LATENCY_BINS
+
+class TimingTest(unittest.TestCase):
+    def test_empty(self):
+        timing = Timing()
+        self.assertEqual(timing.mean(), 0.)
+        self.assertEqual(timing.percentile(.5), 0.)
+
+    def test_percentile_is_the_upper_bin_edge(self):
+        timing = Timing()
+        for seconds in [0.0015] * 90 + [0.03] * 10:
+            timing.add(seconds)
+        self.assertEqual(timing.percentile(.5), 0.002)
+        self.assertEqual(timing.percentile(.9), 0.002)
+        self.assertEqual(timing.percentile(.99), 0.03)
+
+    def test_percentile_never_above_the_maximum(self):
+        timing = Timing()
+        timing.add(0.012)
+        self.assertEqual(timing.percentile(.5), 0.012)
+        self.assertEqual(timing.percentile(1.), 0.012)
+
+    def test_open_last_bin(self):
+        timing = Timing()
+        timing.add(LATENCY_BINS[-1] * 3)
+        self.assertEqual(timing.bins[-1], 1)
+        self.assertEqual(timing.percentile(.99), LATENCY_BINS[-1] * 3)
+
+class LinkStatsTest(unittest.TestCase):
+    def test_command_counts(self):
+        stats = LinkStats()
+        stats.command('GHSPanel', 'ADC?', 0.02, 5, 40)
+        stats.command('GHSPanel', 'ADC?', 1.5, 5, 0, timeout=True)
+        timing = stats.commands[('GHSPanel', 'ADC?')]
+        self.assertEqual((timing.count, timing.timeouts, timing.errors), (2, 1, 0))
+        self.assertEqual((timing.bytesOut, timing.bytesIn), (10, 40))
+        self.assertIn('GHSPanel ADC?', stats.report())
+
+    def test_cycle_overruns(self):
+        stats = LinkStats()
+        stats.cycle('ADC', -0.001)
+        stats.cycle('ADC', 2.5, missed=2)
+        self.assertEqual(stats.cycles['ADC'].count, 2)
+        self.assertEqual(stats.overruns['ADC'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Unit tests of LogWriter.py, run from the top directory with
+python -m unittest discover tests
+"""
+
+import os
+import glob
+import shutil
+import tempfile
+import unittest
+from LogWriter import LogWriter
+
+class LogWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'log.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def backups(self):
+        return sorted(glob.glob(self.filename + '.*'))
+
+    def test_lines_are_appended(self):
+        writer = LogWriter(self.filename)
+        writer.write('one')
+        writer.write('two')
+        self.assertTrue(writer.close())
+        writer = LogWriter(self.filename)
+        writer.write('three')
+        self.assertTrue(writer.close())
+        with open(self.filename) as f:
+            self.assertEqual(f.read(), 'one\ntwo\nthree\n')
+
+    def test_rotation_by_size(self):
+        writer = LogWriter(self.filename, maxBytes=10)
+        for line in ['0123456789', 'abc', 'defghijklm', 'n']:
+            writer.write(line)
+            self.assertTrue(writer.flush())
+        self.assertTrue(writer.close())
+        backups = self.backups()
+        self.assertEqual(len(backups), 2)
+        contents = [open(name).read() for name in backups + [self.filename]]
+        self.assertEqual(contents, ['0123456789\n', 'abc\ndefghijklm\n', 'n\n'])
+
+    def test_old_backups_are_removed(self):
+        writer = LogWriter(self.filename, maxBytes=1, backups=2)
+        for i in range(5):
+            writer.write(str(i))
+            self.assertTrue(writer.flush())
+        self.assertTrue(writer.close())
+        backups = self.backups()
+        self.assertEqual([open(name).read() for name in backups], ['3\n', '4\n'])
+
+    def test_rotation_by_time(self):
+        writer = LogWriter(self.filename, rotateInterval=3600)
+        writer.write('old')
+        self.assertTrue(writer.flush())
+        writer.opened -= 3600
+        writer.write('new')
+        self.assertTrue(writer.flush())
+        self.assertTrue(writer.close())
+        self.assertEqual([open(name).read() for name in self.backups()], ['old\nnew\n'])
+        self.assertEqual(open(self.filename).read(), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Unit tests of MicroTask.py, run from the top directory with
+python -m unittest discover tests
+"""
+
+import unittest
+from MicroTask import ResponseParser, GHSPanelError, GHSPanelTimeout, KeyState, changedBits, KEY_BITS, KEY_NAMES
+
+class ResponseParserTest(unittest.TestCase):
+    def test_values(self):
+        parser = ResponseParser(3)
+        self.assertEqual(parser.parse('0\t12,0,4095\n'), (0, [12, 0, 4095]))
+
+    def test_one_digit_fields(self):
+        parser = ResponseParser(4)
+        self.assertEqual(parser.parse('0\t1,2,0,2\n'), (0, [1, 2, 0, 2]))
+
+    def test_values_are_copied(self):
+        parser = ResponseParser(2)
+        first = parser.parse('0\t1,2\n')[1]
+        parser.parse('0\t3,4\n')
+        self.assertEqual(first, [1, 2])
+
+    def test_error_code_comes_first(self):
+        parser = ResponseParser(3)
+        self.assertEqual(parser.parse('2\n'), (2, []))
+        self.assertEqual(parser.parse('1\t1,2\n'), (1, []))
+
+    def test_incomplete_reply(self):
+        self.assertRaises(GHSPanelTimeout, ResponseParser(3).parse, '0\t1,2')
+
+    def test_bad_replies(self):
+        parser = ResponseParser(3)
+        for reply in ['x\t1,2,3\n', '0\t1,2\n', '0\t1,2,3,4\n', '0\t1,b,3\n']:
+            self.assertRaises(GHSPanelError, parser.parse, reply)
+
+class KeyStateTest(unittest.TestCase):
+    def test_packing(self):
+        keymap = [0] * 64
+        keymap[KEY_BITS['A0']] = 2
+        keymap[KEY_BITS['S1']] = 1
+        keymap[63] = 2
+        state = KeyState.fromKeys(keymap)
+        self.assertEqual(state.word, 1 << 21 | 1 << 63)
+        self.assertEqual(state.mask, 1 << 21 | 1 << 38 | 1 << 63)
+        self.assertEqual(state.keys(), keymap)
+
+    def test_lookup(self):
+        keymap = [1] * 64
+        keymap[KEY_BITS['4']] = 2
+        keymap[KEY_BITS['5']] = 0
+        state = KeyState.fromKeys(keymap)
+        self.assertEqual(state['4'], True)
+        self.assertEqual(state[KEY_BITS['4']], True)
+        self.assertEqual(state['A0'], False)
+        self.assertEqual(state['5'], None)
+
+    def test_changed(self):
+        before = [1] * 64
+        after = list(before)
+        after[3] = 2    # opened
+        after[10] = 0   # no longer valid
+        old, new = KeyState.fromKeys(before), KeyState.fromKeys(after)
+        self.assertTrue(old != new)
+        self.assertEqual(changedBits(new.changed(old)), [3, 10])
+        self.assertEqual(new.changed(KeyState.fromKeys(after)), 0)
+
+    def test_changed_bits(self):
+        self.assertEqual(changedBits(0), [])
+        self.assertEqual(changedBits(1 << 63 | 1 << 5 | 1), [0, 5, 63])
+
+    def test_key_names(self):
+        self.assertEqual(KEY_NAMES[KEY_BITS['He3']], 'He3')
+        self.assertEqual(len(KEY_NAMES), len(KEY_BITS))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Unit tests of PfeifferVacuum.py, run from the top directory with
+python -m unittest discover tests
+"""
+
+import math
+import unittest
+from PfeifferVacuum import ContinuousParser
+
+LINE = '0,1.0000E-03,0,2.0000E-03,0,3.0000E-03,5,0.0000E+00,0,5.0000E-06,2,1.0000E+03\r\n'
+
+class ContinuousParserTest(unittest.TestCase):
+    def test_one_line(self):
+        parser = ContinuousParser()
+        records = parser.feed(LINE, 100.)
+        self.assertEqual(len(records), 1)
+        batch = records[0]
+        self.assertEqual(batch.timestamp, 100.)
+        self.assertEqual(batch.statuses, [0, 0, 0, 5, 0, 2])
+        self.assertEqual(batch.pressures[4], 5e-6)
+        valid = batch.valid()
+        self.assertTrue(math.isnan(valid[3]))
+        self.assertEqual(valid[5], 1e3)
+        self.assertEqual(parser.dropped, 0)
+
+    def test_pieces(self):
+        parser = ContinuousParser()
+        records = []
+        for i in range(0, 2 * len(LINE), 7):
+            records += parser.feed((LINE * 2)[i:i + 7])
+        self.assertEqual(len(records), 2)
+        self.assertEqual(parser.buffer, '')
+
+    def test_joined_in_the_middle(self):
+        # the tail of a line is dropped, the next whole line is parsed
+        parser = ContinuousParser()
+        records = parser.feed(LINE[30:] + LINE)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(parser.dropped, 1)
+
+    def test_garbage(self):
+        parser = ContinuousParser(max_line=64)
+        self.assertEqual(parser.feed('0,x,0,1.0E-03,0,1,0,1,0,1,0,1\n'), [])
+        self.assertEqual(parser.feed('#' * 100), [])
+        self.assertEqual(parser.dropped, 2)
+        self.assertEqual(len(parser.feed(LINE)), 1)
+
+if __name__ == '__main__':
+    unittest.main()
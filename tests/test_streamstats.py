@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Unit tests of StreamStats.py, run from the top directory with
+python -m unittest discover tests
+"""
+
+import math
+import unittest
+from StreamStats import ChannelStats
+
+NAN = float('nan')
+
+class ChannelStatsTest(unittest.TestCase):
+    def test_moments(self):
+        stats = ChannelStats(2)
+        for values in [(1., 10.), (2., 10.), (3., 10.), (6., 10.)]:
+            stats.add(values)
+        self.assertEqual(stats.means(), [3., 10.])
+        self.assertAlmostEqual(stats.stddevs()[0], math.sqrt(14. / 3))
+        self.assertEqual(stats.stddevs()[1], 0.)
+        self.assertEqual(stats.minima(), [1., 10.])
+        self.assertEqual(stats.maxima(), [6., 10.])
+        self.assertEqual(stats.row(), [3., stats.stddevs()[0], 1., 6., 10., 0., 10., 10.])
+
+    def test_missing_values_are_not_counted(self):
+        stats = ChannelStats(3)
+        stats.add([1., NAN, None])
+        stats.add([3., 5., None])
+        self.assertEqual(stats.samples, 2)
+        self.assertEqual(stats.count, [2, 1, 0])
+        self.assertEqual(stats.means()[:2], [2., 5.])
+        self.assertEqual(stats.stddevs()[1], 0.)
+        for values in (stats.means(), stats.stddevs(), stats.minima(), stats.maxima()):
+            self.assertTrue(math.isnan(values[2]))
+
+    def test_midtime_and_reset(self):
+        stats = ChannelStats(1)
+        self.assertEqual(stats.midtime(), None)
+        stats.add([1.], 100.)
+        stats.add([1.])
+        stats.add([1.], 104.)
+        self.assertEqual(stats.midtime(), 102.)
+        stats.reset()
+        self.assertEqual((stats.samples, stats.count, stats.midtime()), (0, [0], None))
+
+if __name__ == '__main__':
+    unittest.main()